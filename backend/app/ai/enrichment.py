@@ -1,22 +1,41 @@
 """AI-powered lead enrichment service."""
 
+import copy
+import hashlib
 import json
 import logging
 from typing import Any, Optional
-from datetime import timedelta
 
 import httpx
 from app.config import get_settings
+from app.utils.cache import JsonCache
+from app.utils.domains import registrable_domain
+from app.utils.singleflight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
+# Bump when the prompt or the response shape changes, so old cached answers are not reused.
+_CACHE_VERSION = 1
+# Responses from these sources are never cached: they are fallbacks, not model answers.
+_UNCACHED_SOURCES = {"mock_heuristics", "ai_enrichment_parsing_failed"}
+
 
 class AIEnrichmentService:
-    """Service for enriching lead data using AI models."""
+    """Service for enriching lead data using AI models.
+
+    Model answers are cached (Redis, else per process) for
+    ``ai_enrichment_cache_ttl_seconds`` under a key built from the
+    business's identity, so the same business is sent to the model once
+    across jobs. Concurrent requests for one business share a single
+    model call.
+    """
     
     def __init__(self):
         self.settings = get_settings()
-        self.cache_ttl = timedelta(hours=24)  # Cache AI responses for 24 hours
+        self.cache_ttl = self.settings.ai_enrichment_cache_ttl_seconds
+        self._cache = JsonCache("ai-enrichment")
+        self._flight = SingleFlight()
+        self.stats = {"hits": 0, "misses": 0, "coalesced": 0, "stored": 0}
         
     async def enrich_lead(self, lead: dict[str, Any]) -> dict[str, Any]:
         """
@@ -28,23 +47,48 @@ class AIEnrichmentService:
         Returns:
             Dictionary with enrichment data.
         """
-        # Check cache first (implement Redis caching later)
         cache_key = self._generate_cache_key(lead)
-        # TODO: Implement Redis cache lookup
-        
+        cached = await self._cache.get(cache_key)
+        if cached is not None:
+            self.stats["hits"] += 1
+            return cached
+
+        if self._flight.in_flight(cache_key):
+            self.stats["coalesced"] += 1
+        else:
+            self.stats["misses"] += 1
+        enrichment = await self._flight.do(cache_key, lambda: self._enrich_uncached(cache_key, lead))
+        # Coalesced callers share one result; each gets its own copy to modify.
+        return copy.deepcopy(enrichment)
+
+    async def _enrich_uncached(self, cache_key: str, lead: dict[str, Any]) -> dict[str, Any]:
         # Try OpenAI first, then fallback to local Ollama, then mock data
         enrichment = await self._enrich_with_openai(lead)
-        if enrichment:
-            # TODO: Cache the result
-            return enrichment
-            
-        # Fallback to local Ollama
-        enrichment = await self._enrich_with_ollama(lead)
-        if enrichment:
-            return enrichment
-            
-        # Final fallback: mock data (for development)
-        return self._generate_mock_enrichment(lead)
+        if not enrichment:
+            # Fallback to local Ollama
+            enrichment = await self._enrich_with_ollama(lead)
+        if not enrichment:
+            # Final fallback: mock data (for development)
+            return self._generate_mock_enrichment(lead)
+
+        if enrichment.get("source") not in _UNCACHED_SOURCES:
+            try:
+                await self._cache.set(cache_key, enrichment, self.cache_ttl)
+                self.stats["stored"] += 1
+            except Exception as e:
+                logger.warning(f"Caching AI enrichment failed: {e}")
+        return enrichment
+
+    def cache_stats(self) -> dict[str, Any]:
+        """Hit/miss counters of this process since start."""
+        lookups = self.stats["hits"] + self.stats["misses"] + self.stats["coalesced"]
+        served = self.stats["hits"] + self.stats["coalesced"]
+        return {
+            **self.stats,
+            "lookups": lookups,
+            "hit_rate": round(served / lookups, 4) if lookups else 0.0,
+            "ttl_seconds": self.cache_ttl,
+        }
     
     async def _enrich_with_openai(self, lead: dict[str, Any]) -> Optional[dict[str, Any]]:
         """Enrich using OpenAI GPT models."""
@@ -211,10 +255,25 @@ class AIEnrichmentService:
         }
     
     def _generate_cache_key(self, lead: dict[str, Any]) -> str:
-        """Generate a cache key for the lead."""
-        business_name = lead.get("business_name", "").lower().replace(" ", "_")
-        location = f"{lead.get('city', '')}_{lead.get('state', '')}".lower().replace(" ", "_")
-        return f"enrichment:{business_name}:{location}"
+        """Generate a cache key for the lead.
+
+        The key covers the business's identity (name, domain, location,
+        category) and leaves out volatile inputs such as rating and review
+        count, so repeated scrapes of the same business hit the cache.
+        """
+
+        def norm(value: Any) -> str:
+            return " ".join(str(value or "").lower().split())
+
+        identity = [
+            norm(lead.get("business_name")),
+            registrable_domain(lead.get("website")) or "",
+            norm(lead.get("city")),
+            norm(lead.get("state")),
+            norm(lead.get("category") or lead.get("industry")),
+        ]
+        digest = hashlib.sha256(json.dumps(identity).encode()).hexdigest()[:32]
+        return f"v{_CACHE_VERSION}:{digest}"
 
 
 # Singleton instance
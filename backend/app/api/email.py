@@ -1,14 +1,24 @@
 """Email finder and verification API."""
 
+import os
+from datetime import datetime
 from uuid import UUID
 
-from fastapi import APIRouter, BackgroundTasks, HTTPException
+import aiofiles
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request
+from fastapi.responses import FileResponse
 from pydantic import BaseModel, Field
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import AsyncSessionFactory
+from app.config import get_settings
+from app.database import AsyncSessionFactory, get_db
 from app.email_finder.finder_engine import EmailFinderEngine
 from app.email_finder.verifier import EmailVerifier
-from app.models import Lead
+from app.intelligence.entity_resolver import business_domain
+from app.models import EmailEnrichmentJob, EmailVerificationJob, GenerationJob, JobStatus, Lead
+from app.services.company_registry import get_lead_company, is_fresh, merge_contacts
+from app.services.email_enrichment import find_contacts, run_email_enrichment_job
+from app.services.email_verification import run_verification_job
 
 router = APIRouter(prefix="/email", tags=["email"])
 
@@ -36,6 +46,52 @@ class BulkVerifyResponse(BaseModel):
     total: int
 
 
+class LeadVerificationRequest(BaseModel):
+    job_id: UUID | None = None
+    lead_ids: list[UUID] | None = Field(default=None, max_length=100000)
+    only_unverified: bool = True
+
+
+class VerificationJobResponse(BaseModel):
+    id: UUID
+    source: str
+    status: JobStatus
+    progress_percent: int = 0
+    status_message: str | None = None
+    total_emails: int = 0
+    total_domains: int = 0
+    processed_emails: int = 0
+    status_counts: dict[str, int] | None = None
+    leads_updated: int = 0
+    error_message: str | None = None
+    created_at: datetime
+    started_at: datetime | None = None
+    completed_at: datetime | None = None
+
+    model_config = {"from_attributes": True}
+
+
+class EmailEnrichmentJobResponse(BaseModel):
+    id: UUID
+    job_id: UUID
+    only_missing: bool
+    status: JobStatus
+    progress_percent: int = 0
+    status_message: str | None = None
+    total_leads: int = 0
+    total_domains: int = 0
+    processed_domains: int = 0
+    emails_found: int = 0
+    emails_verified: int = 0
+    domains_reused: int = 0
+    error_message: str | None = None
+    created_at: datetime
+    started_at: datetime | None = None
+    completed_at: datetime | None = None
+
+    model_config = {"from_attributes": True}
+
+
 class FindEmailsRequest(BaseModel):
     domain: str = Field(min_length=2)
     first_name: str | None = None
@@ -74,23 +130,84 @@ async def verify_email(req: VerifyRequest) -> VerifyResponse:
 @router.post("/verify/bulk", response_model=BulkVerifyResponse)
 async def bulk_verify(req: BulkVerifyRequest) -> BulkVerifyResponse:
     verifier = EmailVerifier()
-    results = []
-    for email in req.emails:
-        r = await verifier.verify(email)
-        results.append(
-            VerifyResponse(
-                email=email,
-                status=r.status,
-                reason=r.reason,
-                confidence=r.confidence,
-                is_disposable=r.is_disposable,
-                is_free_provider=r.is_free_provider,
-                mx_valid=r.mx_valid,
-            )
+    verdicts = await verifier.verify_many(req.emails)
+    results = [
+        VerifyResponse(
+            email=email,
+            status=r.status,
+            reason=r.reason,
+            confidence=r.confidence,
+            is_disposable=r.is_disposable,
+            is_free_provider=r.is_free_provider,
+            mx_valid=r.mx_valid,
         )
+        for email, r in zip(req.emails, verdicts)
+    ]
     return BulkVerifyResponse(results=results, total=len(results))
 
 
+@router.post("/verify/jobs/upload", response_model=VerificationJobResponse)
+async def create_upload_verification_job(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    session: AsyncSession = Depends(get_db),
+) -> EmailVerificationJob:
+    """Verify an address list sent as the raw request body (CSV with an email column, or one per line)."""
+    job = EmailVerificationJob(source="upload", status_message="Uploading")
+    session.add(job)
+    await session.commit()
+    await session.refresh(job)
+
+    upload_dir = get_settings().upload_dir
+    os.makedirs(upload_dir, exist_ok=True)
+    path = os.path.join(upload_dir, f"{job.id}-emails.csv")
+    async with aiofiles.open(path, "wb") as out:
+        async for chunk in request.stream():
+            await out.write(chunk)
+
+    job.status_message = "Verification queued"
+    await session.commit()
+    background_tasks.add_task(run_verification_job, job.id, path)
+    return job
+
+
+@router.post("/verify/jobs/leads", response_model=VerificationJobResponse)
+async def create_lead_verification_job(
+    req: LeadVerificationRequest,
+    background_tasks: BackgroundTasks,
+    session: AsyncSession = Depends(get_db),
+) -> EmailVerificationJob:
+    """Verify stored leads' contact emails (all leads, one generation job, or given lead ids)."""
+    job = EmailVerificationJob(
+        source="leads",
+        criteria=req.model_dump(mode="json", exclude_none=True),
+        status_message="Verification queued",
+    )
+    session.add(job)
+    await session.commit()
+    await session.refresh(job)
+    background_tasks.add_task(run_verification_job, job.id)
+    return job
+
+
+@router.get("/verify/jobs/{job_id}", response_model=VerificationJobResponse)
+async def get_verification_job(job_id: UUID, session: AsyncSession = Depends(get_db)) -> EmailVerificationJob:
+    job = await session.get(EmailVerificationJob, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Verification job not found")
+    return job
+
+
+@router.get("/verify/jobs/{job_id}/download")
+async def download_verification_results(job_id: UUID, session: AsyncSession = Depends(get_db)) -> FileResponse:
+    job = await session.get(EmailVerificationJob, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Verification job not found")
+    if job.status != JobStatus.completed or not job.result_path or not os.path.exists(job.result_path):
+        raise HTTPException(status_code=409, detail="Results are not ready")
+    return FileResponse(job.result_path, media_type="text/csv", filename=f"verified-{job_id}.csv")
+
+
 @router.post("/find", response_model=FindEmailsResponse)
 async def find_emails(req: FindEmailsRequest) -> FindEmailsResponse:
     engine = EmailFinderEngine()
@@ -116,61 +233,75 @@ async def find_emails(req: FindEmailsRequest) -> FindEmailsResponse:
 
 
 async def _enrich_lead_emails(lead_id: UUID) -> None:
-    """Background task: find/verify email and company enrichment for a lead."""
-    from app.enrichment.company_enricher import CompanyEnricher
+    """Background task: find/verify email and company enrichment for a lead.
 
-    engine = EmailFinderEngine()
-    verifier = EmailVerifier()
-    company_enricher = CompanyEnricher()
+    Company data and contacts are stored on the lead's canonical company and
+    reused for every other lead of that company while fresh.
+    """
+    from app.enrichment.company_enricher import CompanyEnricher
 
     async with AsyncSessionFactory() as session:
         lead = await session.get(Lead, lead_id)
         if not lead:
             return
-        domain = lead.company_domain or (
-            lead.company_website.split("//")[-1].split("/")[0].replace("www.", "")
-            if lead.company_website else None
-        )
+        # Directory and social hosts are shared by many businesses; their leads get no lookup.
+        domain = business_domain({"company_domain": lead.company_domain, "company_website": lead.company_website})
         if not domain:
             return
-
-        company_data = {
-            "company_name": lead.company_name,
-            "company_domain": domain,
-            "company_website": lead.company_website,
-        }
-        enriched_company = await company_enricher.enrich(company_data)
-        if enriched_company.get("raw_data"):
+        company = await get_lead_company(session, lead)
+
+        firmographics = None
+        if company is not None and is_fresh(company.enriched_at):
+            firmographics = (company.enrichment or {}).get("firmographics")
+        if firmographics is None:
+            company_data = {
+                "company_name": lead.company_name,
+                "company_domain": domain,
+                "company_website": lead.company_website,
+            }
+            enriched_company = await CompanyEnricher().enrich(company_data)
+            firmographics = enriched_company.get("raw_data") or {}
+            if company is not None:
+                company.enrichment = {**(company.enrichment or {}), "firmographics": firmographics}
+                company.technologies = enriched_company.get("technologies") or company.technologies
+                company.industry = enriched_company.get("industry") or company.industry
+                company.employee_count = enriched_company.get("employee_count") or company.employee_count
+                company.description = enriched_company.get("description") or company.description
+                company.enriched_at = datetime.utcnow()
+        if firmographics:
             lead.raw_data = dict(lead.raw_data or {})
-            lead.raw_data.update(enriched_company.get("raw_data", {}))
+            lead.raw_data.update(firmographics)
         lead.is_enriched = True
 
         first = lead.contact_first_name or ""
         last = lead.contact_last_name or ""
-        candidates = await engine.find_emails(
-            domain=domain,
-            first_name=first or None,
-            last_name=last or None,
-            limit=3,
-        )
-        for c in candidates:
-            verdict = await verifier.verify(c.email)
-            if verdict.status == "valid":
-                lead.contact_email = c.email
-                lead.email_found = True
-                lead.email_verified = True
-                lead.contact_first_name = c.first_name or lead.contact_first_name
-                lead.contact_last_name = c.last_name or lead.contact_last_name
-                lead.contact_title = c.position or lead.contact_title
-                await session.commit()
-                return
-        if candidates:
-            lead.contact_email = candidates[0].email
+        contacts: list[dict] | None = None
+        if company is not None and not (first or last) and is_fresh(company.contacts_found_at):
+            contacts = company.contacts or []
+        if contacts is None:
+            contacts = await find_contacts(
+                EmailFinderEngine(),
+                EmailVerifier(),
+                domain,
+                first or None,
+                last or None,
+                company.industry if company else None,
+            )
+            if company is not None:
+                company.contacts = merge_contacts(company.contacts or [], contacts)
+                company.contacts_found_at = datetime.utcnow()
+                contacts = [c for c in company.contacts if c["email"] in {f["email"] for f in contacts}]
+
+        if contacts:
+            best = contacts[0]
+            lead.contact_email = best["email"]
             lead.email_found = True
-            lead.email_verified = False
-            await session.commit()
-        else:
-            await session.commit()
+            lead.email_verified = bool(best.get("verified"))
+            if best.get("verified"):
+                lead.contact_first_name = best.get("first_name") or lead.contact_first_name
+                lead.contact_last_name = best.get("last_name") or lead.contact_last_name
+                lead.contact_title = best.get("position") or lead.contact_title
+        await session.commit()
 
 
 @router.post("/enrich-lead/{lead_id}")
@@ -197,3 +328,29 @@ async def enrich_lead_emails_sync(lead_id: UUID) -> dict:
             "email_verified": lead.email_verified,
             "contact_email": lead.contact_email,
         }
+
+
+@router.post("/enrich-job/{job_id}", response_model=EmailEnrichmentJobResponse)
+async def enrich_job_emails(
+    job_id: UUID,
+    background_tasks: BackgroundTasks,
+    only_missing: bool = True,
+    session: AsyncSession = Depends(get_db),
+) -> EmailEnrichmentJob:
+    """Find and verify emails for all of a job's leads, grouped by domain (runs in background)."""
+    if not await session.get(GenerationJob, job_id):
+        raise HTTPException(status_code=404, detail="Job not found")
+    run = EmailEnrichmentJob(job_id=job_id, only_missing=only_missing, status_message="Email enrichment queued")
+    session.add(run)
+    await session.commit()
+    await session.refresh(run)
+    background_tasks.add_task(run_email_enrichment_job, run.id)
+    return run
+
+
+@router.get("/enrich-job/runs/{run_id}", response_model=EmailEnrichmentJobResponse)
+async def get_email_enrichment_job(run_id: UUID, session: AsyncSession = Depends(get_db)) -> EmailEnrichmentJob:
+    run = await session.get(EmailEnrichmentJob, run_id)
+    if not run:
+        raise HTTPException(status_code=404, detail="Email enrichment run not found")
+    return run
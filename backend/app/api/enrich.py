@@ -7,6 +7,7 @@ from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.ai.enrichment import enrichment_service
 from app.database import get_db
 from app.models import GenerationJob, Lead
 from app.services.claude_enrichment import (
@@ -15,6 +16,12 @@ from app.services.claude_enrichment import (
     enrich_lead,
     estimate_enrichment_cost,
 )
+from app.services.company_registry import (
+    cached_company_analysis,
+    get_lead_companies,
+    get_lead_company,
+    store_company_analysis,
+)
 from app.services.scoring_enhanced import score_enriched_lead
 
 logger = logging.getLogger(__name__)
@@ -30,6 +37,7 @@ router = APIRouter(tags=["enrichment"])
 async def enrich_single_lead(
     lead_id: UUID,
     industry_hint: str | None = Query(default=None, description="Industry key, e.g. bfsi, it_services"),
+    refresh: bool = Query(default=False, description="Ignore stored and cached analyses and call the model"),
     session: AsyncSession = Depends(get_db),
 ) -> dict:
     """Enrich a single lead with Gemini AI analysis and persist results."""
@@ -48,8 +56,12 @@ async def enrich_single_lead(
         "review_count": lead.review_count,
     }
 
-    logger.info("Enriching lead %s (%s)", lead_id, lead.company_name)
-    enrichment = await enrich_lead(lead_dict, industry_hint=industry_hint)
+    company = await get_lead_company(session, lead)
+    enrichment = None if refresh else cached_company_analysis(company, industry_hint)
+    if enrichment is None:
+        logger.info("Enriching lead %s (%s)", lead_id, lead.company_name)
+        enrichment = await enrich_lead(lead_dict, industry_hint=industry_hint, use_cache=not refresh)
+        store_company_analysis(company, industry_hint, enrichment)
 
     lead.ai_enrichment = enrichment
     lead.is_enriched = True
@@ -97,22 +109,40 @@ async def _batch_enrich_job(job_id: UUID, industry_hint: str | None) -> None:
             logger.info("Batch enrich: no leads found for job %s", job_id)
             return
 
-        logger.info("Batch enriching %d leads for job %s", len(leads), job_id)
+        companies = await get_lead_companies(session, leads)
+        enrichments: list[dict | None] = [cached_company_analysis(c, industry_hint) for c in companies]
+
+        # One model call per company (or per lead without a company) still missing an analysis.
+        to_enrich: dict[object, int] = {}
+        for i, (lead, company, enrichment) in enumerate(zip(leads, companies, enrichments)):
+            if enrichment is None:
+                to_enrich.setdefault(company.id if company is not None else lead.id, i)
+
+        logger.info(
+            "Batch enriching %d leads for job %s (%d model calls, %d reused)",
+            len(leads), job_id, len(to_enrich), len(leads) - len(to_enrich),
+        )
         lead_dicts = [
             {
-                "company_name": l.company_name,
-                "company_website": l.company_website,
-                "city": l.city,
-                "state": l.state,
-                "country": l.country,
-                "company_phone": l.company_phone,
-                "rating": l.rating,
-                "review_count": l.review_count,
+                "company_name": leads[i].company_name,
+                "company_website": leads[i].company_website,
+                "city": leads[i].city,
+                "state": leads[i].state,
+                "country": leads[i].country,
+                "company_phone": leads[i].company_phone,
+                "rating": leads[i].rating,
+                "review_count": leads[i].review_count,
             }
-            for l in leads
+            for i in to_enrich.values()
         ]
 
-        enrichments = await batch_enrich_leads(lead_dicts, industry_hint=industry_hint)
+        fresh = await batch_enrich_leads(lead_dicts, industry_hint=industry_hint)
+        by_key = dict(zip(to_enrich, fresh))
+        for key, i in to_enrich.items():
+            store_company_analysis(companies[i], industry_hint, by_key[key])
+        for i, (lead, company) in enumerate(zip(leads, companies)):
+            if enrichments[i] is None:
+                enrichments[i] = by_key[company.id if company is not None else lead.id]
 
         for lead, enrichment in zip(leads, enrichments):
             lead.ai_enrichment = enrichment
@@ -185,3 +215,13 @@ async def list_industries() -> dict:
         }
         for key, ctx in INDIA_INDUSTRY_CONTEXT.items()
     }
+
+
+# ---------------------------------------------------------------------------
+# GET /enrichment/cache-stats
+# ---------------------------------------------------------------------------
+
+@router.get("/enrichment/cache-stats")
+async def enrichment_cache_stats() -> dict:
+    """Hit/miss counters of the AI enrichment cache in this process."""
+    return enrichment_service.cache_stats()
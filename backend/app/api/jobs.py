@@ -1,13 +1,17 @@
+import os
 from uuid import UUID
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
+import aiofiles
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import get_settings
 from app.database import get_db
-from app.models import GenerationJob, Lead
+from app.models import GenerationJob, JobStatus, Lead
 from app.schemas import JobCreateRequest, JobResponse, LeadListResponse, LeadResponse
 from app.services.generator import run_generation_job
+from app.services.lead_import import FORMATS, IMPORT_SOURCE, detect_format, run_import_job
 
 router = APIRouter(prefix="/jobs", tags=["jobs"])
 
@@ -33,6 +37,50 @@ async def create_job(
     return job
 
 
+@router.post("/import", response_model=JobResponse)
+async def import_leads(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    filename: str | None = Query(default=None, max_length=200),
+    format: str | None = Query(default=None, pattern="^(csv|ndjson)$"),
+    industry: str | None = Query(default=None, max_length=100),
+    location: str = Query(default="", max_length=255),
+    session: AsyncSession = Depends(get_db),
+) -> GenerationJob:
+    """Import a CSV or NDJSON lead list sent as the raw request body.
+
+    The body is streamed to disk and processed in the background; poll the
+    returned job for progress.
+    """
+    fmt = format or detect_format(filename, request.headers.get("content-type"))
+    if fmt not in FORMATS:
+        raise HTTPException(status_code=415, detail="Send text/csv or application/x-ndjson, or pass format")
+
+    job = GenerationJob(
+        query=f"Import {filename or fmt.upper()}"[:255],
+        location=location,
+        industry=industry,
+        max_results=0,
+        sources_enabled=[IMPORT_SOURCE],
+        status_message="Uploading",
+    )
+    session.add(job)
+    await session.commit()
+    await session.refresh(job)
+
+    upload_dir = get_settings().upload_dir
+    os.makedirs(upload_dir, exist_ok=True)
+    path = os.path.join(upload_dir, f"{job.id}.{fmt}")
+    async with aiofiles.open(path, "wb") as out:
+        async for chunk in request.stream():
+            await out.write(chunk)
+
+    job.status_message = "Import queued"
+    await session.commit()
+    background_tasks.add_task(run_import_job, job.id, path, fmt)
+    return job
+
+
 @router.get("", response_model=list[JobResponse])
 async def list_jobs(
     limit: int = Query(default=25, ge=1, le=100),
@@ -51,6 +99,30 @@ async def get_job(job_id: UUID, session: AsyncSession = Depends(get_db)) -> Gene
     return job
 
 
+@router.post("/{job_id}/refresh", response_model=JobResponse)
+async def refresh_job(
+    job_id: UUID,
+    background_tasks: BackgroundTasks,
+    session: AsyncSession = Depends(get_db),
+) -> GenerationJob:
+    """Re-run the job's search and only process new or changed listings."""
+    job = await session.get(GenerationJob, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if job.status not in (JobStatus.completed, JobStatus.failed):
+        raise HTTPException(status_code=409, detail="Job is still running")
+    if IMPORT_SOURCE in (job.sources_enabled or []):
+        raise HTTPException(status_code=409, detail="Imported jobs have no search to refresh")
+
+    job.status = JobStatus.pending
+    job.status_message = "Refresh queued"
+    await session.commit()
+    await session.refresh(job)
+
+    background_tasks.add_task(run_generation_job, job.id, refresh=True)
+    return job
+
+
 @router.get("/{job_id}/leads", response_model=LeadListResponse)
 async def get_job_leads(
     job_id: UUID,
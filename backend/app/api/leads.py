@@ -3,13 +3,15 @@ import io
 from typing import Iterable
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
 from fastapi.responses import StreamingResponse
 from sqlalchemy import and_, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
-from app.models import Lead
+from app.intelligence.near_duplicates import NearDuplicateDetector
+from app.models import Lead, LeadDuplicate
+from app.normalizer.locality import get_gazetteer
 from app.schemas import LeadListResponse, LeadResponse
 
 router = APIRouter(prefix="/leads", tags=["leads"])
@@ -83,7 +85,12 @@ async def list_leads(
         )
 
     if city:
-        filters.append(Lead.city.ilike(city))
+        # Match every known spelling (Bangalore/Bengaluru) for leads stored before canonicalization.
+        names = get_gazetteer().city_names(city)
+        if names:
+            filters.append(func.lower(Lead.city).in_([n.lower() for n in names]))
+        else:
+            filters.append(Lead.city.ilike(city))
 
     if min_score is not None:
         filters.append(Lead.lead_score >= min_score)
@@ -133,6 +140,58 @@ async def export_leads_csv(
     )
 
 
+@router.get("/duplicates")
+async def list_duplicate_clusters(
+    limit: int = Query(default=50, ge=1, le=200),
+    offset: int = Query(default=0, ge=0),
+    session: AsyncSession = Depends(get_db),
+) -> dict:
+    """Near-duplicate clusters found by the MinHash/LSH sweep, largest first."""
+    size = func.count().label("size")
+    clusters = (
+        select(LeadDuplicate.cluster_id, size)
+        .group_by(LeadDuplicate.cluster_id)
+        .order_by(size.desc(), LeadDuplicate.cluster_id)
+        .offset(offset)
+        .limit(limit)
+        .subquery()
+    )
+    total = await session.scalar(select(func.count(func.distinct(LeadDuplicate.cluster_id))))
+    result = await session.execute(
+        select(LeadDuplicate, Lead.company_name, Lead.city, Lead.job_id)
+        .join(clusters, clusters.c.cluster_id == LeadDuplicate.cluster_id)
+        .join(Lead, Lead.id == LeadDuplicate.lead_id)
+        .order_by(clusters.c.size.desc(), LeadDuplicate.cluster_id, LeadDuplicate.similarity.desc())
+    )
+
+    items: dict[UUID, dict] = {}
+    for dup, company_name, city, job_id in result.all():
+        cluster = items.setdefault(
+            dup.cluster_id,
+            {"cluster_id": str(dup.cluster_id), "canonical_lead_id": str(dup.canonical_lead_id), "leads": []},
+        )
+        cluster["leads"].append(
+            {
+                "lead_id": str(dup.lead_id),
+                "job_id": str(job_id),
+                "company_name": company_name,
+                "city": city,
+                "similarity": round(dup.similarity, 3),
+            }
+        )
+    return {"total": total or 0, "items": list(items.values())}
+
+
+@router.post("/duplicates/sweep")
+async def sweep_duplicates(
+    background_tasks: BackgroundTasks,
+    full: bool = Query(default=False, description="Rebuild the whole index instead of only new/updated leads"),
+) -> dict:
+    """Queue a near-duplicate sweep over the leads table."""
+    background_tasks.add_task(NearDuplicateDetector().sweep, full)
+    return {"status": "accepted", "full": full}
+
+
 @router.get("/{lead_id}", response_model=LeadResponse)
 async def get_lead(lead_id: UUID, session: AsyncSession = Depends(get_db)) -> LeadResponse:
     lead = await session.get(Lead, lead_id)
@@ -32,6 +32,7 @@ async def generate_lead_outreach(
     lead_id: UUID,
     params: OutreachParams,
     save: bool = Query(default=True, description="Persist generated outreach to the lead record"),
+    refresh: bool = Query(default=False, description="Bypass the response cache and call the model"),
     session: AsyncSession = Depends(get_db),
 ) -> dict:
     """Generate personalised outreach copy for a lead, optionally saving to DB."""
@@ -55,6 +56,7 @@ async def generate_lead_outreach(
         sender_title=params.sender_title,
         tone=params.tone,
         language=params.language,
+        use_cache=not refresh,
     )
 
     if save:
@@ -76,6 +78,7 @@ async def generate_lead_outreach(
 async def regenerate_lead_outreach(
     lead_id: UUID,
     params: OutreachParams,
+    refresh: bool = Query(default=False, description="Bypass the response cache and call the model"),
     session: AsyncSession = Depends(get_db),
 ) -> dict:
     """Regenerate outreach with (optionally different) parameters and overwrite saved data."""
@@ -99,6 +102,7 @@ async def regenerate_lead_outreach(
         sender_title=params.sender_title,
         tone=params.tone,
         language=params.language,
+        use_cache=not refresh,
     )
 
     lead.outreach_data = outreach
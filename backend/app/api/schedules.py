@@ -0,0 +1,172 @@
+"""Recurring job schedules API."""
+
+from datetime import datetime
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException
+from pydantic import BaseModel, Field, model_validator
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.data.india_presets import PRESETS_BY_ID
+from app.database import get_db
+from app.models import JobSchedule
+from app.services.scheduler import estimate_requests, plan_offsets, rebalance_schedules
+
+router = APIRouter(prefix="/schedules", tags=["schedules"])
+
+
+class ScheduleCreate(BaseModel):
+    name: str | None = Field(default=None, max_length=255)
+    preset_id: str | None = Field(default=None, description="Fill query/location/industry from an India preset")
+    query: str | None = Field(default=None, min_length=2, max_length=255)
+    location: str | None = Field(default=None, min_length=2, max_length=255)
+    industry: str | None = None
+    max_results: int | None = Field(default=None, ge=1, le=200)
+    sources_enabled: list[str] = Field(default_factory=lambda: ["google_maps"])
+    anchor_at: datetime = Field(description="Nominal start of the first run, e.g. a Monday 09:00 UTC")
+    interval_minutes: int = Field(default=7 * 24 * 60, ge=15)
+    window_minutes: int | None = Field(default=None, ge=0, description="How far past the anchor runs may be staggered")
+    refresh_existing: bool = Field(default=True, description="Re-run the previous job incrementally instead of creating a new one")
+
+    @model_validator(mode="after")
+    def _require_search(self) -> "ScheduleCreate":
+        if not self.preset_id and not (self.query and self.location):
+            raise ValueError("Either preset_id or both query and location are required")
+        return self
+
+
+class ScheduleUpdate(BaseModel):
+    name: str | None = Field(default=None, max_length=255)
+    max_results: int | None = Field(default=None, ge=1, le=200)
+    anchor_at: datetime | None = None
+    interval_minutes: int | None = Field(default=None, ge=15)
+    window_minutes: int | None = Field(default=None, ge=0)
+    refresh_existing: bool | None = None
+    is_active: bool | None = None
+
+
+class ScheduleResponse(BaseModel):
+    id: UUID
+    name: str
+    preset_id: str | None
+    query: str
+    location: str
+    industry: str | None
+    max_results: int
+    sources_enabled: list[str] | None
+    anchor_at: datetime
+    interval_minutes: int
+    window_minutes: int
+    offset_minutes: int
+    refresh_existing: bool
+    is_active: bool
+    next_run_at: datetime | None
+    last_run_at: datetime | None
+    last_job_id: UUID | None
+
+    model_config = {"from_attributes": True}
+
+
+async def _get_schedule(session: AsyncSession, schedule_id: UUID) -> JobSchedule:
+    schedule = await session.get(JobSchedule, schedule_id)
+    if not schedule:
+        raise HTTPException(status_code=404, detail="Schedule not found")
+    return schedule
+
+
+# ---------------------------------------------------------------------------
+# CRUD
+# ---------------------------------------------------------------------------
+
+@router.post("", response_model=ScheduleResponse)
+async def create_schedule(
+    payload: ScheduleCreate,
+    session: AsyncSession = Depends(get_db),
+) -> JobSchedule:
+    """Create a recurring schedule; start offsets of all schedules are re-planned."""
+    preset: dict = {}
+    if payload.preset_id:
+        preset = PRESETS_BY_ID.get(payload.preset_id) or {}
+        if not preset:
+            raise HTTPException(status_code=404, detail=f"Preset '{payload.preset_id}' not found")
+
+    schedule = JobSchedule(
+        name=payload.name or preset.get("name") or f"{payload.query} – {payload.location}",
+        preset_id=payload.preset_id,
+        query=payload.query or preset["query"],
+        location=payload.location or preset["location"],
+        industry=payload.industry or preset.get("industry"),
+        max_results=payload.max_results or preset.get("max_results", 40),
+        sources_enabled=payload.sources_enabled or ["google_maps"],
+        anchor_at=payload.anchor_at,
+        interval_minutes=payload.interval_minutes,
+        window_minutes=payload.window_minutes if payload.window_minutes is not None else get_settings().schedule_window_minutes,
+        refresh_existing=payload.refresh_existing,
+    )
+    session.add(schedule)
+    await session.flush()
+    await rebalance_schedules(session)
+    await session.commit()
+    await session.refresh(schedule)
+    return schedule
+
+
+@router.get("", response_model=list[ScheduleResponse])
+async def list_schedules(session: AsyncSession = Depends(get_db)) -> list[JobSchedule]:
+    result = await session.execute(select(JobSchedule).order_by(JobSchedule.next_run_at.asc().nulls_last()))
+    return list(result.scalars().all())
+
+
+@router.get("/load")
+async def get_schedule_load(session: AsyncSession = Depends(get_db)) -> dict:
+    """Forecast peak provider utilisation (1.0 = at capacity) for the active schedules."""
+    result = await session.execute(select(JobSchedule).where(JobSchedule.is_active.is_(True)))
+    schedules = list(result.scalars().all())
+    _, peaks = plan_offsets(schedules)
+    return {
+        "schedules": len(schedules),
+        "peak_utilisation": peaks,
+        "requests_per_run": {str(s.id): estimate_requests(s) for s in schedules},
+    }
+
+
+@router.post("/rebalance")
+async def rebalance(session: AsyncSession = Depends(get_db)) -> dict:
+    """Re-plan start offsets for all active schedules."""
+    peaks = await rebalance_schedules(session)
+    await session.commit()
+    return {"peak_utilisation": peaks}
+
+
+@router.get("/{schedule_id}", response_model=ScheduleResponse)
+async def get_schedule(schedule_id: UUID, session: AsyncSession = Depends(get_db)) -> JobSchedule:
+    return await _get_schedule(session, schedule_id)
+
+
+@router.patch("/{schedule_id}", response_model=ScheduleResponse)
+async def update_schedule(
+    schedule_id: UUID,
+    payload: ScheduleUpdate,
+    session: AsyncSession = Depends(get_db),
+) -> JobSchedule:
+    schedule = await _get_schedule(session, schedule_id)
+    for key, value in payload.model_dump(exclude_unset=True).items():
+        setattr(schedule, key, value)
+    if not schedule.is_active:
+        schedule.next_run_at = None
+    await rebalance_schedules(session)
+    await session.commit()
+    await session.refresh(schedule)
+    return schedule
+
+
+@router.delete("/{schedule_id}")
+async def delete_schedule(schedule_id: UUID, session: AsyncSession = Depends(get_db)) -> dict:
+    schedule = await _get_schedule(session, schedule_id)
+    await session.delete(schedule)
+    await session.flush()
+    await rebalance_schedules(session)
+    await session.commit()
+    return {"deleted": str(schedule_id)}
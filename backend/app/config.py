@@ -32,17 +32,88 @@ class Settings(BaseSettings):
     anthropic_api_key: str = ""
     ollama_base_url: str = "http://localhost:11434"
     ollama_model: str = "qwen2.5:7b"
+    # Model answers from AIEnrichmentService are reused for the same business for this long
+    ai_enrichment_cache_ttl_seconds: int = 24 * 3600
 
     # Vertex AI / Gemini enrichment
     vertex_project_id: str = ""
     vertex_location: str = "us-central1"
     vertex_model: str = "gemini-2.5-pro"
     enrichment_timeout: int = 30
+    # Cached Vertex access tokens are refreshed in the background this long before they expire
+    vertex_token_refresh_margin_seconds: int = 300
+    # Vertex AI quota per process: vertex_rpm (below, shared with the scheduler) and tokens
+    # per minute. Concurrency adapts between 1 and vertex_max_concurrency (halved on 429/503,
+    # raised while requests succeed); throttled requests are retried
+    vertex_quota_tpm: int = 2_000_000
+    vertex_initial_concurrency: int = 4
+    vertex_max_concurrency: int = 32
+    vertex_max_retries: int = 6
+    # Leads per Gemini request in batch enrichment (1 = one request per lead), and the
+    # timeout of such a request (its answer is up to 1024 tokens per lead)
+    enrichment_batch_size: int = 10
+    enrichment_batch_timeout: int = 180
+    # Gemini responses are cached in the database by model, generation config and prompt
+    vertex_cache_enabled: bool = True
+    vertex_cache_max_entries: int = 50_000
     
     # Infrastructure
     cors_origins: str = "http://localhost:8080,http://127.0.0.1:8080,http://localhost:3000"
     request_timeout_seconds: int = 20
     proxy_list: str = ""
+    lead_copy_threshold: int = 2000
+    company_enrichment_ttl_days: int = 90
+    upload_dir: str = "/tmp/leadgen-uploads"
+    import_batch_size: int = 5000
+    # Fill missing lead coordinates with gazetteer city centres (approximate)
+    fill_approximate_coordinates: bool = False
+    email_provider_timeout_seconds: float = 8.0
+    # Email finder stops querying providers once a candidate reaches this confidence
+    email_early_exit_confidence: int = 90
+    # Provider domain-search results are shared across leads (empty results for the shorter TTL)
+    email_domain_cache_ttl_seconds: int = 7 * 24 * 3600
+    email_domain_negative_ttl_seconds: int = 24 * 3600
+    # MX lookups: outstanding queries per event loop, per-query timeout and cache TTLs
+    dns_concurrency: int = 50
+    dns_timeout_seconds: float = 5.0
+    dns_cache_max_ttl_seconds: int = 6 * 3600
+    dns_negative_ttl_seconds: int = 900
+    # Addresses per bulk-verification batch (whole domains; results are written back per batch)
+    email_verify_batch_size: int = 5000
+    # SMTP RCPT probing (off by default: many networks block outbound port 25).
+    # smtp_probe_host routes every probe to one server, e.g. a local stand-in.
+    smtp_probe_enabled: bool = False
+    smtp_probe_host: str = ""
+    smtp_probe_port: int = 25
+    smtp_probe_timeout_seconds: float = 10.0
+    smtp_probe_helo: str = "localhost"
+    smtp_probe_mail_from: str = ""
+    smtp_probe_max_rcpt_per_session: int = 50
+    smtp_probe_rpm_per_mx: int = 60
+    smtp_probe_concurrency: int = 10
+    smtp_catch_all_ttl_seconds: int = 7 * 24 * 3600
+    # Learned email patterns answer a lookup without provider calls once a domain has at least
+    # this many known addresses and one pattern holds this share of the (smoothed) evidence
+    email_pattern_min_evidence: int = 3
+    email_pattern_dominance: float = 0.75
+    # Email provider API budgets (requests/minute, per process) and job-level enrichment concurrency
+    hunter_rpm: int = 60
+    apollo_rpm: int = 60
+    snov_rpm: int = 60
+    email_enrichment_concurrency: int = 8
+    # Email finder strategy: "waterfall" calls providers one at a time, best learned hits per
+    # credit first, and stops at the first verified address; "parallel" queries all at once
+    email_lookup_strategy: str = "waterfall"
+    # Credits (or currency) one lookup costs at each provider
+    hunter_credit_cost: float = 1.0
+    apollo_credit_cost: float = 1.0
+    snov_credit_cost: float = 1.0
+
+    # Recurring schedules: provider budgets (requests/minute) and stagger granularity
+    google_places_rpm: int = 600
+    vertex_rpm: int = 60
+    schedule_window_minutes: int = 240
+    schedule_slot_minutes: int = 5
     
     # Integration Webhooks
     n8n_webhook_url: str = ""
@@ -0,0 +1,256 @@
+"""Offline gazetteer used to canonicalize lead localities.
+
+- ``COUNTRIES``: canonical country name -> ISO code and aliases
+- ``STATES``: country -> canonical state/province name -> codes and aliases
+- ``CITIES``: ``(name, state, country, latitude, longitude, aliases)`` with
+  approximate city-centre coordinates. Aliases cover former names, common
+  spellings and frequent misspellings. When a name is ambiguous, the entry
+  listed first wins unless the lead's state or country says otherwise.
+"""
+
+COUNTRIES: dict[str, dict] = {
+    "India": {"code": "IN", "aliases": ["IND", "Bharat", "Republic of India", "Hindustan"]},
+    "United States": {
+        "code": "US",
+        "aliases": ["USA", "U.S.", "U.S.A.", "United States of America", "America"],
+    },
+    "United Kingdom": {"code": "GB", "aliases": ["UK", "U.K.", "Great Britain", "Britain", "England", "Scotland", "Wales"]},
+    "United Arab Emirates": {"code": "AE", "aliases": ["UAE", "U.A.E.", "Emirates"]},
+    "Singapore": {"code": "SG", "aliases": ["SGP", "Republic of Singapore"]},
+    "Canada": {"code": "CA", "aliases": ["CAN"]},
+    "Australia": {"code": "AU", "aliases": ["AUS"]},
+    "Germany": {"code": "DE", "aliases": ["Deutschland", "DEU"]},
+    "France": {"code": "FR", "aliases": ["FRA"]},
+    "Netherlands": {"code": "NL", "aliases": ["Holland", "The Netherlands", "NLD"]},
+    "Saudi Arabia": {"code": "SA", "aliases": ["KSA", "Kingdom of Saudi Arabia"]},
+    "Qatar": {"code": "QA", "aliases": []},
+    "Nepal": {"code": "NP", "aliases": []},
+    "Sri Lanka": {"code": "LK", "aliases": ["Ceylon"]},
+    "Bangladesh": {"code": "BD", "aliases": []},
+    "Pakistan": {"code": "PK", "aliases": []},
+    "Japan": {"code": "JP", "aliases": []},
+    "China": {"code": "CN", "aliases": ["PRC", "People's Republic of China"]},
+    "Malaysia": {"code": "MY", "aliases": []},
+    "Ireland": {"code": "IE", "aliases": ["Republic of Ireland", "Eire"]},
+}
+
+STATES: dict[str, dict[str, list[str]]] = {
+    "India": {
+        "Andhra Pradesh": ["AP"],
+        "Arunachal Pradesh": ["AR"],
+        "Assam": ["AS"],
+        "Bihar": ["BR"],
+        "Chhattisgarh": ["CT", "CG", "Chattisgarh", "Chhatisgarh"],
+        "Goa": ["GA"],
+        "Gujarat": ["GJ", "Gujrat"],
+        "Haryana": ["HR"],
+        "Himachal Pradesh": ["HP"],
+        "Jharkhand": ["JH"],
+        "Karnataka": ["KA", "Karnatak"],
+        "Kerala": ["KL", "Keralam"],
+        "Madhya Pradesh": ["MP"],
+        "Maharashtra": ["MH", "Maharastra", "Maharashtra State"],
+        "Manipur": ["MN"],
+        "Meghalaya": ["ML"],
+        "Mizoram": ["MZ"],
+        "Nagaland": ["NL"],
+        "Odisha": ["OD", "OR", "Orissa"],
+        "Punjab": ["PB"],
+        "Rajasthan": ["RJ"],
+        "Sikkim": ["SK"],
+        "Tamil Nadu": ["TN", "Tamilnadu", "Tamil Naadu"],
+        "Telangana": ["TG", "TS", "Telengana"],
+        "Tripura": ["TR"],
+        "Uttar Pradesh": ["UP"],
+        "Uttarakhand": ["UT", "UK", "Uttaranchal"],
+        "West Bengal": ["WB", "Bengal", "Paschim Banga"],
+        "Andaman and Nicobar Islands": ["AN", "Andaman & Nicobar", "Andaman and Nicobar"],
+        "Chandigarh": ["CH"],
+        "Dadra and Nagar Haveli and Daman and Diu": ["DH", "DN", "DD", "Daman and Diu", "Dadra and Nagar Haveli"],
+        "Delhi": ["DL", "NCT of Delhi", "National Capital Territory of Delhi", "New Delhi", "Delhi NCR", "NCR"],
+        "Jammu and Kashmir": ["JK", "J&K", "Jammu & Kashmir"],
+        "Ladakh": ["LA"],
+        "Lakshadweep": ["LD"],
+        "Puducherry": ["PY", "Pondicherry"],
+    },
+    "United States": {
+        "Alabama": ["AL"], "Alaska": ["AK"], "Arizona": ["AZ"], "Arkansas": ["AR"], "California": ["CA", "Calif"],
+        "Colorado": ["CO"], "Connecticut": ["CT"], "Delaware": ["DE"], "District of Columbia": ["DC", "Washington DC"],
+        "Florida": ["FL"], "Georgia": ["GA"], "Hawaii": ["HI"], "Idaho": ["ID"], "Illinois": ["IL"],
+        "Indiana": ["IN"], "Iowa": ["IA"], "Kansas": ["KS"], "Kentucky": ["KY"], "Louisiana": ["LA"],
+        "Maine": ["ME"], "Maryland": ["MD"], "Massachusetts": ["MA"], "Michigan": ["MI"], "Minnesota": ["MN"],
+        "Mississippi": ["MS"], "Missouri": ["MO"], "Montana": ["MT"], "Nebraska": ["NE"], "Nevada": ["NV"],
+        "New Hampshire": ["NH"], "New Jersey": ["NJ"], "New Mexico": ["NM"], "New York": ["NY"],
+        "North Carolina": ["NC"], "North Dakota": ["ND"], "Ohio": ["OH"], "Oklahoma": ["OK"], "Oregon": ["OR"],
+        "Pennsylvania": ["PA"], "Rhode Island": ["RI"], "South Carolina": ["SC"], "South Dakota": ["SD"],
+        "Tennessee": ["TN"], "Texas": ["TX"], "Utah": ["UT"], "Vermont": ["VT"], "Virginia": ["VA"],
+        "Washington": ["WA"], "West Virginia": ["WV"], "Wisconsin": ["WI"], "Wyoming": ["WY"],
+    },
+    "United Arab Emirates": {
+        "Dubai": ["DU"], "Abu Dhabi": ["AZ"], "Sharjah": ["SH"], "Ajman": ["AJ"],
+    },
+    "United Kingdom": {
+        "England": ["ENG"], "Scotland": ["SCT"], "Wales": ["WLS"], "Northern Ireland": ["NIR"],
+    },
+}
+
+CITIES: list[tuple[str, str, str, float, float, tuple[str, ...]]] = [
+    # ── India: metros ─────────────────────────────────────────────────────────
+    ("Mumbai", "Maharashtra", "India", 19.076, 72.8777, ("Bombay", "Mumbai City", "Greater Mumbai", "Mumbai Suburban")),
+    ("Delhi", "Delhi", "India", 28.6139, 77.209, ("New Delhi", "Dilli", "Delhi NCR", "NCT Delhi", "Old Delhi")),
+    ("Bengaluru", "Karnataka", "India", 12.9716, 77.5946, (
+        "Bangalore", "Banglore", "Bangaluru", "Bengalooru", "Bengaluru Urban", "Bangalore Urban",
+        "Bangalore Rural", "Bengaluru Rural", "Blr",
+    )),
+    ("Hyderabad", "Telangana", "India", 17.385, 78.4867, ("Hyderabad Deccan", "Hyd", "Cyberabad")),
+    ("Secunderabad", "Telangana", "India", 17.4399, 78.4983, ("Secundrabad",)),
+    ("Chennai", "Tamil Nadu", "India", 13.0827, 80.2707, ("Madras", "Chenai")),
+    ("Kolkata", "West Bengal", "India", 22.5726, 88.3639, ("Calcutta", "Kolkatta")),
+    ("Pune", "Maharashtra", "India", 18.5204, 73.8567, ("Poona", "Pimpri", "Pimpri Chinchwad", "Pimpri-Chinchwad")),
+    ("Ahmedabad", "Gujarat", "India", 23.0225, 72.5714, ("Amdavad", "Ahmadabad")),
+    # ── India: NCR and satellite cities ───────────────────────────────────────
+    ("Gurugram", "Haryana", "India", 28.4595, 77.0266, ("Gurgaon", "Gurgoan", "Gurugram Gurgaon")),
+    ("Noida", "Uttar Pradesh", "India", 28.5355, 77.391, ("New Okhla Industrial Development Authority", "Gautam Buddha Nagar")),
+    ("Greater Noida", "Uttar Pradesh", "India", 28.4744, 77.504, ("Gr Noida", "Greater Noida West")),
+    ("Ghaziabad", "Uttar Pradesh", "India", 28.6692, 77.4538, ()),
+    ("Faridabad", "Haryana", "India", 28.4089, 77.3178, ()),
+    ("Navi Mumbai", "Maharashtra", "India", 19.033, 73.0297, ("New Bombay", "Vashi")),
+    ("Thane", "Maharashtra", "India", 19.2183, 72.9781, ("Thana",)),
+    ("Kalyan", "Maharashtra", "India", 19.2437, 73.1355, ("Kalyan Dombivli", "Kalyan-Dombivli")),
+    ("Howrah", "West Bengal", "India", 22.5958, 88.2636, ()),
+    # ── India: state capitals and large cities ────────────────────────────────
+    ("Jaipur", "Rajasthan", "India", 26.9124, 75.7873, ("Pink City",)),
+    ("Lucknow", "Uttar Pradesh", "India", 26.8467, 80.9462, ()),
+    ("Kanpur", "Uttar Pradesh", "India", 26.4499, 80.3319, ("Cawnpore",)),
+    ("Nagpur", "Maharashtra", "India", 21.1458, 79.0882, ()),
+    ("Indore", "Madhya Pradesh", "India", 22.7196, 75.8577, ()),
+    ("Bhopal", "Madhya Pradesh", "India", 23.2599, 77.4126, ()),
+    ("Patna", "Bihar", "India", 25.5941, 85.1376, ()),
+    ("Vadodara", "Gujarat", "India", 22.3072, 73.1812, ("Baroda",)),
+    ("Surat", "Gujarat", "India", 21.1702, 72.8311, ()),
+    ("Rajkot", "Gujarat", "India", 22.3039, 70.8022, ()),
+    ("Gandhinagar", "Gujarat", "India", 23.2156, 72.6369, ()),
+    ("Visakhapatnam", "Andhra Pradesh", "India", 17.6868, 83.2185, ("Vizag", "Vishakhapatnam", "Visakhapatanam", "Waltair")),
+    ("Vijayawada", "Andhra Pradesh", "India", 16.5062, 80.648, ("Bezawada",)),
+    ("Amaravati", "Andhra Pradesh", "India", 16.5131, 80.5165, ()),
+    ("Guntur", "Andhra Pradesh", "India", 16.3067, 80.4365, ()),
+    ("Tirupati", "Andhra Pradesh", "India", 13.6288, 79.4192, ()),
+    ("Coimbatore", "Tamil Nadu", "India", 11.0168, 76.9558, ("Kovai", "Coimbator")),
+    ("Madurai", "Tamil Nadu", "India", 9.9252, 78.1198, ()),
+    ("Tiruchirappalli", "Tamil Nadu", "India", 10.7905, 78.7047, ("Trichy", "Tiruchi", "Trichinopoly")),
+    ("Salem", "Tamil Nadu", "India", 11.6643, 78.146, ()),
+    ("Tiruppur", "Tamil Nadu", "India", 11.1085, 77.3411, ("Tirupur",)),
+    ("Kochi", "Kerala", "India", 9.9312, 76.2673, ("Cochin", "Ernakulam", "Kochin")),
+    ("Thiruvananthapuram", "Kerala", "India", 8.5241, 76.9366, ("Trivandrum", "Tiruvananthapuram")),
+    ("Kozhikode", "Kerala", "India", 11.2588, 75.7804, ("Calicut",)),
+    ("Thrissur", "Kerala", "India", 10.5276, 76.2144, ("Trichur",)),
+    ("Mysuru", "Karnataka", "India", 12.2958, 76.6394, ("Mysore",)),
+    ("Mangaluru", "Karnataka", "India", 12.9141, 74.856, ("Mangalore", "Kudla")),
+    ("Hubballi", "Karnataka", "India", 15.3647, 75.124, ("Hubli", "Hubli-Dharwad", "Hubballi-Dharwad")),
+    ("Belagavi", "Karnataka", "India", 15.8497, 74.4977, ("Belgaum",)),
+    ("Kalaburagi", "Karnataka", "India", 17.3297, 76.8343, ("Gulbarga",)),
+    ("Chandigarh", "Chandigarh", "India", 30.7333, 76.7794, ()),
+    ("Mohali", "Punjab", "India", 30.7046, 76.7179, ("Sahibzada Ajit Singh Nagar", "SAS Nagar")),
+    ("Panchkula", "Haryana", "India", 30.6942, 76.8606, ()),
+    ("Ludhiana", "Punjab", "India", 30.901, 75.8573, ()),
+    ("Amritsar", "Punjab", "India", 31.634, 74.8723, ()),
+    ("Jalandhar", "Punjab", "India", 31.326, 75.5762, ("Jullundur",)),
+    ("Dehradun", "Uttarakhand", "India", 30.3165, 78.0322, ("Dehra Dun",)),
+    ("Shimla", "Himachal Pradesh", "India", 31.1048, 77.1734, ("Simla",)),
+    ("Srinagar", "Jammu and Kashmir", "India", 34.0837, 74.7973, ()),
+    ("Jammu", "Jammu and Kashmir", "India", 32.7266, 74.857, ()),
+    ("Ranchi", "Jharkhand", "India", 23.3441, 85.3096, ()),
+    ("Jamshedpur", "Jharkhand", "India", 22.8046, 86.2029, ("Tatanagar",)),
+    ("Bhubaneswar", "Odisha", "India", 20.2961, 85.8245, ("Bhubaneshwar",)),
+    ("Cuttack", "Odisha", "India", 20.4625, 85.883, ()),
+    ("Raipur", "Chhattisgarh", "India", 21.2514, 81.6296, ()),
+    ("Guwahati", "Assam", "India", 26.1445, 91.7362, ("Gauhati",)),
+    ("Shillong", "Meghalaya", "India", 25.5788, 91.8933, ()),
+    ("Imphal", "Manipur", "India", 24.817, 93.9368, ()),
+    ("Agartala", "Tripura", "India", 23.8315, 91.2868, ()),
+    ("Aizawl", "Mizoram", "India", 23.7271, 92.7176, ()),
+    ("Kohima", "Nagaland", "India", 25.6751, 94.1086, ()),
+    ("Itanagar", "Arunachal Pradesh", "India", 27.0844, 93.6053, ()),
+    ("Gangtok", "Sikkim", "India", 27.3389, 88.6065, ()),
+    ("Panaji", "Goa", "India", 15.4909, 73.8278, ("Panjim", "Ponjim")),
+    ("Margao", "Goa", "India", 15.2832, 73.9862, ("Madgaon",)),
+    ("Puducherry", "Puducherry", "India", 11.9416, 79.8083, ("Pondicherry", "Pondy")),
+    ("Port Blair", "Andaman and Nicobar Islands", "India", 11.6234, 92.7265, ("Sri Vijaya Puram",)),
+    ("Varanasi", "Uttar Pradesh", "India", 25.3176, 82.9739, ("Benares", "Banaras", "Kashi")),
+    ("Prayagraj", "Uttar Pradesh", "India", 25.4358, 81.8463, ("Allahabad",)),
+    ("Agra", "Uttar Pradesh", "India", 27.1767, 78.0081, ()),
+    ("Meerut", "Uttar Pradesh", "India", 28.9845, 77.7064, ()),
+    ("Aligarh", "Uttar Pradesh", "India", 27.8974, 78.088, ()),
+    ("Bareilly", "Uttar Pradesh", "India", 28.367, 79.4304, ()),
+    ("Gorakhpur", "Uttar Pradesh", "India", 26.7606, 83.3732, ()),
+    ("Jodhpur", "Rajasthan", "India", 26.2389, 73.0243, ()),
+    ("Udaipur", "Rajasthan", "India", 24.5854, 73.7125, ()),
+    ("Kota", "Rajasthan", "India", 25.2138, 75.8648, ()),
+    ("Ajmer", "Rajasthan", "India", 26.4499, 74.6399, ()),
+    ("Gwalior", "Madhya Pradesh", "India", 26.2183, 78.1828, ()),
+    ("Jabalpur", "Madhya Pradesh", "India", 23.1815, 79.9864, ("Jubbulpore",)),
+    ("Nashik", "Maharashtra", "India", 19.9975, 73.7898, ("Nasik",)),
+    ("Aurangabad", "Maharashtra", "India", 19.8762, 75.3433, ("Chhatrapati Sambhajinagar", "Sambhajinagar")),
+    ("Aurangabad", "Bihar", "India", 24.7521, 84.3742, ()),
+    ("Kolhapur", "Maharashtra", "India", 16.705, 74.2433, ()),
+    ("Solapur", "Maharashtra", "India", 17.6599, 75.9064, ("Sholapur",)),
+    ("Amravati", "Maharashtra", "India", 20.9374, 77.7796, ()),
+    ("Warangal", "Telangana", "India", 17.9689, 79.5941, ()),
+    ("Gaya", "Bihar", "India", 24.7914, 85.0002, ()),
+    ("Dhanbad", "Jharkhand", "India", 23.7957, 86.4304, ()),
+    ("Siliguri", "West Bengal", "India", 26.7271, 88.3953, ()),
+    ("Durgapur", "West Bengal", "India", 23.5204, 87.3119, ()),
+    ("Vellore", "Tamil Nadu", "India", 12.9165, 79.1325, ()),
+    ("Hosur", "Tamil Nadu", "India", 12.7409, 77.8253, ()),
+    ("Nellore", "Andhra Pradesh", "India", 14.4426, 79.9865, ()),
+    ("Kakinada", "Andhra Pradesh", "India", 16.9891, 82.2475, ()),
+    ("Bhilai", "Chhattisgarh", "India", 21.1938, 81.3509, ()),
+    ("Sonipat", "Haryana", "India", 28.9931, 77.0151, ("Sonepat",)),
+    ("Karnal", "Haryana", "India", 29.6857, 76.9905, ()),
+    ("Manesar", "Haryana", "India", 28.3515, 76.9428, ()),
+    ("Bhiwandi", "Maharashtra", "India", 19.2813, 73.0483, ()),
+    ("Vapi", "Gujarat", "India", 20.3893, 72.9106, ()),
+    ("Anand", "Gujarat", "India", 22.5645, 72.9289, ()),
+    ("Bhavnagar", "Gujarat", "India", 21.7645, 72.1519, ()),
+    ("Jamnagar", "Gujarat", "India", 22.4707, 70.0577, ()),
+    # ── International ─────────────────────────────────────────────────────────
+    ("Dubai", "Dubai", "United Arab Emirates", 25.2048, 55.2708, ()),
+    ("Abu Dhabi", "Abu Dhabi", "United Arab Emirates", 24.4539, 54.3773, ()),
+    ("Sharjah", "Sharjah", "United Arab Emirates", 25.3463, 55.4209, ()),
+    ("Singapore", "", "Singapore", 1.3521, 103.8198, ()),
+    ("London", "England", "United Kingdom", 51.5074, -0.1278, ("Greater London", "City of London")),
+    ("Manchester", "England", "United Kingdom", 53.4808, -2.2426, ()),
+    ("Birmingham", "England", "United Kingdom", 52.4862, -1.8904, ()),
+    ("Edinburgh", "Scotland", "United Kingdom", 55.9533, -3.1883, ()),
+    ("New York", "New York", "United States", 40.7128, -74.006, ("New York City", "NYC", "Manhattan")),
+    ("San Francisco", "California", "United States", 37.7749, -122.4194, ("SF",)),
+    ("San Jose", "California", "United States", 37.3382, -121.8863, ()),
+    ("Los Angeles", "California", "United States", 34.0522, -118.2437, ("LA",)),
+    ("Seattle", "Washington", "United States", 47.6062, -122.3321, ()),
+    ("Chicago", "Illinois", "United States", 41.8781, -87.6298, ()),
+    ("Boston", "Massachusetts", "United States", 42.3601, -71.0589, ()),
+    ("Austin", "Texas", "United States", 30.2672, -97.7431, ()),
+    ("Dallas", "Texas", "United States", 32.7767, -96.797, ()),
+    ("Houston", "Texas", "United States", 29.7604, -95.3698, ()),
+    ("Atlanta", "Georgia", "United States", 33.749, -84.388, ()),
+    ("Miami", "Florida", "United States", 25.7617, -80.1918, ()),
+    ("Washington", "District of Columbia", "United States", 38.9072, -77.0369, ("Washington DC", "Washington D.C.")),
+    ("Toronto", "Ontario", "Canada", 43.6532, -79.3832, ()),
+    ("Vancouver", "British Columbia", "Canada", 49.2827, -123.1207, ()),
+    ("Sydney", "New South Wales", "Australia", -33.8688, 151.2093, ()),
+    ("Melbourne", "Victoria", "Australia", -37.8136, 144.9631, ()),
+    ("Berlin", "Berlin", "Germany", 52.52, 13.405, ()),
+    ("Munich", "Bavaria", "Germany", 48.1351, 11.582, ("Munchen", "Muenchen")),
+    ("Paris", "Ile-de-France", "France", 48.8566, 2.3522, ()),
+    ("Amsterdam", "North Holland", "Netherlands", 52.3676, 4.9041, ()),
+    ("Dublin", "Leinster", "Ireland", 53.3498, -6.2603, ()),
+    ("Riyadh", "Riyadh", "Saudi Arabia", 24.7136, 46.6753, ()),
+    ("Doha", "", "Qatar", 25.2854, 51.531, ()),
+    ("Kathmandu", "Bagmati", "Nepal", 27.7172, 85.324, ()),
+    ("Colombo", "Western", "Sri Lanka", 6.9271, 79.8612, ()),
+    ("Dhaka", "Dhaka", "Bangladesh", 23.8103, 90.4125, ("Dacca",)),
+    ("Hyderabad", "Sindh", "Pakistan", 25.396, 68.3578, ()),
+    ("Karachi", "Sindh", "Pakistan", 24.8607, 67.0011, ()),
+    ("Tokyo", "Tokyo", "Japan", 35.6762, 139.6503, ()),
+    ("Kuala Lumpur", "", "Malaysia", 3.139, 101.6869, ("KL",)),
+]
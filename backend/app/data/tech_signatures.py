@@ -0,0 +1,563 @@
+"""Technology fingerprints used by TechDetector.
+
+Each signature lists lowercase literal tokens matched against one part of a
+fetched page:
+
+- ``html``: page markup (first few hundred KB)
+- ``script``: ``<script src>`` URLs
+- ``cookies``: cookie names
+- ``headers``: ``name: value`` response header lines, matched from the start of a line
+- ``header_values``: text anywhere in those header lines
+
+``implies`` adds technologies that are always present alongside a match.
+"""
+
+from typing import Any
+
+TECH_SIGNATURES: dict[str, dict[str, Any]] = {
+    # ── CMS ───────────────────────────────────────────────────────────────────
+    "WordPress": {
+        "category": "cms",
+        "html": ["/wp-content/", "/wp-includes/", 'content="wordpress'],
+        "script": ["/wp-content/", "/wp-includes/"],
+        "cookies": ["wordpress_logged_in", "wp-settings-"],
+        "headers": ["x-pingback:"],
+        # Link: <https://example.com/wp-json/>; rel="https://api.w.org/"
+        "header_values": ['rel="https://api.w.org/"'],
+        "implies": ["PHP", "MySQL"],
+    },
+    "Joomla": {
+        "category": "cms",
+        "html": ['content="joomla', "/media/jui/", "/components/com_"],
+        "script": ["/media/jui/", "/media/system/js/"],
+        "headers": ["x-content-encoded-by: joomla"],
+        "implies": ["PHP"],
+    },
+    "Drupal": {
+        "category": "cms",
+        "html": ['content="drupal', "/sites/default/files/", "drupal-settings-json"],
+        "script": ["/misc/drupal.js", "/core/misc/drupal.js"],
+        "headers": ["x-drupal-cache:", "x-generator: drupal"],
+        "implies": ["PHP"],
+    },
+    "Ghost": {
+        "category": "cms",
+        "html": ['content="ghost '],
+        "headers": ["x-ghost-cache-status:"],
+        "implies": ["Node.js"],
+    },
+    "Wix": {
+        "category": "website_builder",
+        "html": ["static.wixstatic.com", "static.parastorage.com"],
+        "script": ["static.parastorage.com"],
+        "headers": ["x-wix-request-id:"],
+    },
+    "Squarespace": {
+        "category": "website_builder",
+        "html": ["static1.squarespace.com", "squarespace-cdn.com"],
+        "script": ["static1.squarespace.com", "assets.squarespace.com"],
+        "cookies": ["ss_cvr", "ss_cvt"],
+    },
+    "Webflow": {
+        "category": "website_builder",
+        "html": ['content="webflow', "assets.website-files.com", "data-wf-page"],
+        "script": ["assets.website-files.com"],
+    },
+    "Weebly": {
+        "category": "website_builder",
+        "html": ["editmysite.com"],
+        "script": ["editmysite.com"],
+    },
+    "GoDaddy Website Builder": {
+        "category": "website_builder",
+        "html": ["img1.wsimg.com", 'content="go daddy website builder'],
+        "script": ["img1.wsimg.com"],
+    },
+    "Zoho Sites": {
+        "category": "website_builder",
+        "html": ["zohositescontent", "sites.zoho"],
+        "script": ["static.zohocdn.com/sites"],
+    },
+    "HubSpot CMS": {
+        "category": "cms",
+        "html": ["hs-sites.com", "hubspotusercontent"],
+        "headers": ["x-hs-hub-id:"],
+    },
+    # ── E-commerce ────────────────────────────────────────────────────────────
+    "Shopify": {
+        "category": "ecommerce",
+        "html": ["cdn.shopify.com", "shopify.theme", "myshopify.com"],
+        "script": ["cdn.shopify.com"],
+        "cookies": ["_shopify_y", "_shopify_s", "cart_sig"],
+        "headers": ["x-shopid:", "x-shopify-stage:"],
+    },
+    "WooCommerce": {
+        "category": "ecommerce",
+        "html": ["woocommerce-", "/wp-content/plugins/woocommerce/"],
+        "script": ["/plugins/woocommerce/"],
+        "cookies": ["woocommerce_items_in_cart", "woocommerce_cart_hash"],
+        "implies": ["WordPress"],
+    },
+    "Magento": {
+        "category": "ecommerce",
+        "html": ["/static/version", "mage/cookies", "var blank_img"],
+        "script": ["/mage/", "requirejs/require.js"],
+        "cookies": ["mage-cache-storage", "mage-cache-sessid"],
+        "implies": ["PHP"],
+    },
+    "BigCommerce": {
+        "category": "ecommerce",
+        "html": ["cdn11.bigcommerce.com"],
+        "script": ["cdn11.bigcommerce.com"],
+        "cookies": ["shop_session_token"],
+    },
+    "PrestaShop": {
+        "category": "ecommerce",
+        "html": ['content="prestashop'],
+        "cookies": ["prestashop-"],
+        "implies": ["PHP"],
+    },
+    "OpenCart": {
+        "category": "ecommerce",
+        "html": ["catalog/view/theme/", "index.php?route=common/home"],
+        "cookies": ["ocsessid"],
+        "implies": ["PHP"],
+    },
+    "Dukaan": {
+        "category": "ecommerce",
+        "html": ["mydukaan.io", "dukaan-cdn"],
+        "script": ["mydukaan.io"],
+    },
+    "Instamojo": {
+        "category": "payments",
+        "html": ["instamojo.com"],
+        "script": ["js.instamojo.com"],
+    },
+    # ── Payments ──────────────────────────────────────────────────────────────
+    "Razorpay": {
+        "category": "payments",
+        "html": ["checkout.razorpay.com", "razorpay-payment-button"],
+        "script": ["checkout.razorpay.com"],
+    },
+    "Paytm": {
+        "category": "payments",
+        "script": ["securegw.paytm.in", "merchant.paytm.com"],
+    },
+    "PayU": {
+        "category": "payments",
+        "script": ["secure.payu.in", "jssdk.payu.in"],
+    },
+    "Cashfree": {
+        "category": "payments",
+        "script": ["sdk.cashfree.com"],
+    },
+    "Stripe": {
+        "category": "payments",
+        "html": ["js.stripe.com"],
+        "script": ["js.stripe.com"],
+        "cookies": ["__stripe_mid", "__stripe_sid"],
+    },
+    "PayPal": {
+        "category": "payments",
+        "script": ["paypal.com/sdk/js", "paypalobjects.com"],
+    },
+    # ── Analytics & marketing ─────────────────────────────────────────────────
+    "Google Analytics": {
+        "category": "analytics",
+        "html": ["google-analytics.com/analytics.js", "gtag('config', 'g-", "gtag('config','g-"],
+        "script": ["google-analytics.com/", "googletagmanager.com/gtag/js"],
+        "cookies": ["_ga", "_gid"],
+    },
+    "Google Tag Manager": {
+        "category": "tag_manager",
+        "html": ["googletagmanager.com/gtm.js", "googletagmanager.com/ns.html"],
+        "script": ["googletagmanager.com/gtm.js"],
+    },
+    "Google Ads": {
+        "category": "advertising",
+        "script": ["googleadservices.com", "googleads.g.doubleclick.net"],
+        "cookies": ["_gcl_au"],
+    },
+    "Facebook Pixel": {
+        "category": "advertising",
+        "html": ["connect.facebook.net/en_us/fbevents.js", "fbq('init'"],
+        "script": ["connect.facebook.net"],
+        "cookies": ["_fbp"],
+    },
+    "LinkedIn Insight Tag": {
+        "category": "advertising",
+        "html": ["snap.licdn.com/li.lms-analytics", "_linkedin_partner_id"],
+        "script": ["snap.licdn.com"],
+    },
+    "Hotjar": {
+        "category": "analytics",
+        "html": ["static.hotjar.com"],
+        "script": ["static.hotjar.com"],
+        "cookies": ["_hjsessionuser_", "_hjid"],
+    },
+    "Microsoft Clarity": {
+        "category": "analytics",
+        "html": ["clarity.ms/tag/"],
+        "script": ["clarity.ms/tag/"],
+        "cookies": ["_clck", "_clsk"],
+    },
+    "Mixpanel": {
+        "category": "analytics",
+        "script": ["cdn.mxpnl.com", "mixpanel-2-latest"],
+    },
+    "Segment": {
+        "category": "analytics",
+        "script": ["cdn.segment.com/analytics.js"],
+        "cookies": ["ajs_anonymous_id"],
+    },
+    "Amplitude": {
+        "category": "analytics",
+        "script": ["cdn.amplitude.com"],
+    },
+    "MoEngage": {
+        "category": "marketing_automation",
+        "script": ["cdn.moengage.com"],
+    },
+    "CleverTap": {
+        "category": "marketing_automation",
+        "script": ["clevertap.com/js/", "d2r1yp2w7bby2u.cloudfront.net"],
+    },
+    "WebEngage": {
+        "category": "marketing_automation",
+        "script": ["widgets.in.webengage.com", "ssl.widgets.webengage.com"],
+    },
+    "HubSpot": {
+        "category": "marketing_automation",
+        "html": ["js.hs-scripts.com", "js.hsforms.net"],
+        "script": ["js.hs-scripts.com", "js.hsforms.net", "js.hs-analytics.net"],
+        "cookies": ["hubspotutk", "__hstc"],
+    },
+    "Marketo": {
+        "category": "marketing_automation",
+        "script": ["munchkin.marketo.net"],
+        "cookies": ["_mkto_trk"],
+    },
+    "Mailchimp": {
+        "category": "email_marketing",
+        "html": ["list-manage.com/subscribe"],
+        "script": ["chimpstatic.com"],
+    },
+    "Zoho SalesIQ": {
+        "category": "live_chat",
+        "script": ["salesiq.zoho.com", "salesiq.zohopublic.in", "salesiq.zohopublic.com"],
+    },
+    # ── Live chat & support ───────────────────────────────────────────────────
+    "Intercom": {
+        "category": "live_chat",
+        "html": ["widget.intercom.io"],
+        "script": ["widget.intercom.io", "js.intercomcdn.com"],
+        "cookies": ["intercom-id-", "intercom-session-"],
+    },
+    "Drift": {
+        "category": "live_chat",
+        "script": ["js.driftt.com"],
+    },
+    "Tawk.to": {
+        "category": "live_chat",
+        "html": ["embed.tawk.to"],
+        "script": ["embed.tawk.to"],
+    },
+    "Freshchat": {
+        "category": "live_chat",
+        "script": ["wchat.freshchat.com", "fw-cdn.com"],
+    },
+    "Freshdesk": {
+        "category": "helpdesk",
+        "script": ["widget.freshworks.com", "freshdesk.com/widget"],
+    },
+    "Zendesk": {
+        "category": "helpdesk",
+        "script": ["static.zdassets.com", "zendesk.com/embeddable"],
+    },
+    "Crisp": {
+        "category": "live_chat",
+        "script": ["client.crisp.chat"],
+    },
+    "LiveChat": {
+        "category": "live_chat",
+        "script": ["cdn.livechatinc.com"],
+    },
+    "Gupshup": {
+        "category": "messaging",
+        "script": ["gupshup.io"],
+    },
+    "Interakt": {
+        "category": "messaging",
+        "script": ["app.interakt.ai"],
+    },
+    "WhatsApp Chat Widget": {
+        "category": "messaging",
+        "html": ["wa.me/", "api.whatsapp.com/send"],
+    },
+    # ── JavaScript frameworks & libraries ─────────────────────────────────────
+    "React": {
+        "category": "javascript_framework",
+        "html": ["data-reactroot", "__react", "react-dom.production.min.js"],
+        "script": ["react.production.min.js", "react-dom.production.min.js"],
+    },
+    "Next.js": {
+        "category": "javascript_framework",
+        "html": ["/_next/static/", "__next_data__"],
+        "script": ["/_next/static/"],
+        "headers": ["x-powered-by: next.js"],
+        "implies": ["React", "Node.js"],
+    },
+    "Vue.js": {
+        "category": "javascript_framework",
+        "html": ["data-v-app", "__vue__"],
+        "script": ["vue.min.js", "vue.global.prod.js", "vue.runtime"],
+    },
+    "Nuxt.js": {
+        "category": "javascript_framework",
+        "html": ["/_nuxt/", "window.__nuxt__"],
+        "script": ["/_nuxt/"],
+        "implies": ["Vue.js", "Node.js"],
+    },
+    "Angular": {
+        "category": "javascript_framework",
+        "html": ["ng-version=", "ng-app"],
+        "script": ["angular.min.js", "zone.js"],
+    },
+    "Svelte": {
+        "category": "javascript_framework",
+        "html": ["svelte-"],
+    },
+    "Gatsby": {
+        "category": "static_site_generator",
+        "html": ["___gatsby", "/page-data/app-data.json"],
+        "implies": ["React"],
+    },
+    "jQuery": {
+        "category": "javascript_library",
+        "script": ["jquery.min.js", "jquery.js", "code.jquery.com", "jquery-"],
+    },
+    "Bootstrap": {
+        "category": "ui_framework",
+        "html": ["bootstrap.min.css", "bootstrap.css"],
+        "script": ["bootstrap.min.js", "bootstrap.bundle"],
+    },
+    "Tailwind CSS": {
+        "category": "ui_framework",
+        "html": ["tailwindcss", "cdn.tailwindcss.com"],
+        "script": ["cdn.tailwindcss.com"],
+    },
+    "Font Awesome": {
+        "category": "font",
+        "html": ["font-awesome", "fontawesome"],
+        "script": ["kit.fontawesome.com"],
+    },
+    "Google Fonts": {
+        "category": "font",
+        "html": ["fonts.googleapis.com"],
+    },
+    "Elementor": {
+        "category": "page_builder",
+        "html": ["elementor-kit-", "/plugins/elementor/"],
+        "script": ["/plugins/elementor/"],
+        "implies": ["WordPress"],
+    },
+    "Yoast SEO": {
+        "category": "seo",
+        "html": ["yoast seo plugin", "yoast-schema-graph"],
+        "implies": ["WordPress"],
+    },
+    "reCAPTCHA": {
+        "category": "security",
+        "html": ["google.com/recaptcha", "g-recaptcha"],
+        "script": ["google.com/recaptcha", "recaptcha/api.js"],
+    },
+    # ── Servers, languages & hosting ──────────────────────────────────────────
+    "Nginx": {
+        "category": "web_server",
+        "headers": ["server: nginx"],
+    },
+    "Apache": {
+        "category": "web_server",
+        "headers": ["server: apache"],
+    },
+    "Microsoft IIS": {
+        "category": "web_server",
+        "headers": ["server: microsoft-iis"],
+        "implies": ["Microsoft ASP.NET"],
+    },
+    "LiteSpeed": {
+        "category": "web_server",
+        "headers": ["server: litespeed", "x-litespeed-cache:"],
+    },
+    "OpenResty": {
+        "category": "web_server",
+        "headers": ["server: openresty"],
+        "implies": ["Nginx"],
+    },
+    "PHP": {
+        "category": "language",
+        "headers": ["x-powered-by: php"],
+        "cookies": ["phpsessid"],
+    },
+    "Microsoft ASP.NET": {
+        "category": "web_framework",
+        "html": ["__viewstate", "__eventvalidation"],
+        "headers": ["x-aspnet-version:", "x-powered-by: asp.net", "x-aspnetmvc-version:"],
+        "cookies": ["asp.net_sessionid", ".aspxauth"],
+    },
+    "Java": {
+        "category": "language",
+        "cookies": ["jsessionid"],
+    },
+    "Express": {
+        "category": "web_framework",
+        "headers": ["x-powered-by: express"],
+        "implies": ["Node.js"],
+    },
+    "Node.js": {
+        "category": "language",
+    },
+    "Django": {
+        "category": "web_framework",
+        "html": ["csrfmiddlewaretoken"],
+        "cookies": ["csrftoken", "django_language"],
+        "implies": ["Python"],
+    },
+    "Python": {
+        "category": "language",
+    },
+    "Ruby on Rails": {
+        "category": "web_framework",
+        "html": ['name="csrf-param" content="authenticity_token'],
+        "cookies": ["_rails_session"],
+        "headers": ["x-runtime:"],
+    },
+    "Laravel": {
+        "category": "web_framework",
+        "cookies": ["laravel_session"],
+        "implies": ["PHP"],
+    },
+    "MySQL": {
+        "category": "database",
+    },
+    "Cloudflare": {
+        "category": "cdn",
+        "headers": ["server: cloudflare", "cf-ray:", "cf-cache-status:"],
+        "cookies": ["__cf_bm", "__cfduid", "cf_clearance"],
+    },
+    "Amazon CloudFront": {
+        "category": "cdn",
+        "headers": ["x-amz-cf-id:", "x-cache: hit from cloudfront", "x-cache: miss from cloudfront"],
+    },
+    "Akamai": {
+        "category": "cdn",
+        "headers": ["x-akamai-transformed:", "server: akamaighost", "akamai-grn:"],
+    },
+    "Fastly": {
+        "category": "cdn",
+        "headers": ["x-served-by: cache-", "fastly-debug-digest:", "x-fastly-request-id:"],
+    },
+    "Amazon Web Services": {
+        "category": "paas",
+        "headers": ["server: amazons3", "x-amz-request-id:", "server: awselb"],
+        "cookies": ["awsalb", "awsalbcors"],
+    },
+    "Google Cloud": {
+        "category": "paas",
+        "headers": ["via: 1.1 google", "server: google frontend"],
+    },
+    "Microsoft Azure": {
+        "category": "paas",
+        "headers": ["x-azure-ref:", "x-ms-request-id:"],
+        "cookies": ["arraffinity", "arraffinitysamesite"],
+    },
+    "Vercel": {
+        "category": "paas",
+        "headers": ["server: vercel", "x-vercel-id:", "x-vercel-cache:"],
+    },
+    "Netlify": {
+        "category": "paas",
+        "headers": ["server: netlify", "x-nf-request-id:"],
+    },
+    "Heroku": {
+        "category": "paas",
+        "headers": ["via: 1.1 vegur"],
+    },
+    "GitHub Pages": {
+        "category": "paas",
+        "headers": ["server: github.com"],
+    },
+    "Hostinger": {
+        "category": "hosting",
+        "headers": ["platform: hostinger", "x-hcdn-request-id:"],
+    },
+    "Varnish": {
+        "category": "cache",
+        "headers": ["via: 1.1 varnish", "x-varnish:"],
+    },
+    "HSTS": {
+        "category": "security",
+        "headers": ["strict-transport-security:"],
+    },
+    # ── Business software ─────────────────────────────────────────────────────
+    "Salesforce": {
+        "category": "crm",
+        "html": ["force.com", "salesforce-sites"],
+        "script": ["service.force.com", "my.salesforce.com"],
+    },
+    "Zoho CRM": {
+        "category": "crm",
+        "html": ["crm.zoho.com/crm/webform", "crm.zoho.in/crm/webform"],
+    },
+    "Calendly": {
+        "category": "scheduling",
+        "html": ["calendly.com/"],
+        "script": ["assets.calendly.com"],
+    },
+    "Typeform": {
+        "category": "forms",
+        "html": ["form.typeform.com"],
+        "script": ["embed.typeform.com"],
+    },
+    "Google Maps": {
+        "category": "maps",
+        "html": ["maps.googleapis.com", "google.com/maps/embed"],
+        "script": ["maps.googleapis.com/maps/api/js"],
+    },
+    "YouTube": {
+        "category": "video",
+        "html": ["youtube.com/embed/", "youtube-nocookie.com/embed/"],
+    },
+    "Vimeo": {
+        "category": "video",
+        "html": ["player.vimeo.com"],
+    },
+    "OneTrust": {
+        "category": "cookie_compliance",
+        "script": ["cdn.cookielaw.org", "optanon"],
+        "cookies": ["optanonconsent"],
+    },
+    "Cookiebot": {
+        "category": "cookie_compliance",
+        "script": ["consent.cookiebot.com"],
+    },
+    "Sentry": {
+        "category": "monitoring",
+        "script": ["browser.sentry-cdn.com", "js.sentry-cdn.com"],
+    },
+    "New Relic": {
+        "category": "monitoring",
+        "html": ["js-agent.newrelic.com", "nreum"],
+        "script": ["js-agent.newrelic.com"],
+    },
+    "Optimizely": {
+        "category": "ab_testing",
+        "script": ["cdn.optimizely.com"],
+    },
+    "VWO": {
+        "category": "ab_testing",
+        "html": ["dev.visualwebsiteoptimizer.com"],
+        "script": ["visualwebsiteoptimizer.com"],
+        "cookies": ["_vwo_uuid"],
+    },
+}
@@ -1,5 +1,6 @@
 from collections.abc import AsyncGenerator
 
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 
@@ -15,6 +16,36 @@ class Base(DeclarativeBase):
     pass
 
 
+# create_all only creates missing tables; columns and indexes added to existing tables
+# are applied here. Every statement is idempotent and runs on each startup.
+SCHEMA_UPGRADES = (
+    # Incremental refresh
+    "ALTER TABLE leads ADD COLUMN IF NOT EXISTS fingerprint VARCHAR(64)",
+    "ALTER TABLE scrape_jobs ADD COLUMN IF NOT EXISTS last_refreshed_at TIMESTAMP WITH TIME ZONE",
+    # Canonical companies
+    "ALTER TABLE companies ADD COLUMN IF NOT EXISTS place_id VARCHAR(128)",
+    "ALTER TABLE companies ADD COLUMN IF NOT EXISTS enrichment JSON NOT NULL DEFAULT '{}'",
+    "ALTER TABLE companies ADD COLUMN IF NOT EXISTS ai_enrichment JSON",
+    "ALTER TABLE companies ADD COLUMN IF NOT EXISTS contacts JSON NOT NULL DEFAULT '[]'",
+    "ALTER TABLE companies ADD COLUMN IF NOT EXISTS enriched_at TIMESTAMP WITH TIME ZONE",
+    "ALTER TABLE companies ADD COLUMN IF NOT EXISTS ai_enriched_at TIMESTAMP WITH TIME ZONE",
+    "ALTER TABLE companies ADD COLUMN IF NOT EXISTS contacts_found_at TIMESTAMP WITH TIME ZONE",
+    # Older rows may repeat a domain; only the first keeps it, so the unique index can be built.
+    "UPDATE companies c SET domain = NULL WHERE domain IS NOT NULL"
+    " AND EXISTS (SELECT 1 FROM companies o WHERE o.domain = c.domain AND o.id < c.id)",
+    # Same names as the UNIQUE constraints create_all makes on a new table.
+    "CREATE UNIQUE INDEX IF NOT EXISTS companies_domain_key ON companies (domain)",
+    "CREATE UNIQUE INDEX IF NOT EXISTS companies_place_id_key ON companies (place_id)",
+    "ALTER TABLE leads ADD COLUMN IF NOT EXISTS company_id UUID REFERENCES companies (id) ON DELETE SET NULL",
+    "CREATE INDEX IF NOT EXISTS ix_leads_company_id ON leads (company_id)",
+    # Lead import dedupe
+    "CREATE INDEX IF NOT EXISTS ix_leads_company_domain ON leads (company_domain)",
+    r"CREATE INDEX IF NOT EXISTS ix_leads_phone_key ON leads (right(regexp_replace(company_phone, '\D', '', 'g'), 10))",
+    # Bulk email verification write-back
+    "CREATE INDEX IF NOT EXISTS ix_leads_contact_email_lower ON leads (lower(contact_email))",
+)
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     async with AsyncSessionFactory() as session:
         yield session
@@ -26,3 +57,5 @@ async def init_db() -> None:
 
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        for statement in SCHEMA_UPGRADES:
+            await conn.execute(text(statement))
@@ -1,10 +1,13 @@
 """Apollo.io API client for contact/email discovery."""
 
+import asyncio
 from typing import Any
 
 import httpx
 
 from app.config import get_settings
+from app.email_finder.cache import get_domain_search_cache
+from app.email_finder.http import provider_client, provider_limiter
 
 
 class ApolloClient:
@@ -14,6 +17,8 @@ class ApolloClient:
         settings = get_settings()
         self.api_key = (settings.apollo_api_key or "").strip()
         self.timeout = settings.request_timeout_seconds
+        # Bounds each API exchange; time spent waiting for the rate limiter is not counted.
+        self.call_timeout = settings.email_provider_timeout_seconds
 
     def _has_key(self) -> bool:
         return bool(self.api_key)
@@ -29,28 +34,41 @@ class ApolloClient:
         self,
         domain: str,
         limit: int = 10,
+        client: httpx.AsyncClient | None = None,
+        raise_errors: bool = False,
     ) -> list[dict[str, Any]]:
-        """Search for people at domain. Returns list with email, first_name, last_name, title."""
+        """Search for people at domain. Returns list with email, first_name, last_name, title.
+
+        Failed requests return [] unless ``raise_errors`` is set.
+        """
         if not self._has_key() or not (domain or "").strip():
             return []
 
+        async def fetch(n: int) -> list[dict[str, Any]]:
+            await provider_limiter("apollo").wait()
+            async with provider_client(client, self.timeout) as http, asyncio.timeout(self.call_timeout):
+                return await self._domain_search(http, domain.strip(), n)
+
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                r = await client.post(
-                    f"{self.BASE_URL}/mixed_people/search",
-                    headers=self._headers(),
-                    json={
-                        "api_key": self.api_key,
-                        "q_organization_domains": domain.strip(),
-                        "page": 1,
-                        "per_page": limit,
-                    },
-                )
-                r.raise_for_status()
-                data = r.json()
+            return await get_domain_search_cache().lookup("apollo", domain, limit, fetch)
         except Exception:
+            if raise_errors:
+                raise
             return []
 
+    async def _domain_search(self, http: httpx.AsyncClient, domain: str, limit: int) -> list[dict[str, Any]]:
+        r = await http.post(
+            f"{self.BASE_URL}/mixed_people/search",
+            headers=self._headers(),
+            json={
+                "api_key": self.api_key,
+                "q_organization_domains": domain,
+                "page": 1,
+                "per_page": limit,
+            },
+        )
+        r.raise_for_status()
+        data = r.json()
         people = data.get("people") or []
         return [
             {
@@ -70,9 +88,15 @@ class ApolloClient:
         domain: str,
         first_name: str,
         last_name: str,
+        client: httpx.AsyncClient | None = None,
     ) -> dict[str, Any] | None:
         """Find email for person at domain using Apollo."""
-        people = await self.domain_search(domain, limit=20)
+        people = await self.domain_search(domain, limit=20, client=client)
+        return self.match_person(people, first_name, last_name) or (people[0] if people else None)
+
+    @staticmethod
+    def match_person(people: list[dict[str, Any]], first_name: str, last_name: str) -> dict[str, Any] | None:
+        """The person in a domain_search result with this first and last name, if any."""
         first = (first_name or "").strip().lower()
         last = (last_name or "").strip().lower()
         for p in people:
@@ -86,4 +110,4 @@ class ApolloClient:
                     "position": p.get("position"),
                     "confidence": p.get("confidence", 70),
                 }
-        return people[0] if people else None
+        return None
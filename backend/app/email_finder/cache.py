@@ -0,0 +1,80 @@
+"""Shared cache of provider domain-search results.
+
+Results are keyed by provider and registrable domain, so leads at the same
+company reuse one paid lookup per provider for
+``email_domain_cache_ttl_seconds``. Empty results are cached too, for the
+shorter ``email_domain_negative_ttl_seconds``. Failed lookups are not
+cached. Identical lookups already in flight are coalesced into one request.
+"""
+
+import logging
+from functools import lru_cache
+from typing import Any, Awaitable, Callable
+
+from app.config import get_settings
+from app.utils.cache import JsonCache
+from app.utils.domains import registrable_domain
+from app.utils.singleflight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+DomainFetch = Callable[[int], Awaitable[list[dict[str, Any]]]]
+
+
+class DomainSearchCache:
+    def __init__(self) -> None:
+        settings = get_settings()
+        self.ttl = settings.email_domain_cache_ttl_seconds
+        self.negative_ttl = settings.email_domain_negative_ttl_seconds
+        self._cache = JsonCache("email-domain")
+        self._flight = SingleFlight()
+        self.stats = {"hits": 0, "negative_hits": 0, "misses": 0, "coalesced": 0}
+
+    @staticmethod
+    def _fits(entry: dict[str, Any], limit: int) -> bool:
+        # A result shorter than the limit it was fetched with is the provider's complete list.
+        results = entry.get("results") or []
+        return entry.get("limit", 0) >= limit or len(results) < entry.get("limit", 0)
+
+    @staticmethod
+    def _key(provider: str, domain: str) -> str:
+        return f"{provider}:{registrable_domain(domain) or domain.strip().lower()}"
+
+    async def peek(self, provider: str, domain: str, limit: int) -> list[dict[str, Any]] | None:
+        """Cached results for ``domain`` without fetching; None when a lookup would call the provider."""
+        entry = await self._cache.get(self._key(provider, domain))
+        if entry is None or not self._fits(entry, limit):
+            return None
+        return (entry.get("results") or [])[:limit]
+
+    async def lookup(self, provider: str, domain: str, limit: int, fetch: DomainFetch) -> list[dict[str, Any]]:
+        """Cached ``fetch(limit)`` for ``domain``; exceptions from ``fetch`` propagate uncached."""
+        key = self._key(provider, domain)
+
+        entry = await self._cache.get(key)
+        if entry is not None and self._fits(entry, limit):
+            results = entry.get("results") or []
+            self.stats["hits" if results else "negative_hits"] += 1
+            return results[:limit]
+
+        if self._flight.in_flight(key):
+            self.stats["coalesced"] += 1
+        else:
+            self.stats["misses"] += 1
+
+        async def load() -> dict[str, Any]:
+            results = await fetch(limit)
+            fresh = {"limit": limit, "results": results}
+            await self._cache.set(key, fresh, self.ttl if results else self.negative_ttl)
+            return fresh
+
+        fresh = await self._flight.do(key, load)
+        if not self._fits(fresh, limit):
+            # Coalesced onto a smaller lookup for the same domain; fetch the larger page.
+            fresh = await load()
+        return (fresh.get("results") or [])[:limit]
+
+
+@lru_cache(maxsize=1)
+def get_domain_search_cache() -> DomainSearchCache:
+    return DomainSearchCache()
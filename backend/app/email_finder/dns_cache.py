@@ -0,0 +1,123 @@
+"""Asynchronous MX lookups with an in-process TTL cache.
+
+One resolver per process is shared by the verify endpoints, bulk
+verification and enrichment. Answers are cached for their DNS TTL (clamped
+to ``dns_cache_max_ttl_seconds``). Domains without a mail host are cached
+for ``dns_negative_ttl_seconds``, and lookups that time out or fail for
+``_ERROR_TTL``; ``mail_host_status`` tells those failures apart from a
+domain without mail. Concurrent lookups of one domain share a query, and at most
+``dns_concurrency`` queries are outstanding per event loop.
+"""
+
+import asyncio
+import logging
+import time
+import weakref
+from functools import lru_cache
+
+import dns.asyncresolver
+import dns.exception
+import dns.resolver
+
+from app.config import get_settings
+from app.utils.singleflight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+_MIN_TTL = 60.0
+_ERROR_TTL = 60.0
+_MAX_ENTRIES = 100_000
+
+
+class MXResolver:
+    def __init__(self) -> None:
+        settings = get_settings()
+        self.concurrency = max(1, settings.dns_concurrency)
+        self.negative_ttl = float(settings.dns_negative_ttl_seconds)
+        self.max_ttl = float(settings.dns_cache_max_ttl_seconds)
+        self._resolver = dns.asyncresolver.Resolver()
+        self._resolver.lifetime = settings.dns_timeout_seconds
+        # domain -> (expires, hosts, lookup failed)
+        self._cache: dict[str, tuple[float, tuple[str, ...], bool]] = {}
+        self._flight = SingleFlight()
+        self._limits: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def _limit(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        sem = self._limits.get(loop)
+        if sem is None:
+            sem = self._limits[loop] = asyncio.Semaphore(self.concurrency)
+        return sem
+
+    async def mx_hosts(self, domain: str) -> tuple[str, ...]:
+        """Mail exchangers for ``domain`` by preference; the domain itself when it only has an A/AAAA
+        record (implicit MX); empty when it cannot receive mail."""
+        domain = (domain or "").strip().lower().rstrip(".")
+        if not domain:
+            return ()
+        entry = self._cache.get(domain)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+        return await self._flight.do(domain, lambda: self._lookup(domain))
+
+    async def has_mail_host(self, domain: str) -> bool:
+        return bool(await self.mx_hosts(domain))
+
+    async def mail_host_status(self, domain: str) -> bool | None:
+        """True if ``domain`` can receive mail, False if DNS says it cannot, None if the lookup failed."""
+        if await self.mx_hosts(domain):
+            return True
+        entry = self._cache.get((domain or "").strip().lower().rstrip("."))
+        return None if entry is not None and entry[2] else False
+
+    async def _lookup(self, domain: str) -> tuple[str, ...]:
+        failed = False
+        async with self._limit():
+            try:
+                hosts, ttl = await self._resolve(domain)
+            except dns.exception.DNSException as exc:
+                # Timeouts, SERVFAIL, no nameservers: retry soon rather than trusting the failure.
+                logger.debug("MX lookup for %s failed: %s", domain, exc)
+                hosts, ttl, failed = (), _ERROR_TTL, True
+        if not hosts:
+            ttl = min(ttl, self.negative_ttl)
+        self._store(domain, hosts, ttl, failed)
+        return hosts
+
+    async def _resolve(self, domain: str) -> tuple[tuple[str, ...], float]:
+        try:
+            answer = await self._resolver.resolve(domain, "MX")
+        except dns.resolver.NXDOMAIN:
+            return (), self.negative_ttl
+        except dns.resolver.NoAnswer:
+            answer = None
+        if answer is not None:
+            records = sorted(answer, key=lambda r: r.preference)
+            hosts = tuple(str(r.exchange).rstrip(".").lower() for r in records)
+            # RFC 7505 null MX: the domain explicitly accepts no mail.
+            hosts = tuple(h for h in hosts if h)
+            return hosts, max(_MIN_TTL, min(float(answer.rrset.ttl), self.max_ttl))
+        for rdtype in ("A", "AAAA"):
+            try:
+                answer = await self._resolver.resolve(domain, rdtype)
+            except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer):
+                continue
+            return (domain,), max(_MIN_TTL, min(float(answer.rrset.ttl), self.max_ttl))
+        return (), self.negative_ttl
+
+    def _store(self, domain: str, hosts: tuple[str, ...], ttl: float, failed: bool = False) -> None:
+        now = time.monotonic()
+        if len(self._cache) >= _MAX_ENTRIES:
+            for key in [k for k, (expires, _, _) in self._cache.items() if expires <= now]:
+                del self._cache[key]
+            if len(self._cache) >= _MAX_ENTRIES:
+                for key in list(self._cache)[: _MAX_ENTRIES // 10]:
+                    del self._cache[key]
+        self._cache[domain] = (now + ttl, hosts, failed)
+
+
+@lru_cache(maxsize=1)
+def get_mx_resolver() -> MXResolver:
+    return MXResolver()
@@ -1,10 +1,21 @@
-from typing import Any, List, Optional
+import asyncio
+import logging
+from typing import Any, Awaitable, List, Optional
 
+import httpx
+
+from app.config import get_settings
 from app.email_finder.apollo import ApolloClient
+from app.email_finder.cache import get_domain_search_cache
 from app.email_finder.hunter import HunterClient
 from app.email_finder.pattern_guesser import generate_email_patterns
+from app.email_finder.pattern_store import PatternStore, PatternSuggestion
+from app.email_finder.provider_stats import ProviderStats
 from app.email_finder.snov import SnovClient
 from app.email_finder.verifier import EmailVerifier, VerificationResult
+from app.utils.domains import registrable_domain
+
+logger = logging.getLogger(__name__)
 
 
 class EmailCandidate:
@@ -16,6 +27,7 @@ class EmailCandidate:
         first_name: str | None = None,
         last_name: str | None = None,
         position: str | None = None,
+        verified: bool | None = None,
     ):
         self.email = email
         self.confidence = confidence
@@ -23,14 +35,267 @@ class EmailCandidate:
         self.first_name = first_name
         self.last_name = last_name
         self.position = position
+        # Set when the finder already verified the address (None: not checked)
+        self.verified = verified
+
+
+# Default confidence per provider when a result carries none.
+_DEFAULT_CONFIDENCE = {
+    "hunter_finder": 80,
+    "apollo_person": 70,
+    "hunter_person": 70,
+    "snov_person": 60,
+    "hunter": 50,
+    "apollo": 60,
+    "snov": 50,
+}
+# Finder step -> provider whose credits it spends
+_STEP_PROVIDER = {"hunter_finder": "hunter", "hunter": "hunter", "apollo": "apollo", "snov": "snov"}
+_DOMAIN_STEPS = ("hunter", "apollo", "snov")
+
+
+class _Merge:
+    """Candidates merged across provider results for one lookup."""
+
+    def __init__(self, first: str | None, last: str | None, limit: int, threshold: int):
+        self.first, self.last = first, last
+        self.wants_person = bool(first or last)
+        self.limit = limit
+        self.threshold = threshold
+        self.by_email: dict[str, EmailCandidate] = {}
+        self.person_emails: set[str] = set()
+        self.observed: list[tuple[str, str | None, str | None]] = []
+
+    def add(self, key: str, item: dict[str, Any]) -> str | None:
+        """Merge one result; returns its address if it is relevant to the lookup."""
+        email = (item.get("email") or "").strip().lower()
+        if not email:
+            return None
+        if key == "hunter_finder":
+            self.observed.append((email, item.get("first_name") or self.first, item.get("last_name") or self.last))
+        elif item.get("first_name") and item.get("last_name"):
+            self.observed.append((email, item["first_name"], item["last_name"]))
+        confidence = item.get("confidence")
+        if confidence is None:
+            confidence = _DEFAULT_CONFIDENCE[key]
+        is_person = key == "hunter_finder" or key.endswith("_person")
+        if is_person:
+            self.person_emails.add(email)
+        current = self.by_email.get(email)
+        if current is None:
+            self.by_email[email] = EmailCandidate(
+                email=email,
+                confidence=confidence,
+                source=key.split("_")[0],
+                first_name=item.get("first_name"),
+                last_name=item.get("last_name"),
+                position=item.get("position"),
+            )
+        elif confidence > current.confidence:
+            current.confidence = confidence
+        return email if is_person or not self.wants_person else None
+
+    def good_enough(self) -> bool:
+        if self.wants_person:
+            return any(self.by_email[e].confidence >= self.threshold for e in self.person_emails)
+        return sum(1 for c in self.by_email.values() if c.confidence >= self.threshold) >= self.limit
 
 
 class EmailFinderEngine:
+    """Finds email candidates with Hunter, Apollo and Snov.
+
+    Person lookups consult the learned email patterns first. A domain whose
+    evidence points to one dominant pattern is answered without any
+    provider call. Named people returned by providers are recorded as new
+    pattern evidence.
+
+    With ``email_lookup_strategy="waterfall"`` (the default) results already
+    in the domain-search cache are used first. Then providers are called
+    one at a time, best expected hits per credit first (hit rates learned
+    per TLD and industry, credit costs from settings). Each provider's
+    relevant candidates are verified, and the lookup stops at the first
+    verified address. Every paid call's outcome is recorded for the hit
+    rates.
+
+    With ``"parallel"`` all providers are queried concurrently and
+    candidates are merged as calls complete. The lookup returns as soon as
+    a good enough answer exists (the requested person at
+    ``email_early_exit_confidence``, or ``limit`` candidates at that
+    confidence for domain lookups), cancelling the calls still in flight.
+
+    Each provider call has its own timeout (enforced by the clients, after
+    rate limiting).
+    """
+
     def __init__(self):
+        settings = get_settings()
         self.hunter = HunterClient()
         self.snov = SnovClient()
         self.apollo = ApolloClient()
         self.verifier = EmailVerifier()
+        self.strategy = settings.email_lookup_strategy
+        self.early_exit_confidence = settings.email_early_exit_confidence
+        self.request_timeout = settings.request_timeout_seconds
+        self.patterns = PatternStore()
+        self.pattern_min_evidence = settings.email_pattern_min_evidence
+        self.pattern_dominance = settings.email_pattern_dominance
+        self.provider_stats = ProviderStats()
+        self.credit_costs = {
+            "hunter": settings.hunter_credit_cost,
+            "apollo": settings.apollo_credit_cost,
+            "snov": settings.snov_credit_cost,
+        }
+
+    def _dominant(self, suggestions: list[PatternSuggestion]) -> bool:
+        return bool(suggestions) and (
+            suggestions[0].evidence >= self.pattern_min_evidence
+            and suggestions[0].probability >= self.pattern_dominance
+        )
+
+    @staticmethod
+    def _pattern_confidence(suggestion: PatternSuggestion, dominant: bool) -> int:
+        # Guesses without a dominant domain pattern stay below provider-found addresses.
+        return max(10, min(90 if dominant else 50, round(suggestion.probability * 100)))
+
+    @staticmethod
+    def _search_limit(name: str, limit: int) -> int:
+        # One Apollo people search serves both the person match and the domain list.
+        return max(limit, 20) if name == "apollo" else limit
+
+    def _steps(self, wants_person: bool) -> list[str]:
+        """Configured finder steps for this lookup, in default order."""
+        steps = []
+        if self.hunter._has_key():
+            if wants_person:
+                steps.append("hunter_finder")
+            if not wants_person or self.strategy == "parallel":
+                steps.append("hunter")
+        if self.apollo._has_key():
+            steps.append("apollo")
+        if self.snov._has_key():
+            steps.append("snov")
+        return steps
+
+    def _provider_call(
+        self,
+        name: str,
+        client: httpx.AsyncClient,
+        domain: str,
+        first: str | None,
+        last: str | None,
+        limit: int,
+    ) -> Awaitable[Any]:
+        if name == "hunter_finder":
+            return self.hunter.email_finder(domain, first or "?", last or "?", client=client, raise_errors=True)
+        provider = {"hunter": self.hunter, "apollo": self.apollo, "snov": self.snov}[name]
+        return provider.domain_search(domain, limit=self._search_limit(name, limit), client=client, raise_errors=True)
+
+    @staticmethod
+    def _results(name: str, result: Any, first: str | None, last: str | None) -> list[tuple[str, dict[str, Any]]]:
+        """(source key, result dict) pairs from one provider response."""
+        if not result:
+            return []
+        if name == "hunter_finder":
+            return [("hunter_finder", result)]
+        out: list[tuple[str, dict[str, Any]]] = []
+        if first or last:
+            person = ApolloClient.match_person(result, first or "", last or "")
+            if person:
+                out.append((f"{name}_person", person))
+        out.extend((name, r) for r in result)
+        return out
+
+    async def _parallel(
+        self,
+        merge: _Merge,
+        client: httpx.AsyncClient,
+        steps: list[str],
+        domain: str,
+    ) -> None:
+        first, last = merge.first, merge.last
+        # Each client bounds its own API exchange by email_provider_timeout_seconds.
+        tasks = {
+            asyncio.ensure_future(self._provider_call(name, client, domain, first, last, merge.limit)): name
+            for name in steps
+        }
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    name = tasks[task]
+                    try:
+                        result = task.result()
+                    except Exception as exc:
+                        logger.warning("Email provider %s failed for %s: %s", name, domain, exc)
+                        continue
+                    for key, item in self._results(name, result, first, last):
+                        merge.add(key, item)
+                if merge.good_enough():
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _verify_step(self, merge: _Merge, name: str, result: Any) -> bool:
+        """Merge one step's results and verify its best relevant candidates; True if any is valid."""
+        relevant = {
+            email
+            for key, item in self._results(name, result, merge.first, merge.last)
+            if (email := merge.add(key, item))
+        }
+        unchecked = sorted(
+            (merge.by_email[e] for e in relevant if merge.by_email[e].verified is None),
+            key=lambda c: c.confidence,
+            reverse=True,
+        )[: merge.limit]
+        if unchecked:
+            verdicts = await self.verifier.verify_many([c.email for c in unchecked])
+            for candidate, verdict in zip(unchecked, verdicts):
+                candidate.verified = verdict.status == "valid"
+        return any(merge.by_email[e].verified for e in relevant)
+
+    async def _waterfall(
+        self,
+        merge: _Merge,
+        client: httpx.AsyncClient,
+        steps: list[str],
+        domain: str,
+        industry: str | None,
+    ) -> None:
+        cache = get_domain_search_cache()
+        searches = [s for s in steps if s in _DOMAIN_STEPS]
+        cached = await asyncio.gather(
+            *(cache.peek(s, domain, self._search_limit(s, merge.limit)) for s in searches)
+        )
+        # Cached results cost nothing, so they go first and are not provider outcomes.
+        free = {name: result for name, result in zip(searches, cached) if result is not None}
+        for name, result in free.items():
+            if await self._verify_step(merge, name, result):
+                return
+
+        costs = {step: self.credit_costs[_STEP_PROVIDER[step]] for step in steps}
+        paid = await self.provider_stats.order([s for s in steps if s not in free], costs, domain, industry)
+        outcomes: dict[str, bool] = {}
+        try:
+            for name in paid:
+                try:
+                    result = await self._provider_call(name, client, domain, merge.first, merge.last, merge.limit)
+                except Exception as exc:
+                    # Errors and timeouts say nothing about coverage, so they are not recorded.
+                    logger.warning("Email provider %s failed for %s: %s", name, domain, exc)
+                    continue
+                outcomes[name] = await self._verify_step(merge, name, result)
+                if outcomes[name]:
+                    break
+        finally:
+            if outcomes:
+                try:
+                    await self.provider_stats.record(domain, industry, outcomes)
+                except Exception as exc:
+                    logger.warning("Recording provider outcomes for %s failed: %s", domain, exc)
 
     async def find_emails(
         self,
@@ -40,113 +305,73 @@ class EmailFinderEngine:
         first_name: Optional[str] = None,
         last_name: Optional[str] = None,
         limit: int = 5,
+        industry: Optional[str] = None,
     ) -> List[EmailCandidate]:
         """Find email candidates for domain, optionally for a specific person."""
-        domain = (domain or "").strip().lower()
+        domain = registrable_domain(domain) or ""
         if not domain:
             return []
 
-        candidates: List[EmailCandidate] = []
-        seen: set[str] = set()
-
-        if first_name or last_name or person_name:
-            first, last = first_name, last_name
-            if person_name and not (first or last):
-                parts = person_name.strip().split(None, 1)
-                first = parts[0] if parts else ""
-                last = parts[1] if len(parts) > 1 else ""
-            if first or last:
-                hunter_result = await self.hunter.email_finder(domain, first or "?", last or "?")
-                if hunter_result and hunter_result.get("email"):
-                    email = hunter_result["email"].lower()
-                    if email not in seen:
-                        seen.add(email)
-                        candidates.append(
-                            EmailCandidate(
-                                email=email,
-                                confidence=hunter_result.get("confidence", 80),
-                                source="hunter",
-                                first_name=hunter_result.get("first_name"),
-                                last_name=hunter_result.get("last_name"),
-                                position=hunter_result.get("position"),
-                            )
-                        )
-
-                apollo_result = await self.apollo.find_email(domain, first or "", last or "")
-                if apollo_result and apollo_result.get("email"):
-                    email = apollo_result["email"].lower()
-                    if email not in seen:
-                        seen.add(email)
-                        candidates.append(
-                            EmailCandidate(
-                                email=email,
-                                confidence=apollo_result.get("confidence", 70),
-                                source="apollo",
-                                first_name=apollo_result.get("first_name"),
-                                last_name=apollo_result.get("last_name"),
-                                position=apollo_result.get("position"),
-                            )
-                        )
-
-        hunter_emails = await self.hunter.domain_search(domain, limit=limit)
-        for e in hunter_emails:
-            email = (e.get("email") or "").lower()
-            if email and email not in seen:
-                seen.add(email)
-                candidates.append(
-                    EmailCandidate(
-                        email=email,
-                        confidence=e.get("confidence", 50),
-                        source="hunter",
-                        first_name=e.get("first_name"),
-                        last_name=e.get("last_name"),
-                        position=e.get("position"),
-                    )
-                )
+        first, last = first_name, last_name
+        if person_name and not (first or last):
+            parts = person_name.strip().split(None, 1)
+            first = parts[0] if parts else ""
+            last = parts[1] if len(parts) > 1 else ""
+        first = (first or "").strip() or None
+        last = (last or "").strip() or None
+        wants_person = bool(first or last)
 
-        apollo_emails = await self.apollo.domain_search(domain, limit=limit)
-        for e in apollo_emails:
-            email = (e.get("email") or "").lower()
-            if email and email not in seen:
-                seen.add(email)
-                candidates.append(
+        suggestions: list[PatternSuggestion] = []
+        if first and last:
+            try:
+                suggestions = await self.patterns.suggest(domain, first, last, industry)
+            except Exception as exc:
+                logger.warning("Email pattern lookup failed for %s: %s", domain, exc)
+            if self._dominant(suggestions):
+                best = suggestions[0]
+                return [
                     EmailCandidate(
-                        email=email,
-                        confidence=e.get("confidence", 60),
-                        source="apollo",
-                        first_name=e.get("first_name"),
-                        last_name=e.get("last_name"),
-                        position=e.get("position"),
+                        email=best.email,
+                        confidence=self._pattern_confidence(best, True),
+                        source="pattern",
+                        first_name=first,
+                        last_name=last,
                     )
-                )
+                ]
 
-        snov_emails = await self.snov.domain_search(domain, limit=limit)
-        for e in snov_emails:
-            email = (e.get("email") or "").lower()
-            if email and email not in seen:
-                seen.add(email)
+        merge = _Merge(first, last, limit, self.early_exit_confidence)
+        steps = self._steps(wants_person)
+        async with httpx.AsyncClient(timeout=self.request_timeout) as client:
+            if self.strategy == "parallel":
+                await self._parallel(merge, client, steps, domain)
+            else:
+                await self._waterfall(merge, client, steps, domain, industry)
+
+        if merge.observed:
+            try:
+                await self.patterns.observe(merge.observed)
+            except Exception as exc:
+                logger.warning("Recording email patterns for %s failed: %s", domain, exc)
+
+        candidates = list(merge.by_email.values())
+        if not candidates and suggestions:
+            dominant = self._dominant(suggestions)
+            for suggestion in suggestions:
                 candidates.append(
                     EmailCandidate(
-                        email=email,
-                        confidence=e.get("confidence", 50),
-                        source="snov",
-                        first_name=e.get("first_name"),
-                        last_name=e.get("last_name"),
-                        position=e.get("position"),
+                        email=suggestion.email,
+                        confidence=self._pattern_confidence(suggestion, dominant),
+                        source="pattern",
                     )
                 )
+        elif not candidates and wants_person:
+            for pattern in generate_email_patterns((first or "").lower(), (last or "").lower(), domain)[:5]:
+                candidates.append(EmailCandidate(email=pattern, confidence=30, source="pattern"))
 
-        if not candidates and (first_name or last_name):
-            first = (first_name or "").strip().lower()
-            last = (last_name or "").strip().lower()
-            for pattern in generate_email_patterns(first, last, domain)[:5]:
-                if pattern.lower() not in seen:
-                    seen.add(pattern.lower())
-                    candidates.append(
-                        EmailCandidate(email=pattern, confidence=30, source="pattern")
-                    )
-
-        candidates.sort(key=lambda c: c.confidence, reverse=True)
+        # The requested person's own address ranks above other people's, and verified above unverified.
+        candidates.sort(
+            key=lambda c: (c.email in merge.person_emails, bool(c.verified), c.confidence), reverse=True
+        )
         return candidates[:limit]
 
     async def find_email(self, first_name: str, last_name: str, domain: str) -> dict[str, Any]:
@@ -158,8 +383,8 @@ class EmailFinderEngine:
             limit=5,
         )
         best = None
-        for c in candidates:
-            verdict = await self.verifier.verify(c.email)
+        verdicts = await self.verifier.verify_many([c.email for c in candidates])
+        for c, verdict in zip(candidates, verdicts):
             if verdict.status == "valid" and (best is None or verdict.confidence > best.get("confidence", 0)):
                 best = {
                     "email": c.email,
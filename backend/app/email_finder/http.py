@@ -0,0 +1,30 @@
+"""HTTP client sharing and request pacing for email provider clients."""
+
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+import httpx
+
+from app.config import get_settings
+from app.utils.rate_limiter import RateLimiter
+
+_limiters: dict[str, RateLimiter] = {}
+
+
+@asynccontextmanager
+async def provider_client(client: httpx.AsyncClient | None, timeout: float) -> AsyncIterator[httpx.AsyncClient]:
+    """Yield ``client`` when the caller shares one, else a short-lived client."""
+    if client is not None:
+        yield client
+        return
+    async with httpx.AsyncClient(timeout=timeout) as own:
+        yield own
+
+
+def provider_limiter(provider: str) -> RateLimiter:
+    """Process-wide pacing for one provider's API calls (``<provider>_rpm`` setting)."""
+    limiter = _limiters.get(provider)
+    if limiter is None:
+        rpm = getattr(get_settings(), f"{provider}_rpm")
+        limiter = _limiters[provider] = RateLimiter(requests_per_minute=rpm)
+    return limiter
@@ -1,10 +1,13 @@
 """Hunter.io API client for email discovery."""
 
+import asyncio
 from typing import Any
 
 import httpx
 
 from app.config import get_settings
+from app.email_finder.cache import get_domain_search_cache
+from app.email_finder.http import provider_client, provider_limiter
 
 
 class HunterClient:
@@ -14,6 +17,8 @@ class HunterClient:
         settings = get_settings()
         self.api_key = (settings.hunter_api_key or "").strip()
         self.timeout = settings.request_timeout_seconds
+        # Bounds each API exchange; time spent waiting for the rate limiter is not counted.
+        self.call_timeout = settings.email_provider_timeout_seconds
 
     def _has_key(self) -> bool:
         return bool(self.api_key)
@@ -22,26 +27,39 @@ class HunterClient:
         self,
         domain: str,
         limit: int = 10,
+        client: httpx.AsyncClient | None = None,
+        raise_errors: bool = False,
     ) -> list[dict[str, Any]]:
-        """Return emails found for domain. Each item: email, first_name, last_name, position, confidence."""
+        """Return emails found for domain. Each item: email, first_name, last_name, position, confidence.
+
+        Failed requests return [] unless ``raise_errors`` is set.
+        """
         if not self._has_key() or not (domain or "").strip():
             return []
 
+        async def fetch(n: int) -> list[dict[str, Any]]:
+            await provider_limiter("hunter").wait()
+            async with provider_client(client, self.timeout) as http, asyncio.timeout(self.call_timeout):
+                return await self._domain_search(http, domain.strip(), n)
+
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                r = await client.get(
-                    f"{self.BASE_URL}/domain-search",
-                    params={
-                        "domain": domain.strip(),
-                        "api_key": self.api_key,
-                        "limit": limit,
-                    },
-                )
-                r.raise_for_status()
-                data = r.json()
+            return await get_domain_search_cache().lookup("hunter", domain, limit, fetch)
         except Exception:
+            if raise_errors:
+                raise
             return []
 
+    async def _domain_search(self, http: httpx.AsyncClient, domain: str, limit: int) -> list[dict[str, Any]]:
+        r = await http.get(
+            f"{self.BASE_URL}/domain-search",
+            params={
+                "domain": domain,
+                "api_key": self.api_key,
+                "limit": limit,
+            },
+        )
+        r.raise_for_status()
+        data = r.json()
         result = data.get("data", {})
         emails = result.get("emails") or []
         return [
@@ -63,8 +81,13 @@ class HunterClient:
         domain: str,
         first_name: str,
         last_name: str,
+        client: httpx.AsyncClient | None = None,
+        raise_errors: bool = False,
     ) -> dict[str, Any] | None:
-        """Find most likely email for person at domain."""
+        """Find most likely email for person at domain.
+
+        Failed requests return None unless ``raise_errors`` is set.
+        """
         if not self._has_key() or not (domain or "").strip():
             return None
 
@@ -74,8 +97,9 @@ class HunterClient:
             return None
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                r = await client.get(
+            await provider_limiter("hunter").wait()
+            async with provider_client(client, self.timeout) as http, asyncio.timeout(self.call_timeout):
+                r = await http.get(
                     f"{self.BASE_URL}/email-finder",
                     params={
                         "domain": domain.strip(),
@@ -87,6 +111,8 @@ class HunterClient:
                 r.raise_for_status()
                 data = r.json()
         except Exception:
+            if raise_errors:
+                raise
             return None
 
         result = data.get("data", {})
@@ -1,19 +1,102 @@
-def generate_email_patterns(first_name: str, last_name: str, domain: str) -> list[str]:
-    first = (first_name or "").strip().lower()
-    last = (last_name or "").strip().lower()
-    if not first or not last or not domain:
+"""Email local-part patterns: generation, classification and evidence-based ranking.
+
+A pattern is a named way to build a local part from a person's name
+("first.last", "flast", ...). ``classify`` tells which patterns produce a
+known address. ``rank_patterns`` turns the pattern counts observed at a
+domain, plus a prior (TLD or industry counts, else ``DEFAULT_PRIOR``), into
+probabilities. The probabilities are additively smoothed, so a few
+observations outweigh the prior and no observations reproduce it.
+"""
+
+import re
+import unicodedata
+from typing import Callable, Mapping
+
+_NAME_CHARS = re.compile(r"[^a-z]")
+
+PATTERNS: dict[str, Callable[[str, str], str]] = {
+    "first": lambda fn, ln: fn,
+    "first.last": lambda fn, ln: f"{fn}.{ln}",
+    "firstlast": lambda fn, ln: f"{fn}{ln}",
+    "flast": lambda fn, ln: f"{fn[0]}{ln}",
+    "f.last": lambda fn, ln: f"{fn[0]}.{ln}",
+    "first_last": lambda fn, ln: f"{fn}_{ln}",
+    "first-last": lambda fn, ln: f"{fn}-{ln}",
+    "last.first": lambda fn, ln: f"{ln}.{fn}",
+    "lfirst": lambda fn, ln: f"{ln[0]}{fn}",
+    "last": lambda fn, ln: ln,
+    "firstl": lambda fn, ln: f"{fn}{ln[0]}",
+    "lastf": lambda fn, ln: f"{ln}{fn[0]}",
+}
+
+# Share of business domains using each pattern when nothing else is known.
+DEFAULT_PRIOR: dict[str, float] = {
+    "first.last": 0.34,
+    "first": 0.20,
+    "flast": 0.14,
+    "firstlast": 0.08,
+    "f.last": 0.06,
+    "last": 0.04,
+    "first_last": 0.03,
+    "firstl": 0.03,
+    "last.first": 0.02,
+    "first-last": 0.02,
+    "lfirst": 0.02,
+    "lastf": 0.02,
+}
+
+# Weight of the prior, in observations.
+PRIOR_STRENGTH = 2.0
+
+
+def name_token(value: str | None) -> str:
+    """ASCII lowercase letters of a name part ("José-Luis" -> "joseluis")."""
+    if not value:
+        return ""
+    ascii_value = unicodedata.normalize("NFKD", value).encode("ascii", "ignore").decode("ascii")
+    return _NAME_CHARS.sub("", ascii_value.lower())
+
+
+def classify(local_part: str, first_name: str | None, last_name: str | None) -> list[str]:
+    """Patterns that build ``local_part`` from the name (several when they coincide, e.g. one-letter names)."""
+    first, last = name_token(first_name), name_token(last_name)
+    if not first or not last:
         return []
+    local = (local_part or "").strip().lower()
+    return [name for name, build in PATTERNS.items() if build(first, last) == local]
+
+
+def normalize_prior(counts: Mapping[str, float] | None) -> dict[str, float]:
+    total = sum(v for k, v in (counts or {}).items() if k in PATTERNS)
+    if total <= 0:
+        return dict(DEFAULT_PRIOR)
+    return {k: counts.get(k, 0) / total for k in PATTERNS}
 
-    fi = first[0]
-    li = last[0]
-    return [
-        f"{first}@{domain}",
-        f"{first}.{last}@{domain}",
-        f"{first}{last}@{domain}",
-        f"{fi}{last}@{domain}",
-        f"{fi}.{last}@{domain}",
-        f"{first}_{last}@{domain}",
-        f"{first}-{last}@{domain}",
-        f"{last}.{first}@{domain}",
-        f"{li}{first}@{domain}",
+
+def rank_patterns(
+    counts: Mapping[str, float] | None,
+    prior: Mapping[str, float] | None = None,
+) -> list[tuple[str, float]]:
+    """(pattern, probability) best first, from a domain's observed counts smoothed toward ``prior``."""
+    counts = counts or {}
+    prior = prior or DEFAULT_PRIOR
+    total = sum(counts.get(k, 0) for k in PATTERNS)
+    scored = [
+        (name, (counts.get(name, 0) + PRIOR_STRENGTH * prior.get(name, 0.0)) / (total + PRIOR_STRENGTH))
+        for name in PATTERNS
     ]
+    scored.sort(key=lambda item: item[1], reverse=True)
+    return scored
+
+
+def build_email(pattern: str, first_name: str | None, last_name: str | None, domain: str) -> str | None:
+    first, last = name_token(first_name), name_token(last_name)
+    if not first or not last or not domain or pattern not in PATTERNS:
+        return None
+    return f"{PATTERNS[pattern](first, last)}@{domain}"
+
+
+def generate_email_patterns(first_name: str, last_name: str, domain: str) -> list[str]:
+    """Candidate addresses for a person, most common patterns first."""
+    emails = (build_email(name, first_name, last_name, domain) for name, _ in rank_patterns(None))
+    return list(dict.fromkeys(e for e in emails if e))
@@ -0,0 +1,224 @@
+"""Persisted email pattern evidence (``email_patterns``) and per-domain guesses.
+
+Evidence comes from addresses whose owner's name is known. Those are the
+people Hunter/Apollo return (recorded by the finder through ``observe``)
+and the named contacts stored on companies (``learn_from_contacts``). Each domain keeps up
+to ``MAX_SAMPLES`` addresses. ``rebuild_priors`` aggregates the domain rows
+into TLD and industry priors for domains with little or no evidence of
+their own.
+"""
+
+import logging
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Iterable
+
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import AsyncSessionFactory
+from app.email_finder.pattern_guesser import build_email, classify, normalize_prior, rank_patterns
+from app.models import Company, EmailPattern, GenerationJob, Lead
+from app.utils.domains import registrable_domain
+
+logger = logging.getLogger(__name__)
+
+MAX_SAMPLES = 50
+DOMAIN, TLD, INDUSTRY = "domain", "tld", "industry"
+
+
+@dataclass(slots=True)
+class PatternSuggestion:
+    email: str
+    pattern: str
+    probability: float
+    # Addresses observed at the domain itself
+    evidence: int
+
+
+def public_suffix(domain: str) -> str:
+    """Suffix under the registrable label ("acme.co.in" -> "co.in")."""
+    return domain.split(".", 1)[1] if "." in domain else domain
+
+
+def industry_key(industry: str | None) -> str | None:
+    key = (industry or "").strip().lower().replace(" ", "_")
+    return key or None
+
+
+def _counts(samples: dict[str, list[str]]) -> dict[str, float]:
+    counts: dict[str, float] = defaultdict(float)
+    for patterns in samples.values():
+        for name in patterns:
+            # An address matching several patterns splits its vote.
+            counts[name] += 1 / len(patterns)
+    return dict(counts)
+
+
+def _upsert(rows: list[dict]):
+    stmt = pg_insert(EmailPattern.__table__).values(rows)
+    return stmt.on_conflict_do_update(
+        index_elements=["scope", "key"],
+        set_={
+            "counts": stmt.excluded.counts,
+            "samples": stmt.excluded.samples,
+            "total": stmt.excluded.total,
+            "updated_at": stmt.excluded.updated_at,
+        },
+    )
+
+
+def is_evidence(contact: dict) -> bool:
+    """Whether a stored contact shows a real address pattern.
+
+    Provider-returned addresses count. A pattern guess counts only once an
+    SMTP server accepted it: an MX-only "valid" holds for any address at the
+    domain, so learning from it would let guesses confirm themselves.
+    """
+    if not (contact.get("email") and contact.get("first_name") and contact.get("last_name")):
+        return False
+    return contact.get("source") != "pattern" or contact.get("verification") == "smtp_accepted"
+
+
+class PatternStore:
+    async def observe(self, observations: Iterable[tuple[str, str | None, str | None]]) -> int:
+        """Record (email, first_name, last_name) evidence; returns the number of new samples."""
+        new: dict[str, dict[str, list[str]]] = defaultdict(dict)
+        for email, first, last in observations:
+            email = (email or "").strip().lower()
+            if "@" not in email:
+                continue
+            local, host = email.rsplit("@", 1)
+            domain = registrable_domain(host)
+            patterns = classify(local, first, last)
+            if domain and patterns:
+                new[domain][email] = patterns
+        if not new:
+            return 0
+
+        async with AsyncSessionFactory() as session:
+            existing = {
+                row.key: row
+                for row in (
+                    await session.scalars(
+                        select(EmailPattern).where(EmailPattern.scope == DOMAIN, EmailPattern.key.in_(list(new)))
+                    )
+                ).all()
+            }
+            rows = []
+            added = 0
+            for domain, found in new.items():
+                samples = dict(existing[domain].samples or {}) if domain in existing else {}
+                before = len(samples)
+                for email, patterns in found.items():
+                    if email not in samples and len(samples) < MAX_SAMPLES:
+                        samples[email] = patterns
+                if len(samples) == before and domain in existing:
+                    continue
+                added += len(samples) - before
+                rows.append(
+                    {
+                        "scope": DOMAIN,
+                        "key": domain,
+                        "counts": _counts(samples),
+                        "samples": samples,
+                        "total": len(samples),
+                        "updated_at": datetime.utcnow(),
+                    }
+                )
+            if rows:
+                await session.execute(_upsert(rows))
+                await session.commit()
+        return added
+
+    async def suggest(
+        self,
+        domain: str,
+        first_name: str | None,
+        last_name: str | None,
+        industry: str | None = None,
+        limit: int = 5,
+    ) -> list[PatternSuggestion]:
+        """Ranked addresses for a person at ``domain`` from the domain's evidence and its priors."""
+        domain = registrable_domain(domain) or ""
+        if not domain or not build_email("first", first_name, last_name, domain):
+            return []
+        keys = [(DOMAIN, domain), (TLD, public_suffix(domain))]
+        if industry_key(industry):
+            keys.append((INDUSTRY, industry_key(industry)))
+        async with AsyncSessionFactory() as session:
+            rows = {
+                (r.scope, r.key): r
+                for r in (
+                    await session.scalars(
+                        select(EmailPattern).where(tuple_(EmailPattern.scope, EmailPattern.key).in_(keys))
+                    )
+                ).all()
+            }
+
+        own = rows.get((DOMAIN, domain))
+        # The more specific prior wins: industry, then TLD, then the built-in default.
+        prior_row = rows.get((INDUSTRY, industry_key(industry))) if industry_key(industry) else None
+        prior_row = prior_row or rows.get((TLD, public_suffix(domain)))
+        ranked = rank_patterns(own.counts if own else None, normalize_prior(prior_row.counts if prior_row else None))
+        evidence = own.total if own else 0
+        suggestions = []
+        for pattern, probability in ranked[:limit]:
+            email = build_email(pattern, first_name, last_name, domain)
+            if email:
+                suggestions.append(PatternSuggestion(email, pattern, probability, evidence))
+        return suggestions
+
+    async def learn_from_contacts(self, batch_size: int = 1000) -> int:
+        """Add the named contacts stored on companies as evidence, then rebuild priors."""
+        added = 0
+        async with AsyncSessionFactory() as session:
+            result = await session.stream(select(Company.contacts).where(Company.contacts.is_not(None)))
+            async for batch in result.partitions(batch_size):
+                added += await self.observe(
+                    (c["email"], c["first_name"], c["last_name"])
+                    for (contacts,) in batch
+                    for c in contacts or []
+                    if isinstance(c, dict) and is_evidence(c)
+                )
+        async with AsyncSessionFactory() as session:
+            await self.rebuild_priors(session)
+        return added
+
+    async def rebuild_priors(self, session: AsyncSession) -> None:
+        """Recompute the TLD and industry rows from the domain rows."""
+        domains = (await session.execute(select(EmailPattern.key, EmailPattern.counts).where(EmailPattern.scope == DOMAIN))).all()
+        industry_rows = await session.execute(
+            select(Lead.company_domain, func.max(func.coalesce(Company.industry, GenerationJob.industry)))
+            .join(GenerationJob, GenerationJob.id == Lead.job_id)
+            .outerjoin(Company, Company.id == Lead.company_id)
+            .where(Lead.company_domain.in_(select(EmailPattern.key).where(EmailPattern.scope == DOMAIN)))
+            .group_by(Lead.company_domain)
+        )
+        industry_of = {d: industry_key(i) for d, i in industry_rows.all() if industry_key(i)}
+
+        priors: dict[tuple[str, str], dict[str, float]] = defaultdict(lambda: defaultdict(float))
+        sizes: dict[tuple[str, str], int] = defaultdict(int)
+        for domain, counts in domains:
+            total = sum((counts or {}).values())
+            if not total:
+                continue
+            # Every domain gets one vote, split by its pattern shares, so big domains do not dominate.
+            scopes = [(TLD, public_suffix(domain))]
+            if domain in industry_of:
+                scopes.append((INDUSTRY, industry_of[domain]))
+            for scope in scopes:
+                sizes[scope] += 1
+                for name, count in counts.items():
+                    priors[scope][name] += count / total
+
+        now = datetime.utcnow()
+        rows = [
+            {"scope": scope, "key": key, "counts": dict(counts), "samples": {}, "total": sizes[(scope, key)], "updated_at": now}
+            for (scope, key), counts in priors.items()
+        ]
+        for start in range(0, len(rows), 1000):
+            await session.execute(_upsert(rows[start : start + 1000]))
+        await session.commit()
@@ -0,0 +1,113 @@
+"""Learned provider hit rates (``email_provider_stats``) and the waterfall order.
+
+Every paid provider lookup the finder makes is recorded as an attempt
+under the domain's TLD, the company's industry and overall. It counts as
+a hit when it produced a verified address. A provider's expected hit rate
+for a new domain is the smoothed TLD and industry rates. Each of those is
+pulled toward the provider's overall rate until it has enough attempts of
+its own. ``order`` ranks providers by expected hits per credit.
+"""
+
+import logging
+from collections import defaultdict
+from datetime import datetime
+from typing import Iterable, Mapping
+
+from sqlalchemy import select, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.database import AsyncSessionFactory
+from app.email_finder.pattern_store import INDUSTRY, TLD, industry_key, public_suffix
+from app.models import EmailProviderStat
+
+logger = logging.getLogger(__name__)
+
+ALL = "all"
+# Weight of the overall rate, in attempts, for a TLD or industry with few attempts of its own.
+PRIOR_STRENGTH = 10.0
+# Overall rate assumed for a provider with no attempts at all, and its weight in attempts.
+DEFAULT_HIT_RATE = 0.5
+DEFAULT_STRENGTH = 2.0
+
+
+def _scopes(domain: str, industry: str | None) -> list[tuple[str, str]]:
+    scopes = [(ALL, "*"), (TLD, public_suffix(domain))]
+    if industry_key(industry):
+        scopes.append((INDUSTRY, industry_key(industry)))
+    return scopes
+
+
+def _smoothed(hits: float, attempts: float, prior: float, strength: float) -> float:
+    return (hits + strength * prior) / (attempts + strength)
+
+
+class ProviderStats:
+    async def hit_rates(self, providers: Iterable[str], domain: str, industry: str | None = None) -> dict[str, float]:
+        """Expected share of lookups at ``domain`` that each provider answers with a verified address."""
+        providers = list(providers)
+        scopes = _scopes(domain, industry)
+        async with AsyncSessionFactory() as session:
+            rows = (
+                await session.scalars(
+                    select(EmailProviderStat).where(
+                        EmailProviderStat.provider.in_(providers),
+                        tuple_(EmailProviderStat.scope, EmailProviderStat.key).in_(scopes),
+                    )
+                )
+            ).all()
+        found = {(r.provider, r.scope): r for r in rows}
+
+        rates = {}
+        for provider in providers:
+            overall = found.get((provider, ALL))
+            prior = (
+                _smoothed(overall.hits, overall.attempts, DEFAULT_HIT_RATE, DEFAULT_STRENGTH)
+                if overall
+                else DEFAULT_HIT_RATE
+            )
+            estimates = []
+            for scope, _ in scopes[1:]:
+                row = found.get((provider, scope))
+                estimates.append(_smoothed(row.hits, row.attempts, prior, PRIOR_STRENGTH) if row else prior)
+            rates[provider] = sum(estimates) / len(estimates)
+        return rates
+
+    async def order(
+        self, providers: Iterable[str], costs: Mapping[str, float], domain: str, industry: str | None = None
+    ) -> list[str]:
+        """``providers`` by expected hits per credit, best first."""
+        providers = list(providers)
+        try:
+            rates = await self.hit_rates(providers, domain, industry)
+        except Exception as exc:
+            logger.warning("Provider hit rates unavailable for %s: %s", domain, exc)
+            return providers
+        # sorted() is stable, so ties keep the caller's order.
+        return sorted(providers, key=lambda p: rates[p] / max(costs.get(p, 1.0), 1e-6), reverse=True)
+
+    async def record(self, domain: str, industry: str | None, outcomes: Mapping[str, bool]) -> None:
+        """Add one attempt per provider in ``outcomes``; True counts as a hit."""
+        if not outcomes:
+            return
+        now = datetime.utcnow()
+        totals: dict[tuple[str, str, str], list[int]] = defaultdict(lambda: [0, 0])
+        for provider, hit in outcomes.items():
+            for scope, key in _scopes(domain, industry):
+                totals[(provider, scope, key)][0] += 1
+                totals[(provider, scope, key)][1] += int(hit)
+        rows = [
+            {"provider": p, "scope": s, "key": k, "attempts": a, "hits": h, "updated_at": now}
+            for (p, s, k), (a, h) in totals.items()
+        ]
+        stmt = pg_insert(EmailProviderStat.__table__).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["provider", "scope", "key"],
+            set_={
+                "attempts": EmailProviderStat.__table__.c.attempts + stmt.excluded.attempts,
+                "hits": EmailProviderStat.__table__.c.hits + stmt.excluded.hits,
+                "updated_at": stmt.excluded.updated_at,
+            },
+        )
+        async with AsyncSessionFactory() as session:
+            await session.execute(stmt)
+            await session.commit()
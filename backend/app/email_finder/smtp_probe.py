@@ -0,0 +1,223 @@
+"""SMTP mailbox probing (RCPT TO without sending mail).
+
+Addresses are grouped by their domain's primary MX host and each host gets
+one SMTP session. The session sends one ``MAIL FROM`` and up to
+``smtp_probe_max_rcpt_per_session`` recipients, then ``RSET``s and keeps
+going on the same connection. ``RCPT`` commands to each host are paced by
+``smtp_probe_rpm_per_mx``.
+
+Before probing a domain, one random local part is tested. If it is accepted,
+the domain is catch-all: it accepts any address, so its addresses are
+reported as ``catch_all`` without probing them. The catch-all verdict is
+cached for ``smtp_catch_all_ttl_seconds``.
+
+Setting ``smtp_probe_host`` sends every session to that host instead of the
+real MX, e.g. the local stand-in in ``scripts/smtp_standin.py``.
+"""
+
+import asyncio
+import logging
+import uuid
+import weakref
+
+from app.config import get_settings
+from app.email_finder.dns_cache import get_mx_resolver
+from app.utils.cache import JsonCache
+from app.utils.rate_limiter import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+DELIVERABLE = "deliverable"
+UNDELIVERABLE = "undeliverable"
+CATCH_ALL = "catch_all"
+UNKNOWN = "unknown"
+
+
+class SmtpProbeError(Exception):
+    pass
+
+
+class _SmtpSession:
+    """Minimal SMTP client: greeting, EHLO/HELO, MAIL FROM, RCPT TO, RSET, QUIT."""
+
+    def __init__(self, host: str, port: int, timeout: float, helo: str, mail_from: str, max_rcpt: int) -> None:
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.helo = helo
+        self.mail_from = mail_from
+        self.max_rcpt = max_rcpt
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._rcpts = -1  # -1: no transaction open
+
+    async def open(self) -> None:
+        self._reader, self._writer = await asyncio.wait_for(
+            asyncio.open_connection(self.host, self.port), self.timeout
+        )
+        code, text = await self._reply()
+        if code != 220:
+            raise SmtpProbeError(f"{self.host} greeting {code} {text}")
+        code, _ = await self._command(f"EHLO {self.helo}")
+        if code != 250:
+            code, text = await self._command(f"HELO {self.helo}")
+            if code != 250:
+                raise SmtpProbeError(f"{self.host} HELO {code} {text}")
+
+    async def _reply(self) -> tuple[int, str]:
+        assert self._reader is not None
+        lines = []
+        while True:
+            raw = await asyncio.wait_for(self._reader.readline(), self.timeout)
+            if not raw:
+                raise SmtpProbeError(f"{self.host} closed the connection")
+            line = raw.decode("utf-8", "replace").rstrip("\r\n")
+            lines.append(line[4:])
+            if len(line) < 4 or line[3] != "-":
+                break
+        try:
+            return int(line[:3]), " ".join(lines)
+        except ValueError:
+            raise SmtpProbeError(f"{self.host} sent a malformed reply: {line!r}") from None
+
+    async def _command(self, line: str) -> tuple[int, str]:
+        assert self._writer is not None
+        self._writer.write(line.encode("utf-8") + b"\r\n")
+        await self._writer.drain()
+        return await self._reply()
+
+    async def rcpt(self, address: str) -> int:
+        """SMTP reply code for ``RCPT TO:<address>``."""
+        if self._rcpts >= self.max_rcpt:
+            await self._command("RSET")
+            self._rcpts = -1
+        if self._rcpts < 0:
+            code, text = await self._command(f"MAIL FROM:<{self.mail_from}>")
+            if code != 250:
+                raise SmtpProbeError(f"{self.host} MAIL FROM {code} {text}")
+            self._rcpts = 0
+        code, _ = await self._command(f"RCPT TO:<{address}>")
+        self._rcpts += 1
+        if code == 421:
+            raise SmtpProbeError(f"{self.host} closed the session (421)")
+        return code
+
+    async def close(self) -> None:
+        if self._writer is None:
+            return
+        try:
+            await asyncio.wait_for(self._command("QUIT"), self.timeout)
+        except Exception:
+            pass
+        self._writer.close()
+        try:
+            await self._writer.wait_closed()
+        except Exception:
+            pass
+        self._writer = None
+
+
+def _verdict(code: int) -> str:
+    if 200 <= code < 300:
+        return DELIVERABLE
+    if code in (550, 551, 553):
+        return UNDELIVERABLE
+    # 4xx (greylisting, rate limits) and policy rejections say nothing about the mailbox.
+    return UNKNOWN
+
+
+class SmtpProber:
+    def __init__(self) -> None:
+        settings = get_settings()
+        self.port = settings.smtp_probe_port
+        self.host_override = settings.smtp_probe_host.strip()
+        self.timeout = settings.smtp_probe_timeout_seconds
+        self.helo = settings.smtp_probe_helo
+        self.mail_from = settings.smtp_probe_mail_from
+        self.max_rcpt = max(1, settings.smtp_probe_max_rcpt_per_session)
+        self.rpm_per_mx = settings.smtp_probe_rpm_per_mx
+        self.catch_all_ttl = settings.smtp_catch_all_ttl_seconds
+        self._sessions = asyncio.Semaphore(max(1, settings.smtp_probe_concurrency))
+        self._host_locks: dict[str, asyncio.Lock] = {}
+        self._limiters: dict[str, RateLimiter] = {}
+        self._catch_all = JsonCache("smtp-catch-all")
+        self.stats = {"sessions": 0, "rcpt": 0, "catch_all_checks": 0}
+
+    async def probe_many(self, emails: list[str]) -> dict[str, str]:
+        """Probe verdict per lowercased address (deliverable, undeliverable, catch_all or unknown)."""
+        by_domain: dict[str, list[str]] = {}
+        for email in dict.fromkeys(e.strip().lower() for e in emails if e and "@" in e):
+            by_domain.setdefault(email.rsplit("@", 1)[1], []).append(email)
+        results = {e: UNKNOWN for addresses in by_domain.values() for e in addresses}
+
+        resolver = get_mx_resolver()
+        mx = await asyncio.gather(*(resolver.mx_hosts(d) for d in by_domain))
+        # Domains served by the same mail exchangers share one session.
+        by_hosts: dict[tuple[str, ...], dict[str, list[str]]] = {}
+        for (domain, addresses), hosts in zip(by_domain.items(), mx):
+            if not hosts:
+                continue
+            if self.host_override:
+                hosts = (self.host_override,)
+            by_hosts.setdefault(hosts, {})[domain] = addresses
+
+        await asyncio.gather(*(self._probe_hosts(hosts, domains, results) for hosts, domains in by_hosts.items()))
+        return results
+
+    async def probe(self, email: str) -> str:
+        return (await self.probe_many([email])).get(email.strip().lower(), UNKNOWN)
+
+    async def _probe_hosts(self, hosts: tuple[str, ...], domains: dict[str, list[str]], results: dict[str, str]) -> None:
+        pending = {d: list(a) for d, a in domains.items()}
+        async with self._sessions:
+            # Preferred MX first; a host that cannot be reached hands the rest to the next one.
+            for host in hosts:
+                if not pending:
+                    return
+                lock = self._host_locks.setdefault(host, asyncio.Lock())
+                async with lock:
+                    try:
+                        await self._session(host, pending, results)
+                    except (OSError, asyncio.TimeoutError, SmtpProbeError) as exc:
+                        logger.info("SMTP probe via %s stopped: %s", host, exc)
+
+    async def _session(self, host: str, pending: dict[str, list[str]], results: dict[str, str]) -> None:
+        limiter = self._limiters.setdefault(host, RateLimiter(self.rpm_per_mx))
+        session = _SmtpSession(host, self.port, self.timeout, self.helo, self.mail_from, self.max_rcpt)
+        try:
+            await session.open()
+            self.stats["sessions"] += 1
+            for domain in list(pending):
+                catch_all = await self._catch_all.get(domain)
+                if catch_all is None:
+                    await limiter.wait()
+                    self.stats["catch_all_checks"] += 1
+                    verdict = _verdict(await session.rcpt(f"{uuid.uuid4().hex[:16]}@{domain}"))
+                    if verdict != UNKNOWN:
+                        catch_all = verdict == DELIVERABLE
+                        await self._catch_all.set(domain, catch_all, self.catch_all_ttl)
+                if catch_all:
+                    for address in pending.pop(domain):
+                        results[address] = CATCH_ALL
+                    continue
+                addresses = pending[domain]
+                while addresses:
+                    await limiter.wait()
+                    self.stats["rcpt"] += 1
+                    results[addresses[-1]] = _verdict(await session.rcpt(addresses[-1]))
+                    addresses.pop()
+                del pending[domain]
+        finally:
+            await session.close()
+
+
+_probers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, SmtpProber]" = weakref.WeakKeyDictionary()
+
+
+def get_smtp_prober() -> SmtpProber:
+    """Prober for the running event loop (its locks and pacing are loop-bound)."""
+    loop = asyncio.get_running_loop()
+    prober = _probers.get(loop)
+    if prober is None:
+        prober = _probers[loop] = SmtpProber()
+    return prober
@@ -1,10 +1,13 @@
 """Snov.io API client for email discovery."""
 
+import asyncio
 from typing import Any
 
 import httpx
 
 from app.config import get_settings
+from app.email_finder.cache import get_domain_search_cache
+from app.email_finder.http import provider_client, provider_limiter
 
 
 class SnovClient:
@@ -14,6 +17,8 @@ class SnovClient:
         settings = get_settings()
         self.api_key = (settings.snov_api_key or "").strip()
         self.timeout = settings.request_timeout_seconds
+        # Bounds each API exchange; time spent waiting for the rate limiter is not counted.
+        self.call_timeout = settings.email_provider_timeout_seconds
 
     def _has_key(self) -> bool:
         return bool(self.api_key)
@@ -22,23 +27,36 @@ class SnovClient:
         self,
         domain: str,
         limit: int = 10,
+        client: httpx.AsyncClient | None = None,
+        raise_errors: bool = False,
     ) -> list[dict[str, Any]]:
-        """Get emails for domain via Snov domain search."""
+        """Get emails for domain via Snov domain search.
+
+        Failed requests return [] unless ``raise_errors`` is set.
+        """
         if not self._has_key() or not (domain or "").strip():
             return []
 
+        async def fetch(n: int) -> list[dict[str, Any]]:
+            await provider_limiter("snov").wait()
+            async with provider_client(client, self.timeout) as http, asyncio.timeout(self.call_timeout):
+                return await self._domain_search(http, domain.strip(), n)
+
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                r = await client.post(
-                    f"{self.BASE_URL}/get-domain-emails-with-info",
-                    params={"access_token": self.api_key},
-                    json={"domain": domain.strip()},
-                )
-                r.raise_for_status()
-                data = r.json()
+            return await get_domain_search_cache().lookup("snov", domain, limit, fetch)
         except Exception:
+            if raise_errors:
+                raise
             return []
 
+    async def _domain_search(self, http: httpx.AsyncClient, domain: str, limit: int) -> list[dict[str, Any]]:
+        r = await http.post(
+            f"{self.BASE_URL}/get-domain-emails-with-info",
+            params={"access_token": self.api_key},
+            json={"domain": domain},
+        )
+        r.raise_for_status()
+        data = r.json()
         emails = data if isinstance(data, list) else data.get("emails") or data.get("data") or []
         result: list[dict[str, Any]] = []
         for e in emails[:limit]:
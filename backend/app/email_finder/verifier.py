@@ -1,9 +1,14 @@
 """Email verification: MX check, disposable/free-provider tagging."""
 
+import asyncio
 import re
 from dataclasses import dataclass
 from typing import Optional, Set
 
+from app.config import get_settings
+from app.email_finder.dns_cache import get_mx_resolver
+from app.email_finder.smtp_probe import CATCH_ALL, DELIVERABLE, UNDELIVERABLE, UNKNOWN, get_smtp_prober
+
 DISPOSABLE_DOMAINS: Set[str] = {
     "tempmail.com", "guerrillamail.com", "mailinator.com", "throwaway.email",
     "10minutemail.com", "temp-mail.org", "fakeinbox.com", "trashmail.com",
@@ -27,11 +32,25 @@ class VerificationResult:
 
 
 class EmailVerifier:
-    """Verify email deliverability via MX records and heuristics."""
+    """Verify email deliverability via MX records and heuristics.
+
+    With ``smtp_probe_enabled`` addresses that pass the MX check are also
+    probed over SMTP (free providers excepted, they do not answer probes).
+    """
 
     EMAIL_REGEX = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
 
+    def __init__(self) -> None:
+        self.smtp_probe = get_settings().smtp_probe_enabled
+
     async def verify(self, email: str) -> VerificationResult:
+        result = await self._check(email)
+        if self.smtp_probe and self._probeable(result):
+            verdict = await get_smtp_prober().probe(email)
+            result = self._apply_probe(result, verdict)
+        return result
+
+    async def _check(self, email: str) -> VerificationResult:
         if not email or "@" not in email:
             return VerificationResult(status="invalid", reason="malformed", confidence=0)
 
@@ -54,6 +73,9 @@ class EmailVerifier:
             )
 
         mx_valid = await self._check_mx(domain)
+        if mx_valid is None:
+            # The resolver timed out or failed; that says nothing about the address.
+            return VerificationResult(status="unknown", reason="dns_error", confidence=0)
         if not mx_valid:
             return VerificationResult(
                 status="invalid",
@@ -77,16 +99,42 @@ class EmailVerifier:
             mx_valid=True,
         )
 
-    async def _check_mx(self, domain: str) -> bool:
-        """Check if domain has MX records."""
-        try:
-            import dns.resolver
-            answers = dns.resolver.resolve(domain, "MX")
-            return len(answers) > 0
-        except Exception:
-            try:
-                import socket
-                socket.getaddrinfo(domain, None)
-                return True
-            except Exception:
-                return False
+    async def verify_many(self, emails: list[str]) -> list[VerificationResult]:
+        """Verify a batch, resolving each distinct domain once; results align with ``emails``."""
+        domains = {
+            e.strip().lower().split("@", 1)[1]
+            for e in emails
+            if e and "@" in e and self.EMAIL_REGEX.match(e.strip().lower())
+        }
+        domains -= DISPOSABLE_DOMAINS
+        # Warm the shared MX cache (concurrency is bounded by the resolver); _check() then hits it.
+        await asyncio.gather(*(self._check_mx(d) for d in domains))
+        results = [await self._check(e) for e in emails]
+        if self.smtp_probe:
+            targets = [e for e, r in zip(emails, results) if self._probeable(r)]
+            if targets:
+                # One SMTP session per mail host covers every address it serves.
+                verdicts = await get_smtp_prober().probe_many(targets)
+                results = [
+                    self._apply_probe(r, verdicts.get(e.strip().lower(), UNKNOWN)) if self._probeable(r) else r
+                    for e, r in zip(emails, results)
+                ]
+        return results
+
+    @staticmethod
+    def _probeable(result: VerificationResult) -> bool:
+        return result.status == "valid" and not result.is_free_provider
+
+    @staticmethod
+    def _apply_probe(result: VerificationResult, verdict: str) -> VerificationResult:
+        if verdict == DELIVERABLE:
+            return VerificationResult(status="valid", reason="smtp_accepted", confidence=95, mx_valid=True)
+        if verdict == UNDELIVERABLE:
+            return VerificationResult(status="invalid", reason="smtp_rejected", confidence=5, mx_valid=True)
+        if verdict == CATCH_ALL:
+            return VerificationResult(status="catch_all", reason="catch_all_domain", confidence=50, mx_valid=True)
+        return result
+
+    async def _check_mx(self, domain: str) -> bool | None:
+        """Check if domain can receive mail (MX, or an A/AAAA record as implicit MX); None if DNS failed."""
+        return await get_mx_resolver().mail_host_status(domain)
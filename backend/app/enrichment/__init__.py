@@ -1,4 +1,5 @@
 from app.enrichment.company_enricher import CompanyEnricher
 from app.enrichment.contact_enricher import ContactEnricher
+from app.enrichment.tech_detector import TechDetector
 
-__all__ = ["CompanyEnricher", "ContactEnricher"]
+__all__ = ["CompanyEnricher", "ContactEnricher", "TechDetector"]
@@ -5,6 +5,8 @@ from typing import Any
 import httpx
 
 from app.config import get_settings
+from app.enrichment.tech_detector import TechDetector
+from app.utils.domains import registrable_domain
 
 
 class CompanyEnricher:
@@ -14,11 +16,12 @@ class CompanyEnricher:
         settings = get_settings()
         self.clearbit_key = (getattr(settings, "clearbit_api_key", None) or "").strip()
         self.timeout = getattr(settings, "request_timeout_seconds", 20)
+        self.tech_detector = TechDetector()
 
     async def enrich(self, company: dict[str, Any]) -> dict[str, Any]:
         """Merge enrichment data into company dict."""
         enriched = dict(company)
-        domain = enriched.get("company_domain") or _domain_from_website(enriched.get("company_website"))
+        domain = registrable_domain(enriched.get("company_domain") or enriched.get("company_website"))
 
         if not domain:
             return enriched
@@ -33,6 +36,12 @@ class CompanyEnricher:
                     enriched["employee_count"] = c.get("metrics", {}).get("employees") or enriched.get("employee_count")
                     enriched["description"] = c.get("description") or enriched.get("description")
 
+        if not enriched.get("technologies"):
+            technologies = await self.tech_detector.detect(enriched.get("company_website") or domain)
+            if technologies:
+                enriched["technologies"] = technologies
+                enriched.setdefault("raw_data", {})["technologies"] = technologies
+
         return enriched
 
     async def _clearbit_enrich(self, domain: str) -> dict | None:
@@ -47,10 +56,3 @@ class CompanyEnricher:
         except Exception:
             pass
         return None
-
-
-def _domain_from_website(url: str | None) -> str | None:
-    if not url:
-        return None
-    from urllib.parse import urlparse
-    return urlparse(url).netloc.replace("www.", "") or None
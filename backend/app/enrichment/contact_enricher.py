@@ -4,6 +4,7 @@ from typing import Any
 
 from app.email_finder.finder_engine import EmailFinderEngine
 from app.email_finder.verifier import EmailVerifier
+from app.utils.domains import registrable_domain
 
 
 class ContactEnricher:
@@ -16,7 +17,7 @@ class ContactEnricher:
     async def enrich(self, contact: dict[str, Any]) -> dict[str, Any]:
         """Find and verify email, merge into contact."""
         enriched = dict(contact)
-        domain = enriched.get("company_domain") or _domain_from_url(enriched.get("company_website"))
+        domain = registrable_domain(enriched.get("company_domain") or enriched.get("company_website"))
         if not domain:
             return enriched
 
@@ -28,10 +29,11 @@ class ContactEnricher:
             first_name=first,
             last_name=last,
             limit=3,
+            industry=enriched.get("industry"),
         )
 
-        for c in candidates:
-            verdict = await self.verifier.verify(c.email)
+        verdicts = await self.verifier.verify_many([c.email for c in candidates])
+        for c, verdict in zip(candidates, verdicts):
             if verdict.status == "valid":
                 enriched["contact_email"] = c.email
                 enriched["company_email"] = c.email
@@ -51,10 +53,3 @@ class ContactEnricher:
             enriched["email_verified"] = False
 
         return enriched
-
-
-def _domain_from_url(url: str | None) -> str | None:
-    if not url:
-        return None
-    from urllib.parse import urlparse
-    return urlparse(url).netloc.replace("www.", "") or None
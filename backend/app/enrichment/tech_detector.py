@@ -1,5 +1,201 @@
+"""Technology fingerprinting from HTML, script URLs, cookies and response headers."""
+
+import asyncio
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Iterable
+
+import httpx
+
+from app.config import get_settings
+from app.data.tech_signatures import TECH_SIGNATURES
+from app.utils.user_agent_rotator import UserAgentRotator
+
+PARTS = ("html", "script", "cookies", "headers", "header_values")
+
+# Cookie and header tokens are anchored to the start of a line.
+_LINE_ANCHORED = {"cookies", "headers"}
+
+_SCRIPT_SRC_RE = re.compile(r"""<script\b[^>]*?\bsrc\s*=\s*["']?([^"'\s>]+)""", re.IGNORECASE)
+
+
+@dataclass
+class PageSnapshot:
+    """Parts of a fetched page that signatures are matched against."""
+
+    url: str | None = None
+    html: str = ""
+    headers: dict[str, str] = field(default_factory=dict)
+    cookies: list[str] = field(default_factory=list)
+    script_urls: list[str] | None = None
+
+
+def _trie_pattern(tokens: Iterable[str]) -> str:
+    """Build a prefix-factored alternation so each text position is tested once against all tokens."""
+    trie: dict[str, Any] = {}
+    for token in tokens:
+        node = trie
+        for ch in token:
+            node = node.setdefault(ch, {})
+        node[""] = True
+    return _node_pattern(trie)
+
+
+def _node_pattern(node: dict[str, Any]) -> str:
+    branches = [re.escape(ch) + _node_pattern(child) for ch, child in sorted(node.items()) if ch]
+    if not branches:
+        return ""
+    body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    if "" in node:
+        return f"(?:{body})?"
+    return body
+
+
+class SignatureIndex:
+    """One compiled multi-token pattern per page part, mapping each matched token back to technologies.
+
+    The pattern is a lookahead, so it is tried at every position and overlapping tokens are all
+    found. At one position it reports only the longest token. Every token's technologies therefore
+    include those of the tokens that are prefixes of it.
+    """
+
+    def __init__(self, signatures: dict[str, dict[str, Any]]):
+        self.implies: dict[str, list[str]] = {
+            name: list(sig.get("implies") or []) for name, sig in signatures.items()
+        }
+        self.categories: dict[str, str] = {
+            name: sig.get("category", "other") for name, sig in signatures.items()
+        }
+        self.patterns: dict[str, re.Pattern[str] | None] = {}
+        self.token_map: dict[str, dict[str, list[str]]] = {}
+
+        for part in PARTS:
+            token_map: dict[str, list[str]] = {}
+            for name, sig in signatures.items():
+                for token in sig.get(part) or []:
+                    token = token.lower()
+                    if part in _LINE_ANCHORED:
+                        token = "\n" + token
+                    token_map.setdefault(token, []).append(name)
+            self.token_map[part] = {
+                token: sorted({n for other, names in token_map.items() if token.startswith(other) for n in names})
+                for token in token_map
+            }
+            self.patterns[part] = re.compile(f"(?=({_trie_pattern(token_map)}))") if token_map else None
+
+    def _scan(self, part: str, haystack: str, found: set[str]) -> None:
+        pattern = self.patterns[part]
+        if pattern is None or not haystack:
+            return
+        token_map = self.token_map[part]
+        for m in pattern.finditer(haystack):
+            found.update(token_map.get(m.group(1), ()))
+
+    def match(self, page: PageSnapshot, max_html_chars: int) -> set[str]:
+        html = (page.html or "")[:max_html_chars].lower()
+        script_urls = page.script_urls
+        if script_urls is None:
+            script_urls = _SCRIPT_SRC_RE.findall(html)
+
+        found: set[str] = set()
+        self._scan("html", html, found)
+        self._scan("script", "\n".join(script_urls).lower(), found)
+        self._scan("cookies", "\n" + "\n".join(page.cookies).lower(), found)
+        header_lines = "\n" + "\n".join(f"{k}: {v}" for k, v in page.headers.items()).lower()
+        self._scan("headers", header_lines, found)
+        self._scan("header_values", header_lines, found)
+
+        pending = list(found)
+        while pending:
+            for implied in self.implies.get(pending.pop(), ()):
+                if implied not in found:
+                    found.add(implied)
+                    pending.append(implied)
+        return found
+
+
+@lru_cache
+def get_signature_index() -> SignatureIndex:
+    return SignatureIndex(TECH_SIGNATURES)
+
+
 class TechDetector:
+    """Detect the technology stack of a website from a single homepage fetch."""
+
+    MAX_HTML_CHARS = 512_000
+
+    def __init__(self, index: SignatureIndex | None = None, concurrency: int = 20):
+        settings = get_settings()
+        self.index = index or get_signature_index()
+        self.timeout = settings.request_timeout_seconds
+        self.concurrency = concurrency
+
+    def classify(self, page: PageSnapshot) -> list[str]:
+        """Return sorted technology names detected on an already-fetched page."""
+        return sorted(self.index.match(page, self.MAX_HTML_CHARS))
+
+    def classify_batch(self, pages: Iterable[PageSnapshot]) -> list[list[str]]:
+        """Classify many fetched pages; CPU-only, safe to run in a worker thread or process."""
+        return [self.classify(page) for page in pages]
+
     async def detect(self, website: str | None) -> list[str]:
         if not website:
             return []
-        return []
+        async with self._client() as client:
+            page = await self._fetch(client, website)
+        return self.classify(page) if page else []
+
+    async def detect_many(self, websites: Iterable[str], concurrency: int | None = None) -> dict[str, list[str]]:
+        """Fetch and classify websites concurrently over one shared HTTP client.
+
+        Returns a mapping of website -> technologies; unreachable sites map to [].
+        """
+        unique = list(dict.fromkeys(w for w in websites if w))
+        semaphore = asyncio.Semaphore(concurrency or self.concurrency)
+
+        async with self._client() as client:
+
+            async def _bounded(website: str) -> PageSnapshot | None:
+                async with semaphore:
+                    return await self._fetch(client, website)
+
+            pages = await asyncio.gather(*[_bounded(w) for w in unique])
+
+        fetched = [(w, p) for w, p in zip(unique, pages) if p is not None]
+        results = self.classify_batch(p for _, p in fetched)
+        out = {w: [] for w in unique}
+        out.update({w: techs for (w, _), techs in zip(fetched, results)})
+        return out
+
+    def _client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            timeout=self.timeout,
+            follow_redirects=True,
+            headers={
+                "User-Agent": UserAgentRotator.get_random(),
+                "Accept": "text/html,application/xhtml+xml",
+            },
+        )
+
+    async def _fetch(self, client: httpx.AsyncClient, website: str) -> PageSnapshot | None:
+        url = website if website.startswith(("http://", "https://")) else f"https://{website}"
+        try:
+            response = await client.get(url)
+        except httpx.HTTPError:
+            return None
+        if response.status_code >= 400:
+            return None
+
+        content_type = response.headers.get("content-type", "")
+        html = response.text if "html" in content_type or not content_type else ""
+        cookie_names = list(response.cookies.keys())
+        for history in response.history:
+            cookie_names.extend(history.cookies.keys())
+
+        return PageSnapshot(
+            url=str(response.url),
+            html=html,
+            headers={k: v for k, v in response.headers.multi_items() if k.lower() != "set-cookie"},
+            cookies=cookie_names,
+        )
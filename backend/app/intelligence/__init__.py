@@ -1,5 +1,6 @@
 from app.intelligence.deduplicator import LeadDeduplicator
+from app.intelligence.entity_resolver import EntityResolver
 from app.intelligence.intent_detector import IntentDetector
 from app.intelligence.lead_scorer import LeadScorer
 
-__all__ = ["LeadDeduplicator", "IntentDetector", "LeadScorer"]
+__all__ = ["LeadDeduplicator", "EntityResolver", "IntentDetector", "LeadScorer"]
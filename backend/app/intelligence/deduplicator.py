@@ -1,4 +1,4 @@
-from urllib.parse import urlparse
+from app.utils.domains import registrable_domain
 
 
 def build_dedupe_key(lead: dict, source: str | None = None) -> str:
@@ -13,7 +13,7 @@ def build_dedupe_key(lead: dict, source: str | None = None) -> str:
 
     name = (lead.get("company_name") or lead.get("name") or "").strip().lower()
     website = lead.get("company_website") or lead.get("website") or ""
-    host = urlparse(website).netloc.replace("www.", "").lower() if website else ""
+    host = registrable_domain(website) or ""
     street = (lead.get("street") or lead.get("address") or "").strip().lower()
     return f"fallback:{name}|{host}|{street}"
 
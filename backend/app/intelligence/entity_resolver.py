@@ -0,0 +1,282 @@
+"""Cross-source entity resolution: block, score pairs, merge matches.
+
+Records are bucketed by blocking keys (normalized phone, website domain,
+geohash cell + name prefix, city + name prefix) and only records sharing a
+block are compared, so work grows with block sizes rather than n². Oversized
+blocks (shared switchboard numbers, directory domains) are skipped.
+"""
+
+import logging
+import math
+import re
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+from typing import Any, Iterable
+
+from app.normalizer.merger import LeadMerger
+from app.utils.domains import registrable_domain
+from app.utils.geohash import encode as geohash_encode
+
+logger = logging.getLogger(__name__)
+
+_LEGAL_SUFFIXES = {
+    "pvt", "private", "ltd", "limited", "llp", "llc", "inc", "incorporated", "co", "company",
+    "corp", "corporation", "plc", "gmbh", "the", "and", "of",
+}
+_ADDRESS_ABBREVIATIONS = {
+    "rd": "road", "st": "street", "ave": "avenue", "blvd": "boulevard", "ln": "lane",
+    "nr": "near", "opp": "opposite", "bldg": "building", "flr": "floor", "fl": "floor",
+    "no": "number", "sec": "sector", "ph": "phase",
+}
+# Hosts shared by unrelated businesses; never used as a blocking key.
+SHARED_DOMAINS = {
+    "facebook.com", "instagram.com", "linkedin.com", "twitter.com", "x.com", "youtube.com",
+    "google.com", "wordpress.com", "justdial.com", "indiamart.com", "yelp.com", "yellowpages.com",
+}
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+_NON_DIGIT = re.compile(r"\D+")
+
+# Sources ranked by how complete their records usually are; the first becomes the primary.
+SOURCE_PRIORITY = ("google_maps", "google_places", "yellow_pages", "google_search")
+
+
+def _tokens(text: str | None, drop: set[str] | None = None, expand: dict[str, str] | None = None) -> list[str]:
+    out = []
+    for tok in _NON_ALNUM.split((text or "").lower()):
+        if not tok:
+            continue
+        if expand:
+            tok = expand.get(tok, tok)
+        if drop and tok in drop:
+            continue
+        out.append(tok)
+    return out
+
+
+def name_tokens(name: str | None) -> list[str]:
+    """Lower-cased business name tokens without legal suffixes ("Pvt", "Limited", ...)."""
+    return _tokens(name, drop=_LEGAL_SUFFIXES)
+
+
+def address_tokens(address: str | None) -> list[str]:
+    """Lower-cased address tokens with common abbreviations expanded."""
+    return _tokens(address, expand=_ADDRESS_ABBREVIATIONS)
+
+
+def normalize_phone(phone: str | None) -> str | None:
+    """Last ten digits of a phone number (drops country and trunk prefixes)."""
+    digits = _NON_DIGIT.sub("", phone or "")
+    return digits[-10:] if len(digits) >= 10 else None
+
+
+def business_domain(record: dict[str, Any]) -> str | None:
+    """Website domain of a record, or None for directory/social hosts shared by many businesses."""
+    domain = registrable_domain(
+        record.get("company_domain") or record.get("company_website") or record.get("website")
+    )
+    if not domain or domain in SHARED_DOMAINS:
+        return None
+    return domain
+
+
+def _similarity(a: str, b: str) -> float:
+    if not a or not b:
+        return 0.0
+    if a == b:
+        return 1.0
+    return SequenceMatcher(None, a, b, autojunk=False).ratio()
+
+
+def _address_similarity(a: str, b: str) -> float:
+    """Similarity of normalized addresses; a shorter address contained in a longer one scores high."""
+    numbers_a = {t for t in a.split() if t.isdigit()}
+    numbers_b = {t for t in b.split() if t.isdigit()}
+    if numbers_a and numbers_b and not numbers_a & numbers_b:
+        return 0.0
+    compact_a, compact_b = a.replace(" ", ""), b.replace(" ", "")
+    if not compact_a or not compact_b:
+        return 0.0
+    matcher = SequenceMatcher(None, compact_a, compact_b, autojunk=False)
+    shorter = min(len(compact_a), len(compact_b))
+    overlap = sum(block.size for block in matcher.get_matching_blocks()) / shorter
+    return max(matcher.ratio(), overlap if shorter >= 6 else 0.0)
+
+
+def _distance_m(a: tuple[float, float], b: tuple[float, float]) -> float:
+    lat1, lon1 = map(math.radians, a)
+    lat2, lon2 = map(math.radians, b)
+    h = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    return 2 * 6_371_000 * math.asin(math.sqrt(h))
+
+
+@dataclass(slots=True)
+class _Features:
+    source: str
+    name: str
+    name_tokens: frozenset[str]
+    address: str
+    phone: str | None
+    domain: str | None
+    coords: tuple[float, float] | None
+    keys: list[str]
+
+
+class EntityResolver:
+    """Merge records describing the same business across sources."""
+
+    def __init__(
+        self,
+        max_block_size: int = 50,
+        name_threshold: float = 0.88,
+        keyed_name_threshold: float = 0.6,
+        address_threshold: float = 0.7,
+        max_distance_m: float = 250.0,
+        merger: LeadMerger | None = None,
+    ):
+        self.max_block_size = max_block_size
+        self.name_threshold = name_threshold
+        self.keyed_name_threshold = keyed_name_threshold
+        self.address_threshold = address_threshold
+        self.max_distance_m = max_distance_m
+        self.merger = merger or LeadMerger()
+
+    # -- features ------------------------------------------------------------
+
+    def _features(self, record: dict[str, Any]) -> _Features:
+        tokens = name_tokens(record.get("company_name") or record.get("name"))
+        name = " ".join(sorted(tokens))
+        address = " ".join(address_tokens(record.get("street") or record.get("address")))
+        phone = normalize_phone(record.get("company_phone") or record.get("phone"))
+        domain = business_domain(record)
+        lat, lon = record.get("latitude"), record.get("longitude")
+        coords = (float(lat), float(lon)) if lat is not None and lon is not None else None
+
+        prefix = name.replace(" ", "")[:4]
+        keys = []
+        if phone:
+            keys.append(f"p:{phone}")
+        if domain:
+            keys.append(f"d:{domain}")
+        if prefix:
+            if coords:
+                keys.append(f"g:{geohash_encode(*coords, precision=6)}:{prefix}")
+            city = " ".join(_tokens(record.get("city")))
+            if city:
+                keys.append(f"c:{city}:{prefix}")
+        return _Features(
+            source=record.get("source") or "unknown",
+            name=name,
+            name_tokens=frozenset(tokens),
+            address=address,
+            phone=phone,
+            domain=domain,
+            coords=coords,
+            keys=keys,
+        )
+
+    # -- matching ------------------------------------------------------------
+
+    def _name_similarity(self, a: _Features, b: _Features) -> float:
+        if a.name_tokens and (a.name_tokens <= b.name_tokens or b.name_tokens <= a.name_tokens):
+            return max(0.9, _similarity(a.name, b.name))
+        return _similarity(a.name, b.name)
+
+    def _same_place(self, a: _Features, b: _Features) -> bool | None:
+        """True/False when location evidence exists on both sides, None when it doesn't."""
+        if a.coords and b.coords:
+            return _distance_m(a.coords, b.coords) <= self.max_distance_m
+        if a.address and b.address:
+            return _address_similarity(a.address, b.address) >= self.address_threshold
+        return None
+
+    def is_match(self, a: _Features, b: _Features) -> bool:
+        name_sim = self._name_similarity(a, b)
+        shared_key = (a.phone and a.phone == b.phone) or (a.domain and a.domain == b.domain)
+        if shared_key:
+            # Same phone/domain: a loose name match is enough unless the locations disagree
+            # (branches of a chain share a number and a website).
+            return name_sim >= self.keyed_name_threshold and self._same_place(a, b) is not False
+        return name_sim >= self.name_threshold and bool(self._same_place(a, b))
+
+    # -- resolution ----------------------------------------------------------
+
+    def clusters(self, records: list[dict[str, Any]]) -> list[list[int]]:
+        """Group record indexes that describe the same business."""
+        features = [self._features(r) for r in records]
+        parent = list(range(len(records)))
+        sources = [{f.source} for f in features]
+
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        blocks: dict[str, list[int]] = {}
+        for i, f in enumerate(features):
+            for key in f.keys:
+                blocks.setdefault(key, []).append(i)
+
+        compared = 0
+        skipped = 0
+        for key, members in blocks.items():
+            if len(members) < 2:
+                continue
+            if len(members) > self.max_block_size:
+                skipped += 1
+                continue
+            for x, i in enumerate(members):
+                for j in members[x + 1:]:
+                    ri, rj = find(i), find(j)
+                    # Each source is already deduped by external_id, so a cluster
+                    # never holds two records from the same source.
+                    if ri == rj or sources[ri] & sources[rj]:
+                        continue
+                    compared += 1
+                    if self.is_match(features[i], features[j]):
+                        parent[rj] = ri
+                        sources[ri] |= sources[rj]
+
+        groups: dict[int, list[int]] = {}
+        for i in range(len(records)):
+            groups.setdefault(find(i), []).append(i)
+        logger.debug(
+            "Entity resolution: %d records, %d blocks (%d oversized), %d comparisons, %d entities",
+            len(records), len(blocks), skipped, compared, len(groups),
+        )
+        return list(groups.values())
+
+    def _priority(self, record: dict[str, Any]) -> tuple[int, int]:
+        source = record.get("source") or ""
+        rank = SOURCE_PRIORITY.index(source) if source in SOURCE_PRIORITY else len(SOURCE_PRIORITY)
+        filled = sum(1 for v in record.values() if v not in (None, "", [], {}))
+        return rank, -filled
+
+    def merge_cluster(self, records: Iterable[dict[str, Any]]) -> dict[str, Any]:
+        ordered = sorted(records, key=self._priority)
+        merged = ordered[0]
+        if len(ordered) == 1:
+            return merged
+        for other in ordered[1:]:
+            merged = self.merger.merge(merged, other)
+        # A stored lead merged again keeps the listings it absorbed before.
+        merged_from: dict[tuple[Any, Any], dict[str, Any]] = {}
+        for r in ordered:
+            for entry in (r.get("raw_data") or {}).get("merged_from") or []:
+                if isinstance(entry, dict):
+                    merged_from[(entry.get("source"), entry.get("external_id"))] = entry
+        for r in ordered[1:]:
+            merged_from[(r.get("source"), r.get("external_id"))] = {
+                "source": r.get("source"),
+                "external_id": r.get("external_id"),
+                "fingerprint": r.get("fingerprint"),
+            }
+        merged_from.pop((merged.get("source"), merged.get("external_id")), None)
+        merged["raw_data"] = {**(ordered[0].get("raw_data") or {}), "merged_from": list(merged_from.values())}
+        return merged
+
+    def resolve(self, records: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Return one merged record per entity; the primary keeps its source and external_id."""
+        if len(records) < 2:
+            return list(records)
+        return [self.merge_cluster(records[i] for i in group) for group in self.clusters(records)]
@@ -0,0 +1,346 @@
+"""Near-duplicate detection over the whole leads table with MinHash + LSH.
+
+Each lead gets a 64-slot MinHash signature over name character trigrams, name
+and address tokens and its domain. Signatures are split into 16 bands of 4
+slots; leads sharing any band bucket are candidates, and candidates whose
+estimated Jaccard similarity clears the threshold are clustered in
+``lead_duplicates``.
+
+The sweep streams leads through a server-side cursor in fixed-size chunks, so
+memory is bounded by the chunk size, and is incremental: only leads without a
+signature (or updated since theirs was computed) are hashed and matched
+against everything already indexed. A re-hashed lead leaves its old cluster
+first, so an edit that breaks a match also removes the duplicate listing.
+"""
+
+import hashlib
+import logging
+import uuid
+from array import array
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import delete, func, or_, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import AsyncSessionFactory
+from app.intelligence.entity_resolver import address_tokens, name_tokens
+from app.models import Lead, LeadDuplicate, LeadLshBucket, LeadMinHash
+from app.utils.domains import registrable_domain
+
+logger = logging.getLogger(__name__)
+
+NUM_PERM = 64
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+_SLOT_BYTES = 4
+
+# Members of the queried buckets, except buckets larger than :max_bucket_size
+# (generic names/addresses, not duplicates), which are counted but never fetched.
+_CANDIDATES_SQL = text(
+    """
+    WITH q(band, bucket) AS (
+        SELECT DISTINCT * FROM unnest(CAST(:bands AS smallint[]), CAST(:buckets AS bigint[]))
+    ),
+    sized AS (
+        SELECT b.band, b.bucket
+        FROM lead_lsh_buckets b
+        JOIN q ON b.band = q.band AND b.bucket = q.bucket
+        GROUP BY b.band, b.bucket
+        HAVING count(*) <= :max_bucket_size
+    )
+    SELECT b.band, b.bucket, b.lead_id
+    FROM lead_lsh_buckets b
+    JOIN sized s ON b.band = s.band AND b.bucket = s.bucket
+    """
+)
+
+
+# Oldest remaining member as each cluster's canonical lead, after members were removed.
+_RECANONICAL_SQL = text(
+    """
+    UPDATE lead_duplicates d
+    SET canonical_lead_id = (
+        SELECT o.lead_id
+        FROM lead_duplicates o
+        JOIN leads l ON l.id = o.lead_id
+        WHERE o.cluster_id = d.cluster_id
+        ORDER BY l.created_at, o.lead_id::text
+        LIMIT 1
+    )
+    WHERE d.cluster_id = ANY(CAST(:clusters AS uuid[]))
+    """
+)
+
+
+def shingles(
+    name: str | None,
+    street: str | None = None,
+    city: str | None = None,
+    domain: str | None = None,
+) -> set[str]:
+    """Feature set of a lead: name trigrams and tokens, address tokens, domain."""
+    tokens = name_tokens(name)
+    compact = "".join(tokens)
+    out = {f"w:{t}" for t in tokens}
+    if len(compact) <= 3:
+        if compact:
+            out.add(f"n:{compact}")
+    else:
+        out.update(f"n:{compact[i:i + 3]}" for i in range(len(compact) - 2))
+    out.update(f"a:{t}" for t in address_tokens(street))
+    out.update(f"a:{t}" for t in address_tokens(city))
+    domain = registrable_domain(domain)
+    if domain:
+        out.add(f"d:{domain}")
+    return out
+
+
+def signature(features: set[str]) -> bytes:
+    """MinHash signature; each 4-byte slot of a SHAKE-128 digest acts as one hash function."""
+    if not features:
+        return b""
+    hashed = [array("I", hashlib.shake_128(f.encode("utf-8")).digest(NUM_PERM * _SLOT_BYTES)) for f in features]
+    return array("I", map(min, *hashed)).tobytes() if len(hashed) > 1 else hashed[0].tobytes()
+
+
+def band_buckets(sig: bytes) -> list[tuple[int, int]]:
+    """(band, bucket) pairs of a signature; the bucket is a signed 64-bit hash of the band's slots."""
+    width = ROWS * _SLOT_BYTES
+    out = []
+    for band in range(BANDS):
+        digest = hashlib.blake2b(sig[band * width:(band + 1) * width], digest_size=8).digest()
+        out.append((band, int.from_bytes(digest, "big", signed=True)))
+    return out
+
+
+def similarity(a: bytes, b: bytes) -> float:
+    """Estimated Jaccard similarity: share of equal signature slots."""
+    if not a or len(a) != len(b):
+        return 0.0
+    slots_a, slots_b = array("I", a), array("I", b)
+    return sum(x == y for x, y in zip(slots_a, slots_b)) / len(slots_a)
+
+
+@dataclass
+class SweepStats:
+    hashed: int = 0
+    candidate_pairs: int = 0
+    duplicate_pairs: int = 0
+    clusters_updated: int = 0
+
+
+class NearDuplicateDetector:
+    """Incremental MinHash/LSH sweep writing clusters to ``lead_duplicates``."""
+
+    def __init__(self, threshold: float = 0.6, chunk_size: int = 2000, max_bucket_size: int = 200):
+        self.threshold = threshold
+        self.chunk_size = chunk_size
+        self.max_bucket_size = max_bucket_size
+
+    async def sweep(self, full: bool = False) -> SweepStats:
+        """Hash new/updated leads and cluster them; ``full=True`` rebuilds the whole index."""
+        stats = SweepStats()
+        async with AsyncSessionFactory() as writer:
+            if full:
+                await writer.execute(delete(LeadDuplicate))
+                await writer.execute(delete(LeadLshBucket))
+                await writer.execute(delete(LeadMinHash))
+                await writer.commit()
+
+            async with AsyncSessionFactory() as reader:
+                stmt = (
+                    select(Lead.id, Lead.company_name, Lead.street, Lead.city, Lead.company_domain)
+                    .outerjoin(LeadMinHash, LeadMinHash.lead_id == Lead.id)
+                    .where(or_(LeadMinHash.lead_id.is_(None), Lead.updated_at > LeadMinHash.computed_at))
+                    .order_by(Lead.created_at)
+                    .execution_options(yield_per=self.chunk_size)
+                )
+                result = await reader.stream(stmt)
+                async for rows in result.partitions(self.chunk_size):
+                    await self._process_chunk(writer, rows, stats)
+                    await writer.commit()
+
+        logger.info(
+            "Near-duplicate sweep: %d hashed, %d candidate pairs, %d duplicate pairs, %d clusters updated",
+            stats.hashed, stats.candidate_pairs, stats.duplicate_pairs, stats.clusters_updated,
+        )
+        return stats
+
+    async def _process_chunk(self, session: AsyncSession, rows: list[Any], stats: SweepStats) -> None:
+        now = datetime.utcnow()
+        signatures: dict[uuid.UUID, bytes] = {}
+        buckets: dict[uuid.UUID, list[tuple[int, int]]] = {}
+        for lead_id, name, street, city, domain in rows:
+            sig = signature(shingles(name, street, city, domain))
+            signatures[lead_id] = sig
+            buckets[lead_id] = band_buckets(sig) if sig else []
+        stats.hashed += len(rows)
+
+        ids = list(signatures)
+        await session.execute(delete(LeadLshBucket).where(LeadLshBucket.lead_id.in_(ids)))
+        await self._detach(session, ids)
+        insert_sig = pg_insert(LeadMinHash)
+        await session.execute(
+            insert_sig.on_conflict_do_update(
+                index_elements=[LeadMinHash.lead_id],
+                set_={"signature": insert_sig.excluded.signature, "computed_at": insert_sig.excluded.computed_at},
+            ),
+            [{"lead_id": i, "signature": s, "computed_at": now} for i, s in signatures.items()],
+        )
+        bucket_rows = [(band, bucket, lead_id) for lead_id, pairs in buckets.items() for band, bucket in pairs]
+        if not bucket_rows:
+            return
+        # The chunk's old buckets were just deleted, so a plain COPY cannot conflict.
+        conn = await session.connection()
+        raw = await conn.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            LeadLshBucket.__tablename__, records=bucket_rows, columns=["band", "bucket", "lead_id"]
+        )
+
+        # Every indexed lead (this chunk included) sharing a bucket of at most max_bucket_size with the chunk.
+        members: dict[tuple[int, int], list[uuid.UUID]] = {}
+        result = await session.execute(
+            _CANDIDATES_SQL,
+            {
+                "bands": [r[0] for r in bucket_rows],
+                "buckets": [r[1] for r in bucket_rows],
+                "max_bucket_size": self.max_bucket_size,
+            },
+        )
+        for band, bucket, lead_id in result.all():
+            members.setdefault((band, bucket), []).append(lead_id)
+
+        pairs: set[tuple[uuid.UUID, uuid.UUID]] = set()
+        for lead_id, lead_buckets in buckets.items():
+            for key in lead_buckets:
+                for other in members.get(key, ()):
+                    if other != lead_id:
+                        pairs.add((lead_id, other) if str(lead_id) < str(other) else (other, lead_id))
+        stats.candidate_pairs += len(pairs)
+        if not pairs:
+            return
+
+        missing = {i for pair in pairs for i in pair if i not in signatures}
+        if missing:
+            result = await session.execute(
+                select(LeadMinHash.lead_id, LeadMinHash.signature).where(LeadMinHash.lead_id.in_(missing))
+            )
+            signatures.update({lead_id: bytes(sig) for lead_id, sig in result.all()})
+
+        edges: list[tuple[uuid.UUID, uuid.UUID, float]] = []
+        for a, b in pairs:
+            score = similarity(signatures.get(a, b""), signatures.get(b, b""))
+            if score >= self.threshold:
+                edges.append((a, b, score))
+        stats.duplicate_pairs += len(edges)
+        if edges:
+            stats.clusters_updated += await self._update_clusters(session, edges, now)
+
+    async def _detach(self, session: AsyncSession, ids: list[uuid.UUID]) -> None:
+        """Remove re-hashed leads from their clusters; the edges they still have are found again.
+
+        Clusters left with a single member are dropped, and the others get a
+        new canonical lead if theirs was removed.
+        """
+        result = await session.execute(
+            delete(LeadDuplicate).where(LeadDuplicate.lead_id.in_(ids)).returning(LeadDuplicate.cluster_id)
+        )
+        clusters = set(result.scalars().all())
+        if not clusters:
+            return
+        singletons = (
+            select(LeadDuplicate.cluster_id)
+            .where(LeadDuplicate.cluster_id.in_(clusters))
+            .group_by(LeadDuplicate.cluster_id)
+            .having(func.count() < 2)
+        )
+        await session.execute(delete(LeadDuplicate).where(LeadDuplicate.cluster_id.in_(singletons)))
+        await session.execute(_RECANONICAL_SQL, {"clusters": list(clusters)})
+
+    async def _update_clusters(
+        self,
+        session: AsyncSession,
+        edges: list[tuple[uuid.UUID, uuid.UUID, float]],
+        now: datetime,
+    ) -> int:
+        touched = {i for a, b, _ in edges for i in (a, b)}
+        existing = await session.execute(select(LeadDuplicate).where(LeadDuplicate.lead_id.in_(touched)))
+        cluster_ids = {row.cluster_id for row in existing.scalars().all()}
+        memberships: list[LeadDuplicate] = []
+        if cluster_ids:
+            result = await session.execute(select(LeadDuplicate).where(LeadDuplicate.cluster_id.in_(cluster_ids)))
+            memberships = list(result.scalars().all())
+
+        parent: dict[uuid.UUID, uuid.UUID] = {}
+
+        def find(i: uuid.UUID) -> uuid.UUID:
+            parent.setdefault(i, i)
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        def union(a: uuid.UUID, b: uuid.UUID) -> None:
+            ra, rb = find(a), find(b)
+            if ra != rb:
+                parent[rb] = ra
+
+        best: dict[uuid.UUID, float] = {}
+        by_cluster: dict[uuid.UUID, uuid.UUID] = {}
+        for m in memberships:
+            best[m.lead_id] = m.similarity or 0.0
+            if m.cluster_id in by_cluster:
+                union(by_cluster[m.cluster_id], m.lead_id)
+            else:
+                by_cluster[m.cluster_id] = find(m.lead_id)
+        for a, b, score in edges:
+            union(a, b)
+            best[a] = max(best.get(a, 0.0), score)
+            best[b] = max(best.get(b, 0.0), score)
+
+        previous = {m.lead_id: m.cluster_id for m in memberships}
+        components: dict[uuid.UUID, list[uuid.UUID]] = {}
+        for lead_id in list(parent):
+            components.setdefault(find(lead_id), []).append(lead_id)
+
+        all_ids = [i for group in components.values() for i in group]
+        created = dict(
+            (await session.execute(select(Lead.id, Lead.created_at).where(Lead.id.in_(all_ids)))).all()
+        )
+
+        rows = []
+        for group in components.values():
+            group = [i for i in group if i in created]
+            if len(group) < 2:
+                continue
+            kept = sorted({previous[i] for i in group if i in previous}, key=str)
+            cluster_id = kept[0] if kept else uuid.uuid4()
+            canonical = min(group, key=lambda i: (created[i], str(i)))
+            rows.extend(
+                {
+                    "lead_id": i,
+                    "cluster_id": cluster_id,
+                    "canonical_lead_id": canonical,
+                    "similarity": best.get(i, 0.0),
+                    "detected_at": now,
+                }
+                for i in group
+            )
+        if rows:
+            stmt = pg_insert(LeadDuplicate)
+            await session.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=[LeadDuplicate.lead_id],
+                    set_={
+                        "cluster_id": stmt.excluded.cluster_id,
+                        "canonical_lead_id": stmt.excluded.canonical_lead_id,
+                        "similarity": stmt.excluded.similarity,
+                        "detected_at": stmt.excluded.detected_at,
+                    },
+                ),
+                rows,
+            )
+        return len({r["cluster_id"] for r in rows})
@@ -19,6 +19,7 @@ from app.api.leads import router as leads_router
 from app.api.enrich import router as enrich_router
 from app.api.outreach import router as outreach_router
 from app.api.presets import router as presets_router
+from app.api.schedules import router as schedules_router
 from app.config import get_settings
 from app.database import init_db
 
@@ -60,6 +61,7 @@ app.include_router(export_router, prefix=settings.api_prefix)
 app.include_router(enrich_router, prefix=settings.api_prefix)
 app.include_router(outreach_router, prefix=settings.api_prefix)
 app.include_router(presets_router, prefix=settings.api_prefix)
+app.include_router(schedules_router, prefix=settings.api_prefix)
 
 # Serve frontend as static files (works for demo / ngrok)
 _frontend_dir = os.path.join(os.path.dirname(__file__), "..", "..", "frontend")
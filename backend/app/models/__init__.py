@@ -3,13 +3,20 @@ from app.models.billing import CreditUsage, Plan, Subscription
 from app.models.campaign import Campaign, CampaignRecipient, CampaignStatus, CampaignStep, EmailEvent, EmailEventType
 from app.models.company import Company
 from app.models.email_account import EmailAccount
+from app.models.email_enrichment import EmailEnrichmentJob
+from app.models.email_pattern import EmailPattern
+from app.models.email_provider_stat import EmailProviderStat
+from app.models.email_verification import EmailVerificationJob
 from app.models.intent_signal import IntentSignal
 from app.models.organization import OrgMember, Organization
 from app.models.webhook import Webhook
 from app.models.job import GenerationJob, JobStatus, ScrapeJob
 from app.models.lead import Lead
+from app.models.near_duplicate import LeadDuplicate, LeadLshBucket, LeadMinHash
 from app.models.pipeline import Deal, Pipeline, PipelineStage
+from app.models.schedule import JobSchedule
 from app.models.user import User
+from app.models.vertex_response import VertexResponse
 
 __all__ = [
     "ApiKey",
@@ -27,13 +34,22 @@ __all__ = [
     "Company",
     "Deal",
     "EmailAccount",
+    "EmailEnrichmentJob",
+    "EmailPattern",
+    "EmailProviderStat",
+    "EmailVerificationJob",
     "EmailEvent",
     "EmailEventType",
     "GenerationJob",
+    "JobSchedule",
     "JobStatus",
     "Lead",
+    "LeadDuplicate",
+    "LeadLshBucket",
+    "LeadMinHash",
     "Pipeline",
     "PipelineStage",
     "ScrapeJob",
     "User",
+    "VertexResponse",
 ]
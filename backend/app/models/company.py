@@ -3,17 +3,24 @@ from datetime import datetime
 
 from sqlalchemy import DateTime, Integer, JSON, String, Text
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
 
 
 class Company(Base):
+    """Canonical business shared by every lead (across jobs) that refers to it.
+
+    Resolved by registrable domain or Google place_id; enrichment, technologies
+    and contacts are stored here once instead of on each lead copy.
+    """
+
     __tablename__ = "companies"
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
-    domain: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    domain: Mapped[str | None] = mapped_column(String(255), nullable=True, unique=True)
+    place_id: Mapped[str | None] = mapped_column(String(128), nullable=True, unique=True)
     website: Mapped[str | None] = mapped_column(String(500), nullable=True)
     phone: Mapped[str | None] = mapped_column(String(64), nullable=True)
     email: Mapped[str | None] = mapped_column(String(255), nullable=True)
@@ -23,5 +30,18 @@ class Company(Base):
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
     technologies: Mapped[list[str]] = mapped_column(JSON, default=list)
 
+    # Pipeline AI profile and third-party data (e.g. {"ai_profile": ..., "clearbit": ...})
+    enrichment: Mapped[dict] = mapped_column(JSON, default=dict)
+    # Gemini sales-intelligence analysis from the /enrich endpoints
+    ai_enrichment: Mapped[dict | None] = mapped_column(JSON, nullable=True, default=None)
+    # Email finder results: [{"email", "first_name", "last_name", "position", "source", "verified"}]
+    contacts: Mapped[list[dict]] = mapped_column(JSON, default=list)
+
+    enriched_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    ai_enriched_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    contacts_found_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    leads: Mapped[list["Lead"]] = relationship(back_populates="company")
@@ -0,0 +1,39 @@
+import uuid
+from datetime import datetime
+
+from sqlalchemy import Boolean, DateTime, Enum as SqlEnum, ForeignKey, Integer, String, Text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+from app.models.job import JobStatus
+
+
+class EmailEnrichmentJob(Base):
+    """One run of email finding and verification over a generation job's leads."""
+
+    __tablename__ = "email_enrichment_jobs"
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    job_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("scrape_jobs.id", ondelete="CASCADE"), index=True
+    )
+    # Skip leads that already have a verified email
+    only_missing: Mapped[bool] = mapped_column(Boolean, default=True)
+
+    status: Mapped[JobStatus] = mapped_column(SqlEnum(JobStatus, name="job_status"), default=JobStatus.pending)
+    progress_percent: Mapped[int] = mapped_column(Integer, default=0)
+    status_message: Mapped[str | None] = mapped_column(String(255), nullable=True)
+
+    total_leads: Mapped[int] = mapped_column(Integer, default=0)
+    total_domains: Mapped[int] = mapped_column(Integer, default=0)
+    processed_domains: Mapped[int] = mapped_column(Integer, default=0)
+    emails_found: Mapped[int] = mapped_column(Integer, default=0)
+    emails_verified: Mapped[int] = mapped_column(Integer, default=0)
+    # Domains answered from fresh company contacts without a finder call
+    domains_reused: Mapped[int] = mapped_column(Integer, default=0)
+
+    error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
+    started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    completed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
@@ -0,0 +1,25 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, Integer, JSON, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class EmailPattern(Base):
+    """Observed email local-part patterns for a domain, or aggregated as a prior.
+
+    ``scope`` is "domain" (key: registrable domain), "tld" (key: public
+    suffix, e.g. "co.in") or "industry" (key: industry slug).
+    """
+
+    __tablename__ = "email_patterns"
+
+    scope: Mapped[str] = mapped_column(String(16), primary_key=True)
+    key: Mapped[str] = mapped_column(String(255), primary_key=True)
+    # {pattern: number of addresses}
+    counts: Mapped[dict] = mapped_column(JSON, default=dict)
+    # Domain rows only: {email: [patterns]} for the addresses counted, so evidence is never counted twice
+    samples: Mapped[dict] = mapped_column(JSON, default=dict)
+    total: Mapped[int] = mapped_column(Integer, default=0)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -0,0 +1,24 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class EmailProviderStat(Base):
+    """Paid email provider lookups and how many of them found a verified address.
+
+    ``provider`` is a finder step ("hunter_finder", "hunter", "apollo",
+    "snov"). ``scope`` is "tld" (key: public suffix), "industry" (key:
+    industry slug) or "all" (key: "*").
+    """
+
+    __tablename__ = "email_provider_stats"
+
+    provider: Mapped[str] = mapped_column(String(32), primary_key=True)
+    scope: Mapped[str] = mapped_column(String(16), primary_key=True)
+    key: Mapped[str] = mapped_column(String(255), primary_key=True)
+    attempts: Mapped[int] = mapped_column(Integer, default=0)
+    hits: Mapped[int] = mapped_column(Integer, default=0)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow)
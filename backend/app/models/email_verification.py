@@ -0,0 +1,38 @@
+import uuid
+from datetime import datetime
+
+from sqlalchemy import DateTime, Enum as SqlEnum, Integer, JSON, String, Text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+from app.models.job import JobStatus
+
+
+class EmailVerificationJob(Base):
+    """Bulk verification of an uploaded address list or of stored leads' contact emails."""
+
+    __tablename__ = "email_verification_jobs"
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    # "upload" or "leads"
+    source: Mapped[str] = mapped_column(String(20), nullable=False)
+    # Lead filter for source="leads": {"job_id": ..., "lead_ids": [...], "only_unverified": bool}
+    criteria: Mapped[dict] = mapped_column(JSON, default=dict)
+
+    status: Mapped[JobStatus] = mapped_column(SqlEnum(JobStatus, name="job_status"), default=JobStatus.pending)
+    progress_percent: Mapped[int] = mapped_column(Integer, default=0)
+    status_message: Mapped[str | None] = mapped_column(String(255), nullable=True)
+
+    total_emails: Mapped[int] = mapped_column(Integer, default=0)
+    total_domains: Mapped[int] = mapped_column(Integer, default=0)
+    processed_emails: Mapped[int] = mapped_column(Integer, default=0)
+    # Addresses per verification status (valid, invalid, risky, catch_all, unknown)
+    status_counts: Mapped[dict] = mapped_column(JSON, default=dict)
+    leads_updated: Mapped[int] = mapped_column(Integer, default=0)
+    result_path: Mapped[str | None] = mapped_column(String(500), nullable=True)
+
+    error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
+    started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    completed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Integer, JSON, String, UniqueConstraint
+from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Index, Integer, JSON, String, UniqueConstraint, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -10,13 +10,22 @@ from app.database import Base
 
 class Lead(Base):
     __tablename__ = "leads"
-    __table_args__ = (UniqueConstraint("source", "external_id", "job_id", name="uq_source_external_per_job"),)
+    __table_args__ = (
+        UniqueConstraint("source", "external_id", "job_id", name="uq_source_external_per_job"),
+        # Last ten phone digits; used to dedupe imported lists against stored leads.
+        Index("ix_leads_phone_key", text(r"right(regexp_replace(company_phone, '\D', '', 'g'), 10)")),
+        # Bulk email verification writes results back by address.
+        Index("ix_leads_contact_email_lower", text("lower(contact_email)")),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     job_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("scrape_jobs.id", ondelete="CASCADE"))
+    company_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("companies.id", ondelete="SET NULL"), nullable=True, index=True
+    )
 
     company_name: Mapped[str] = mapped_column(String(255), nullable=False)
-    company_domain: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    company_domain: Mapped[str | None] = mapped_column(String(255), nullable=True, index=True)
     company_website: Mapped[str | None] = mapped_column(String(500), nullable=True)
     company_phone: Mapped[str | None] = mapped_column(String(64), nullable=True)
     company_email: Mapped[str | None] = mapped_column(String(255), nullable=True)
@@ -44,6 +53,7 @@ class Lead(Base):
 
     source: Mapped[str] = mapped_column(String(64), default="google_places")
     external_id: Mapped[str | None] = mapped_column(String(128), nullable=True)
+    fingerprint: Mapped[str | None] = mapped_column(String(64), nullable=True)
     data_sources: Mapped[list[str]] = mapped_column(JSON, default=list)
     source_urls: Mapped[list[str]] = mapped_column(JSON, default=list)
 
@@ -61,6 +71,7 @@ class Lead(Base):
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow)
 
     job: Mapped["ScrapeJob"] = relationship(back_populates="leads")
+    company: Mapped["Company | None"] = relationship(back_populates="leads")
 
     @property
     def business_name(self) -> str:
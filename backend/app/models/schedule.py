@@ -0,0 +1,44 @@
+import uuid
+from datetime import datetime
+
+from sqlalchemy import Boolean, DateTime, Integer, JSON, String
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class JobSchedule(Base):
+    """A recurring generation job.
+
+    Runs nominally at ``anchor_at + k * interval_minutes``; the scheduler adds
+    ``offset_minutes`` (0..window_minutes) so schedules sharing a slot start
+    staggered instead of all at once.
+    """
+
+    __tablename__ = "job_schedules"
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    user_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), nullable=True)
+
+    name: Mapped[str] = mapped_column(String(255), nullable=False)
+    preset_id: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    query: Mapped[str] = mapped_column(String(255), nullable=False)
+    industry: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    location: Mapped[str] = mapped_column(String(255), nullable=False)
+    max_results: Mapped[int] = mapped_column(Integer, default=40)
+    sources_enabled: Mapped[list[str]] = mapped_column(JSON, default=list)
+
+    anchor_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    interval_minutes: Mapped[int] = mapped_column(Integer, default=7 * 24 * 60)
+    window_minutes: Mapped[int] = mapped_column(Integer, default=240)
+    offset_minutes: Mapped[int] = mapped_column(Integer, default=0)
+    refresh_existing: Mapped[bool] = mapped_column(Boolean, default=True)
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True)
+
+    next_run_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True, index=True)
+    last_run_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    last_job_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), nullable=True)
+
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -1,8 +1,12 @@
+from app.normalizer.locality import canonicalize_locations, get_gazetteer
 from app.normalizer.standardizer import LeadStandardizer
-from app.normalizer.normalized_lead import NormalizedLead, normalize_to_lead_payload
+from app.normalizer.normalized_lead import NormalizedLead, lead_rows, normalize_to_lead_payload
 
 __all__ = [
     "LeadStandardizer",
     "NormalizedLead",
+    "canonicalize_locations",
+    "get_gazetteer",
+    "lead_rows",
     "normalize_to_lead_payload",
 ]
@@ -0,0 +1,202 @@
+"""Offline city/state/country canonicalization backed by ``app.data.gazetteer``.
+
+Names are reduced to lowercase ASCII tokens and looked up in an alias table;
+free-text localities ("Andheri East, Mumbai", "Bangalore Urban") fall back to
+a token trie that finds the longest known place name inside the text. Results
+are memoised per (city, state, country) triple, so a batch of leads from the
+same few localities costs one lookup per distinct triple.
+"""
+
+import re
+import unicodedata
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Iterable
+
+from app.data.gazetteer import CITIES, COUNTRIES, STATES
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+# Aliases this short only match a whole field, never inside free text.
+_MIN_SCAN_ALIAS = 4
+_END = ""
+
+
+@dataclass(frozen=True, slots=True)
+class Place:
+    city: str
+    state: str | None
+    country: str
+    latitude: float
+    longitude: float
+
+
+@dataclass(frozen=True, slots=True)
+class Locality:
+    city: str | None
+    state: str | None
+    country: str | None
+    latitude: float | None = None
+    longitude: float | None = None
+
+
+def _key(text: str | None) -> str:
+    """Lowercase ASCII tokens joined by single spaces ("Bengaluru, KA" -> "bengaluru ka")."""
+    if not text:
+        return ""
+    ascii_text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii")
+    return " ".join(_NON_ALNUM.sub(" ", ascii_text.lower()).split())
+
+
+class Gazetteer:
+    """In-memory alias index and token trie over the bundled gazetteer."""
+
+    def __init__(self) -> None:
+        self._countries: dict[str, str] = {}
+        for name, info in COUNTRIES.items():
+            for alias in (name, info["code"], *info["aliases"]):
+                self._countries.setdefault(_key(alias), name)
+
+        self._states: dict[str, dict[str, str]] = {}
+        for country, states in STATES.items():
+            table = self._states.setdefault(country, {})
+            for name, aliases in states.items():
+                for alias in (name, *aliases):
+                    table.setdefault(_key(alias), name)
+
+        self._cities: dict[str, list[Place]] = {}
+        self._trie: dict[str, Any] = {}
+        self._aliases: dict[Place, set[str]] = {}
+        for name, state, country, lat, lon, aliases in CITIES:
+            place = Place(name, state or None, country, lat, lon)
+            names = (name, *aliases)
+            self._aliases[place] = set(names)
+            for alias in names:
+                key = _key(alias)
+                self._cities.setdefault(key, []).append(place)
+                if len(key) >= _MIN_SCAN_ALIAS:
+                    node = self._trie
+                    for token in key.split():
+                        node = node.setdefault(token, {})
+                    node.setdefault(_END, []).append(place)
+
+    # -- lookups ------------------------------------------------------------
+
+    def country(self, text: str | None) -> str | None:
+        return self._countries.get(_key(text))
+
+    def state(self, text: str | None, country: str | None = None) -> tuple[str, str] | None:
+        """(state, country) for a state name or code; India is tried first when the country is unknown."""
+        key = _key(text)
+        if not key:
+            return None
+        countries = [country] if country else ["India", *[c for c in self._states if c != "India"]]
+        for name in countries:
+            state = self._states.get(name or "", {}).get(key)
+            if state:
+                return state, name
+        return None
+
+    def _scan(self, key: str) -> list[Place]:
+        """Places of the longest alias found in the token sequence (rightmost on ties)."""
+        tokens = key.split()
+        best: list[Place] = []
+        best_len = 0
+        for start in range(len(tokens)):
+            node = self._trie
+            for end in range(start, len(tokens)):
+                node = node.get(tokens[end])
+                if node is None:
+                    break
+                if _END in node and end - start + 1 >= best_len:
+                    best, best_len = node[_END], end - start + 1
+        return best
+
+    def find_city(self, text: str | None, state: str | None = None, country: str | None = None) -> Place | None:
+        """Best gazetteer place for a free-text city, preferring matches in the given state/country."""
+        key = _key(text)
+        if not key:
+            return None
+        candidates = self._cities.get(key) or self._scan(key)
+        if not candidates:
+            return None
+        for place in candidates:
+            if (not state or place.state == state) and (not country or place.country == country):
+                return place
+        if state or country:
+            for place in candidates:
+                if place.country == country:
+                    return place
+        return candidates[0]
+
+    def city_names(self, text: str | None) -> set[str]:
+        """Every spelling of the city named by ``text`` (for filtering stored leads); empty if unknown."""
+        names: set[str] = set()
+        for place in self._cities.get(_key(text)) or self._scan(_key(text)):
+            names.update(self._aliases[place])
+        return names
+
+    # -- canonicalization ---------------------------------------------------
+
+    def normalize(self, city: str | None, state: str | None, country: str | None) -> Locality:
+        """Canonical city/state/country; unknown values are kept as given (trimmed)."""
+        city = (city or "").strip() or None
+        state = (state or "").strip() or None
+        country = (country or "").strip() or None
+
+        canon_country = self.country(country)
+        state_match = self.state(state, canon_country)
+        canon_state = state_match[0] if state_match else None
+        if state_match and not canon_country:
+            canon_country = state_match[1]
+
+        place = self.find_city(city, canon_state, canon_country)
+        if place is None and state and not state_match:
+            # Some directories put the locality in the region field.
+            place = self.find_city(state, None, canon_country)
+        if place is None and city and not canon_state:
+            # "Whitefield, Karnataka" style values carry the state in the city field.
+            state_match = self.state(city.rsplit(",", 1)[-1], canon_country)
+            if state_match:
+                canon_state, canon_country = state_match[0], canon_country or state_match[1]
+
+        if place is not None and (not canon_country or place.country == canon_country):
+            return Locality(
+                city=place.city,
+                state=place.state or canon_state or state,
+                country=place.country,
+                latitude=place.latitude,
+                longitude=place.longitude,
+            )
+        return Locality(city=city, state=canon_state or state, country=canon_country or country)
+
+
+@lru_cache(maxsize=1)
+def get_gazetteer() -> Gazetteer:
+    return Gazetteer()
+
+
+@lru_cache(maxsize=65536)
+def normalize_locality(city: str | None, state: str | None, country: str | None) -> Locality:
+    """Memoised ``Gazetteer.normalize``."""
+    return get_gazetteer().normalize(city, state, country)
+
+
+def canonicalize_location(record: Any, fill_coordinates: bool = False) -> Any:
+    """Canonicalize a lead record's city/state/country in place.
+
+    With ``fill_coordinates`` missing latitude/longitude are set to the
+    city-centre coordinates of a matched city (approximate).
+    """
+    locality = normalize_locality(record.get("city"), record.get("state"), record.get("country"))
+    record["city"] = locality.city
+    record["state"] = locality.state
+    record["country"] = locality.country
+    if fill_coordinates and locality.latitude is not None and record.get("latitude") is None:
+        record["latitude"] = locality.latitude
+        record["longitude"] = locality.longitude
+    return record
+
+
+def canonicalize_locations(records: Iterable[Any], fill_coordinates: bool = False) -> list[Any]:
+    """Bulk ``canonicalize_location``."""
+    return [canonicalize_location(r, fill_coordinates) for r in records]
@@ -1,7 +1,17 @@
+from app.normalizer.normalized_lead import NormalizedLead
+
+
 class LeadMerger:
-    def merge(self, left: dict, right: dict) -> dict:
+    # List fields combined from both sides instead of kept from the left.
+    UNION_FIELDS = ("data_sources", "source_urls", "technologies")
+
+    def merge(self, left: dict | NormalizedLead, right: dict | NormalizedLead) -> dict | NormalizedLead:
+        if isinstance(left, NormalizedLead):
+            return left.merge(right)
         merged = dict(left)
         for key, value in right.items():
-            if key not in merged or merged[key] in (None, "", [], {}):
+            if key in self.UNION_FIELDS and isinstance(value, list) and isinstance(merged.get(key), list):
+                merged[key] = list(dict.fromkeys([*merged[key], *value]))
+            elif key not in merged or merged[key] in (None, "", [], {}):
                 merged[key] = value
         return merged
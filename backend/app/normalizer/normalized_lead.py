@@ -1,71 +1,178 @@
-"""Normalized lead DTO used between scrapers and Lead ORM model."""
+"""Normalized lead record used between scrapers and the Lead table.
 
-from typing import Any
-from urllib.parse import urlparse
+One slotted ``NormalizedLead`` is created per scraped listing and carried
+through dedupe, entity resolution, scoring and enrichment to persistence, where
+``lead_rows`` turns a batch into ``Lead`` insert rows. It also answers
+dict-style ``get``/``[]`` lookups, including the raw scraper aliases
+(``name``, ``website``, ``phone``, ...), so code written against lead dicts
+keeps working.
+"""
+
+from dataclasses import dataclass, field, fields, replace
+from typing import Any, Iterable
 from uuid import UUID
 
+from app.utils.domains import registrable_domain
+
+
+# Raw scraper keys accepted as aliases of record fields.
+ALIASES = {
+    "name": "company_name",
+    "business_name": "company_name",
+    "website": "company_website",
+    "phone": "company_phone",
+    "email": "company_email",
+    "address": "street",
+    "formatted_address": "street",
+    "postal_code": "zip_code",
+}
 
-def _domain_from_url(url: str | None) -> str | None:
-    if not url:
-        return None
-    parsed = urlparse(url)
-    host = parsed.netloc.lower().replace("www.", "")
-    return host or None
+# List fields combined from both records on merge.
+_UNION_FIELDS = ("data_sources", "source_urls")
 
 
+@dataclass(slots=True, eq=False)
 class NormalizedLead:
     """Canonical shape for raw scraper output before persistence as Lead."""
 
-    def __init__(
-        self,
-        *,
-        source: str,
-        external_id: str | None = None,
-        company_name: str,
-        company_domain: str | None = None,
-        company_website: str | None = None,
-        company_phone: str | None = None,
-        company_email: str | None = None,
-        street: str | None = None,
-        city: str | None = None,
-        state: str | None = None,
-        country: str | None = None,
-        zip_code: str | None = None,
-        latitude: float | None = None,
-        longitude: float | None = None,
-        rating: float | None = None,
-        review_count: int | None = None,
-        raw_data: dict[str, Any] | None = None,
-        data_sources: list[str] | None = None,
-    ):
-        self.source = source
-        self.external_id = external_id
-        self.company_name = company_name or "Unknown"
-        self.company_domain = company_domain or _domain_from_url(company_website)
-        self.company_website = company_website
-        self.company_phone = company_phone
-        self.company_email = company_email
-        self.street = street
-        self.city = city
-        self.state = state
-        self.country = country
-        self.zip_code = zip_code
-        self.latitude = latitude
-        self.longitude = longitude
-        self.rating = rating
-        self.review_count = review_count
-        self.raw_data = raw_data or {}
-        self.data_sources = data_sources or [source]
+    source: str
+    company_name: str = "Unknown"
+    external_id: str | None = None
+    fingerprint: str | None = None
+    company_domain: str | None = None
+    company_website: str | None = None
+    company_phone: str | None = None
+    company_email: str | None = None
+    contact_email: str | None = None
+    street: str | None = None
+    city: str | None = None
+    state: str | None = None
+    country: str | None = None
+    zip_code: str | None = None
+    latitude: float | None = None
+    longitude: float | None = None
+    rating: float | None = None
+    review_count: int | None = None
+    industry: str | None = None
+    email_found: bool | None = None
+    data_sources: list[str] = field(default_factory=list)
+    source_urls: list[str] = field(default_factory=list)
+    raw_data: dict[str, Any] = field(default_factory=dict)
 
-    def to_dict(self) -> dict[str, Any]:
-        return {
+    # Set by the pipeline after scraping.
+    company_id: UUID | None = None
+    lead_score: int = 0
+    intent_score: int = 0
+    ai_enrichment: dict[str, Any] | None = None
+    # Keys set through item access that have no field of their own.
+    extra: dict[str, Any] | None = None
+
+    @classmethod
+    def from_raw(cls, data: "dict[str, Any] | NormalizedLead", source: str | None = None) -> "NormalizedLead":
+        """Build a record from a scraper dict (canonical or alias keys); records pass through."""
+        if isinstance(data, NormalizedLead):
+            if source:
+                data.source = source
+            return data
+        source = source or data.get("source") or "unknown"
+        website = data.get("company_website") or data.get("website")
+        company_email = data.get("company_email") or data.get("email")
+        raw = data.get("raw_data")
+        if raw is None:
+            raw = data.get("raw") or data
+        return cls(
+            source=source,
+            company_name=data.get("company_name") or data.get("name") or "Unknown",
+            external_id=data.get("external_id"),
+            fingerprint=data.get("fingerprint"),
+            company_domain=registrable_domain(data.get("company_domain") or website),
+            company_website=website,
+            company_phone=data.get("company_phone") or data.get("phone"),
+            company_email=company_email,
+            contact_email=data.get("contact_email"),
+            street=data.get("street") or data.get("address") or data.get("formatted_address"),
+            city=data.get("city"),
+            state=data.get("state"),
+            country=data.get("country"),
+            zip_code=data.get("zip_code"),
+            latitude=data.get("latitude"),
+            longitude=data.get("longitude"),
+            rating=data.get("rating"),
+            review_count=data.get("review_count"),
+            industry=data.get("industry"),
+            email_found=data.get("email_found"),
+            data_sources=list(data.get("data_sources") or [source]),
+            source_urls=list(data.get("source_urls") or []),
+            raw_data=raw,
+        )
+
+    # -- dict-style access ----------------------------------------------------
+
+    def get(self, key: str, default: Any = None) -> Any:
+        name = ALIASES.get(key, key)
+        if name in _FIELD_NAMES:
+            value = getattr(self, name)
+        else:
+            value = self.extra.get(key) if self.extra else None
+        return default if value is None else value
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key)
+        if value is None and key not in self:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        name = ALIASES.get(key, key)
+        if name in _FIELD_NAMES:
+            setattr(self, name, value)
+        else:
+            if self.extra is None:
+                self.extra = {}
+            self.extra[key] = value
+
+    def __contains__(self, key: str) -> bool:
+        name = ALIASES.get(key, key)
+        if name in _FIELD_NAMES:
+            return getattr(self, name) is not None
+        return bool(self.extra) and key in self.extra
+
+    def values(self) -> list[Any]:
+        return [getattr(self, name) for name in _FIELD_NAMES]
+
+    # -- merge / persistence --------------------------------------------------
+
+    def merge(self, other: "NormalizedLead | dict[str, Any]") -> "NormalizedLead":
+        """Copy of this record with empty fields filled from ``other`` and list fields unioned."""
+        merged = replace(self)
+        for name in _FIELD_NAMES:
+            value = other.get(name)
+            if value in (None, "", [], {}):
+                continue
+            current = getattr(merged, name)
+            if name in _UNION_FIELDS:
+                setattr(merged, name, list(dict.fromkeys([*(current or []), *value])))
+            elif current in (None, "", [], {}):
+                setattr(merged, name, value)
+        return merged
+
+    def to_row(self, job_id: UUID) -> dict[str, Any]:
+        """``Lead`` column dict for this record."""
+        company_email = self.company_email
+        contact_email = self.contact_email or company_email
+        raw_data = self.raw_data
+        if self.ai_enrichment:
+            raw_data = {**raw_data, "ai_enrichment": self.ai_enrichment}
+        row = {
+            "job_id": job_id,
             "source": self.source,
             "external_id": self.external_id,
-            "company_name": self.company_name,
-            "company_domain": self.company_domain,
+            "fingerprint": self.fingerprint,
+            "company_name": self.company_name or "Unknown",
+            "company_domain": self.company_domain or registrable_domain(self.company_website),
             "company_website": self.company_website,
             "company_phone": self.company_phone,
-            "company_email": self.company_email,
+            "company_email": company_email,
             "street": self.street,
             "city": self.city,
             "state": self.state,
@@ -75,53 +182,44 @@ class NormalizedLead:
             "longitude": self.longitude,
             "rating": self.rating,
             "review_count": self.review_count,
-            "raw_data": self.raw_data,
-            "data_sources": self.data_sources,
+            "lead_score": self.lead_score,
+            "intent_score": self.intent_score,
+            "raw_data": raw_data,
+            "data_sources": self.data_sources or [self.source],
         }
 
+        # Optional fields (Lead model allows None)
+        if contact_email:
+            row["contact_email"] = contact_email
+        if self.source_urls:
+            row["source_urls"] = self.source_urls
+        if self.email_found is not None:
+            row["email_found"] = bool(self.email_found)
+        if self.company_id is not None:
+            row["company_id"] = self.company_id
+        if self.ai_enrichment:
+            row["is_enriched"] = True
+        return row
+
+    def to_dict(self) -> dict[str, Any]:
+        return {name: getattr(self, name) for name in _FIELD_NAMES}
+
+
+_FIELD_NAMES = tuple(f.name for f in fields(NormalizedLead) if f.name != "extra")
+
+
+def lead_rows(leads: Iterable[NormalizedLead], job_id: UUID) -> list[dict[str, Any]]:
+    """Batch-convert records to ``Lead`` insert rows for ``upsert_leads``."""
+    return [lead.to_row(job_id) for lead in leads]
+
 
 def normalize_to_lead_payload(
-    raw: dict[str, Any],
+    raw: dict[str, Any] | NormalizedLead,
     source: str,
     job_id: UUID,
     lead_score: int = 0,
 ) -> dict[str, Any]:
     """Map raw scraper dict to Lead ORM payload."""
-    company_website = raw.get("company_website") or raw.get("website")
-    company_name = raw.get("company_name") or raw.get("name") or "Unknown"
-    external_id = raw.get("external_id")
-    company_email = raw.get("company_email") or raw.get("email")
-    contact_email = raw.get("contact_email") or company_email
-
-    payload = {
-        "job_id": job_id,
-        "source": source,
-        "external_id": external_id,
-        "company_name": company_name,
-        "company_domain": _domain_from_url(company_website),
-        "company_website": company_website,
-        "company_phone": raw.get("company_phone") or raw.get("phone"),
-        "company_email": company_email,
-        "street": raw.get("street") or raw.get("address"),
-        "city": raw.get("city"),
-        "state": raw.get("state"),
-        "country": raw.get("country"),
-        "zip_code": raw.get("zip_code"),
-        "latitude": raw.get("latitude"),
-        "longitude": raw.get("longitude"),
-        "rating": raw.get("rating"),
-        "review_count": raw.get("review_count"),
-        "lead_score": lead_score,
-        "raw_data": raw.get("raw_data", raw),
-        "data_sources": raw.get("data_sources", [source]),
-    }
-
-    # Optional fields (Lead model allows None)
-    if contact_email:
-        payload["contact_email"] = contact_email
-    if raw.get("source_urls"):
-        payload["source_urls"] = raw["source_urls"]
-    if raw.get("email_found") is not None:
-        payload["email_found"] = bool(raw["email_found"])
-
-    return payload
+    lead = NormalizedLead.from_raw(raw, source)
+    lead.lead_score = lead_score
+    return lead.to_row(job_id)
@@ -1,36 +1,20 @@
 from typing import Any
-from urllib.parse import urlparse
 
-
-def _domain_from_url(url: str | None) -> str | None:
-    if not url:
-        return None
-    parsed = urlparse(url)
-    host = parsed.netloc.lower().replace("www.", "")
-    return host or None
+from app.config import get_settings
+from app.normalizer.locality import canonicalize_location
+from app.normalizer.normalized_lead import NormalizedLead
 
 
 class LeadStandardizer:
     """Maps raw records from scrapers to canonical Lead fields."""
 
-    FIELD_MAP = {
-        "name": "company_name",
-        "website": "company_website",
-        "phone": "company_phone",
-        "email": "company_email",
-        "address": "street",
-        "formatted_address": "street",
-    }
+    def __init__(self) -> None:
+        self.fill_coordinates = get_settings().fill_approximate_coordinates
+
+    def standardize(self, row: dict[str, Any] | NormalizedLead) -> NormalizedLead:
+        """Convert raw scraper output to a normalized record (records from ``BaseScraper.normalize`` pass through).
 
-    def standardize(self, row: dict[str, Any]) -> dict[str, Any]:
-        """Convert raw scraper output to canonical field names."""
-        standardized = dict(row)
-        for src, target in self.FIELD_MAP.items():
-            if src in standardized and standardized.get(src) is not None:
-                if target not in standardized or standardized.get(target) is None:
-                    standardized[target] = standardized[src]
-        if "company_website" in standardized and "company_domain" not in standardized:
-            domain = _domain_from_url(standardized.get("company_website"))
-            if domain:
-                standardized["company_domain"] = domain
-        return standardized
+        City, state and country are canonicalized against the offline gazetteer.
+        """
+        record = NormalizedLead.from_raw(row)
+        return canonicalize_location(record, self.fill_coordinates)
@@ -1,20 +1,24 @@
 """Task manager that runs the full generation pipeline via orchestrator."""
 
+import hashlib
 import logging
 from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import delete
+from sqlalchemy import func, select, tuple_
 
 from app.config import get_settings
 from app.database import AsyncSessionFactory
 from app.intelligence.deduplicator import build_dedupe_key
+from app.intelligence.entity_resolver import EntityResolver
 from app.intelligence.intent_detector import IntentDetector
 from app.models import GenerationJob, JobStatus, Lead
-from app.normalizer.normalized_lead import normalize_to_lead_payload
+from app.normalizer.normalized_lead import NormalizedLead, lead_rows
 from app.normalizer.standardizer import LeadStandardizer
 from app.scrapers.registry import DEFAULT_SOURCES, get_scraper
 from app.scoring import score_lead
+from app.services.company_registry import is_fresh, resolve_companies, store_ai_profiles
+from app.services.lead_store import upsert_leads
 
 
 def _get_provider_error_message(sources: list[str]) -> str | None:
@@ -46,15 +50,73 @@ def _get_provider_error_message(sources: list[str]) -> str | None:
     return "No valid data source configured. Enable google_maps, google_search, or yellow_pages"
 
 
+def _is_reusable_profile(profile: dict) -> bool:
+    """Only real model output is stored on the company; errors and mock data are not."""
+    return bool(profile) and "error" not in profile and profile.get("source") != "mock_heuristics"
+
+
 class TaskManager:
     """Thin wrapper kept for import compatibility."""
 
-    async def enqueue_generation(self, job_id: UUID) -> None:
-        await run_generation_job(job_id)
+    async def enqueue_generation(self, job_id: UUID, refresh: bool = False) -> None:
+        await run_generation_job(job_id, refresh=refresh)
+
+
+async def _load_known_fingerprints(
+    job_id: UUID,
+) -> tuple[dict[str, dict[str, str | None]], dict[tuple[str, str], tuple[str, str]]]:
+    """Return {source: {external_id: fingerprint}} for listings already stored on the job.
+
+    Listings merged into another lead by entity resolution are included with
+    the fingerprint they had when merged. The second mapping takes each such
+    (source, external_id) to the (source, external_id) of the lead it lives in.
+    """
+    known: dict[str, dict[str, str | None]] = {}
+    merged_into: dict[tuple[str, str], tuple[str, str]] = {}
+    async with AsyncSessionFactory() as session:
+        result = await session.execute(
+            select(Lead.source, Lead.external_id, Lead.fingerprint, Lead.raw_data["merged_from"]).where(
+                Lead.job_id == job_id,
+                Lead.external_id.is_not(None),
+            )
+        )
+        for source, external_id, fingerprint, merged_from in result.all():
+            known.setdefault(source, {})[external_id] = fingerprint
+            for entry in merged_from if isinstance(merged_from, list) else []:
+                if not isinstance(entry, dict) or not entry.get("source") or not entry.get("external_id"):
+                    continue
+                # Leads merged before per-listing fingerprints were kept fall back to the lead's own.
+                known.setdefault(entry["source"], {}).setdefault(
+                    entry["external_id"], entry.get("fingerprint", fingerprint)
+                )
+                merged_into[(entry["source"], entry["external_id"])] = (source, external_id)
+    return known, merged_into
+
+
+async def _load_stored_records(job_id: UUID, keys: set[tuple[str, str]]) -> list[NormalizedLead]:
+    """Stored leads with these (source, external_id) keys, as records that can be merged again."""
+    if not keys:
+        return []
+    columns = Lead.__table__.columns.keys()
+    async with AsyncSessionFactory() as session:
+        leads = (
+            await session.scalars(
+                select(Lead).where(
+                    Lead.job_id == job_id,
+                    tuple_(Lead.source, Lead.external_id).in_(keys),
+                )
+            )
+        ).all()
+    return [NormalizedLead.from_raw({c: getattr(lead, c) for c in columns}, lead.source) for lead in leads]
 
 
-async def run_generation_job(job_id: UUID) -> None:
-    """Run the multi-source generation pipeline."""
+async def run_generation_job(job_id: UUID, refresh: bool = False) -> None:
+    """Run the multi-source generation pipeline.
+
+    With ``refresh=True`` the job's search is re-run and diffed against its
+    stored leads by (source, external_id): only new or changed listings are
+    fetched, enriched, scored and written; unchanged leads are left untouched.
+    """
     async with AsyncSessionFactory() as session:
         job = await session.get(GenerationJob, job_id)
         if not job:
@@ -88,79 +150,122 @@ async def run_generation_job(job_id: UUID) -> None:
         await session.commit()
 
     standardizer = LeadStandardizer()
-    all_raw: list[dict] = []
+    records: list[NormalizedLead] = []
     seen: set[str] = set()
+    known, merged_into = await _load_known_fingerprints(job_id) if refresh else ({}, {})
+    # Surviving leads whose merged-in listing changed; they are merged with it again.
+    remerge: set[tuple[str, str]] = set()
+    new_count = changed_count = unchanged_count = 0
 
     try:
         for source in sources:
             scraper = get_scraper(source)
             if not scraper:
                 continue
+            known_for_source = known.get(scraper.source_name, {})
             try:
                 raw_list = await scraper.scrape(
                     query=query,
                     location=location,
                     max_results=max_results,
                     industry=industry,
+                    known=known_for_source,
                 )
+                # Listings the scraper skipped itself never reach the diff below.
+                unchanged_count += scraper.skipped_unchanged
                 for raw in raw_list:
-                    std = standardizer.standardize(raw)
-                    std["source"] = scraper.source_name
-                    key = build_dedupe_key(std, scraper.source_name)
+                    record = standardizer.standardize(raw)
+                    record.source = scraper.source_name
+                    key = build_dedupe_key(record, scraper.source_name)
                     if key in seen:
                         continue
                     seen.add(key)
-                    all_raw.append(std)
+                    if not record.external_id:
+                        # Upserts key on external_id; derive a stable one from the fallback key.
+                        record.external_id = hashlib.sha1(key.encode("utf-8")).hexdigest()
+                    if refresh:
+                        if record.external_id in known_for_source:
+                            if known_for_source[record.external_id] == record.fingerprint:
+                                unchanged_count += 1
+                                continue
+                            changed_count += 1
+                            survivor = merged_into.get((scraper.source_name, record.external_id))
+                            if survivor:
+                                remerge.add(survivor)
+                        else:
+                            new_count += 1
+                    records.append(record)
             except Exception:
                 continue
 
+        # A changed listing that was merged into an unchanged lead is merged with the stored lead
+        # again instead of being inserted on its own.
+        scraped = {(r.source, r.external_id) for r in records}
+        records.extend(await _load_stored_records(job_id, remerge - scraped))
+
+        # Merge the same business found by several sources into one lead.
+        records = EntityResolver().resolve(records)
+
+        # Link every record to its canonical company; AI profiles stored there are reused.
+        async with AsyncSessionFactory() as session:
+            companies = await resolve_companies(session, records)
+            await session.commit()
+        profiles: dict[UUID, dict] = {
+            c.id: c.enrichment["ai_profile"]
+            for c in companies
+            if c is not None and (c.enrichment or {}).get("ai_profile") and is_fresh(c.enriched_at)
+        }
+        new_profiles: dict[UUID, dict] = {}
+
         intent_detector = IntentDetector()
-        lead_payloads: list[dict] = []
-        for raw in all_raw:
-            score = score_lead(
-                rating=raw.get("rating"),
-                review_count=raw.get("review_count"),
-                website=raw.get("company_website"),
-                phone=raw.get("company_phone"),
-                address=raw.get("street") or raw.get("address"),
+        for record, company in zip(records, companies):
+            record.lead_score = score_lead(
+                rating=record.rating,
+                review_count=record.review_count,
+                website=record.company_website,
+                phone=record.company_phone,
+                address=record.street,
             )
-            intent_score = intent_detector.detect(raw)
-            
+            record.intent_score = intent_detector.detect(record)
+            if company is not None:
+                record.company_id = company.id
+
             # AI Enrichment
-            ai_enrichment = {}
-            try:
-                from app.ai.enrichment import enrichment_service
-                ai_enrichment = await enrichment_service.enrich_lead(raw)
-                raw["ai_enrichment"] = ai_enrichment
-            except Exception as e:
-                # Log but continue without enrichment
-                import logging
-                logging.getLogger(__name__).warning(f"AI enrichment failed: {e}")
-                raw["ai_enrichment"] = {"error": str(e), "source": "failed"}
-            
-            payload = normalize_to_lead_payload(
-                raw,
-                source=raw.get("source", "unknown"),
-                job_id=job_id,
-                lead_score=score,
-            )
-            payload["intent_score"] = intent_score
-            # Store AI enrichment in raw_data
-            if ai_enrichment:
-                payload["raw_data"]["ai_enrichment"] = ai_enrichment
-                payload["is_enriched"] = True
-            lead_payloads.append(Lead(**payload))
+            ai_enrichment = profiles.get(company.id, {}) if company is not None else {}
+            if not ai_enrichment:
+                try:
+                    from app.ai.enrichment import enrichment_service
+                    ai_enrichment = await enrichment_service.enrich_lead(record)
+                    if company is not None and _is_reusable_profile(ai_enrichment):
+                        profiles[company.id] = new_profiles[company.id] = ai_enrichment
+                except Exception as e:
+                    # Log but continue without enrichment
+                    import logging
+                    logging.getLogger(__name__).warning(f"AI enrichment failed: {e}")
+            # Stored in raw_data and marks the lead enriched
+            record.ai_enrichment = ai_enrichment or None
 
         async with AsyncSessionFactory() as session:
-            await session.execute(delete(Lead).where(Lead.job_id == job_id))
-            session.add_all(lead_payloads)
+            if new_profiles:
+                await store_ai_profiles(session, new_profiles)
+            upserted = await upsert_leads(session, lead_rows(records, job_id))
 
             job = await session.get(GenerationJob, job_id)
             if job:
+                total = await session.scalar(
+                    select(func.count()).select_from(Lead).where(Lead.job_id == job_id)
+                ) or 0
                 job.status = JobStatus.completed
-                job.total_results = len(lead_payloads)
-                job.total_final_leads = len(lead_payloads)
+                job.total_results = total
+                job.total_final_leads = total
                 job.completed_at = datetime.utcnow()
+                job.status_message = f"{upserted.inserted} leads inserted, {upserted.updated} updated"
+                if refresh:
+                    job.last_refreshed_at = job.completed_at
+                    job.status_message = (
+                        f"Refresh: {new_count} new, {changed_count} changed, {unchanged_count} unchanged"
+                        f" ({upserted.inserted} inserted, {upserted.updated} updated)"
+                    )
                 await session.commit()
 
     except Exception as exc:
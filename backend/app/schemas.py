@@ -26,13 +26,16 @@ class JobResponse(BaseModel):
     location: str
     max_results: int
     status: JobStatus
+    progress_percent: int = 0
     total_results: int
     error_message: str | None
+    status_message: str | None = None
     industry: str | None = None
     sources_enabled: list[str] | None = None
     created_at: datetime
     started_at: datetime | None
     completed_at: datetime | None
+    last_refreshed_at: datetime | None = None
 
     model_config = {"from_attributes": True}
 
@@ -1,6 +1,8 @@
+import hashlib
 from abc import ABC, abstractmethod
 from typing import Any
 
+from app.normalizer.normalized_lead import NormalizedLead
 from app.utils.rate_limiter import RateLimiter
 
 
@@ -16,6 +18,8 @@ class BaseScraper(ABC):
         requests_per_minute: int = 30,
     ):
         self.rate_limiter = rate_limiter or RateLimiter(requests_per_minute=requests_per_minute)
+        # Known listings the last scrape() left out because their fingerprint was unchanged.
+        self.skipped_unchanged = 0
 
     @abstractmethod
     async def scrape(
@@ -24,33 +28,40 @@ class BaseScraper(ABC):
         location: str,
         max_results: int = 40,
         **kwargs: Any,
-    ) -> list[dict[str, Any]]:
+    ) -> list[NormalizedLead]:
         """
-        Scrape and return list of normalized lead dicts.
+        Scrape and return list of normalized lead records.
         Each dict should have: company_name, company_website, company_phone,
         street/city/state/country/zip_code, external_id, source, raw_data.
+
+        Refresh runs pass ``known={external_id: fingerprint}``; scrapers with a
+        separate details call may skip it for listings whose fingerprint is unchanged,
+        counting them in ``skipped_unchanged``.
         """
         raise NotImplementedError
 
-    def normalize(self, data: dict[str, Any]) -> dict[str, Any]:
-        """Convert raw record to normalized shape."""
-        raw = data.get("raw") or data
-        return {
-            "company_name": data.get("company_name") or data.get("name") or "Unknown",
-            "company_website": data.get("company_website") or data.get("website"),
-            "company_phone": data.get("company_phone") or data.get("phone"),
-            "company_email": data.get("company_email") or data.get("email"),
-            "city": data.get("city"),
-            "state": data.get("state"),
-            "country": data.get("country"),
-            "street": data.get("street") or data.get("address"),
-            "zip_code": data.get("zip_code"),
-            "latitude": data.get("latitude"),
-            "longitude": data.get("longitude"),
-            "rating": data.get("rating"),
-            "review_count": data.get("review_count"),
-            "external_id": data.get("external_id"),
-            "source": self.source_name,
-            "raw_data": raw,
-            "data_sources": [self.source_name],
-        }
+    FINGERPRINT_FIELDS = (
+        "company_name",
+        "company_website",
+        "company_phone",
+        "company_email",
+        "street",
+        "city",
+        "state",
+        "zip_code",
+        "rating",
+        "review_count",
+    )
+
+    @classmethod
+    def fingerprint(cls, record: dict[str, Any]) -> str:
+        """Stable hash of the listing fields used to detect changes between runs."""
+        parts = "\x1f".join(str(record.get(f) or "") for f in cls.FINGERPRINT_FIELDS)
+        return hashlib.sha1(parts.encode("utf-8")).hexdigest()
+
+    def normalize(self, data: dict[str, Any]) -> NormalizedLead:
+        """Convert raw record to a normalized lead record."""
+        normalized = NormalizedLead.from_raw(data, self.source_name)
+        normalized.data_sources = [self.source_name]
+        normalized.fingerprint = data.get("fingerprint") or self.fingerprint(normalized)
+        return normalized
@@ -1,6 +1,8 @@
+import hashlib
 from typing import Any
 
 from app.config import get_settings
+from app.normalizer.normalized_lead import NormalizedLead
 from app.providers.google_places import GooglePlacesClient
 from app.scrapers.base_scraper import BaseScraper
 
@@ -16,20 +18,35 @@ class GoogleMapsScraper(BaseScraper):
             timeout_seconds=settings.request_timeout_seconds,
         )
 
+    @staticmethod
+    def place_fingerprint(place: dict[str, Any]) -> str:
+        """Fingerprint from the text-search listing alone, so unchanged places need no details call."""
+        parts = "\x1f".join(
+            str(place.get(f) or "")
+            for f in ("name", "formatted_address", "rating", "user_ratings_total", "business_status")
+        )
+        return hashlib.sha1(parts.encode("utf-8")).hexdigest()
+
     async def scrape(
         self,
         query: str,
         location: str,
         max_results: int = 40,
         **kwargs: Any,
-    ) -> list[dict[str, Any]]:
+    ) -> list[NormalizedLead]:
         max_results = max_results or int(kwargs.get("max_results", 40))
+        known: dict[str, str] = kwargs.get("known") or {}
         rows = await self.client.search(query=query, location=location, max_results=max_results)
-        normalized: list[dict[str, Any]] = []
+        normalized: list[NormalizedLead] = []
+        self.skipped_unchanged = 0
 
         for place in rows:
             details = {}
             place_id = place.get("place_id")
+            fingerprint = self.place_fingerprint(place)
+            if place_id and known.get(place_id) == fingerprint:
+                self.skipped_unchanged += 1
+                continue
             if place_id:
                 details = await self.client.details(place_id)
 
@@ -57,6 +74,7 @@ class GoogleMapsScraper(BaseScraper):
                         "rating": place.get("rating"),
                         "review_count": place.get("user_ratings_total"),
                         "external_id": place.get("place_id"),
+                        "fingerprint": fingerprint,
                         "raw": {"place": place, "details": details},
                     }
                 )
@@ -2,9 +2,9 @@
 
 import logging
 from typing import Any
-from urllib.parse import urlparse
 
 from app.config import get_settings
+from app.normalizer.normalized_lead import NormalizedLead
 from app.providers.broker_queries import get_broker_queries
 from app.providers.google_custom_search import GoogleCustomSearchClient
 from app.scrapers.base_scraper import BaseScraper
@@ -61,7 +61,7 @@ class GoogleSearchScraper(BaseScraper):
         max_results: int = 40,
         industry: str | None = None,
         **kwargs: Any,
-    ) -> list[dict[str, Any]]:
+    ) -> list[NormalizedLead]:
         if not self.client.api_key or not self.client.engine_id:
             return []
 
@@ -69,7 +69,7 @@ class GoogleSearchScraper(BaseScraper):
         search_phrases = get_broker_queries(industry, query, location)
         per_query = max(5, max_results // len(search_phrases))
         seen_urls: set[str] = set()
-        all_normalized: list[dict[str, Any]] = []
+        all_normalized: list[NormalizedLead] = []
 
         for phrase in search_phrases:
             if len(all_normalized) >= max_results:
@@ -90,7 +90,6 @@ class GoogleSearchScraper(BaseScraper):
 
                 title = item.get("title") or ""
                 snippet = item.get("snippet") or ""
-                display_link = item.get("displayLink") or ""
                 combined_text = f"{title} {snippet}"
 
                 # Step 3: Parse contact info from snippet
@@ -98,7 +97,6 @@ class GoogleSearchScraper(BaseScraper):
                 email = contact.get("email")
                 phone = contact.get("phone")
 
-                domain = urlparse(link).netloc.replace("www.", "") if link else display_link
                 company_name = _clean_title(title)
 
                 raw = {
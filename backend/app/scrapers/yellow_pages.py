@@ -5,6 +5,7 @@ import httpx
 from bs4 import BeautifulSoup
 
 from app.config import get_settings
+from app.normalizer.normalized_lead import NormalizedLead
 from app.scrapers.base_scraper import BaseScraper
 
 
@@ -23,8 +24,8 @@ class YellowPagesScraper(BaseScraper):
         location: str,
         max_results: int = 40,
         **kwargs: Any,
-    ) -> list[dict[str, Any]]:
-        normalized: list[dict[str, Any]] = []
+    ) -> list[NormalizedLead]:
+        normalized: list[NormalizedLead] = []
         page = 1
         per_page = 30
 
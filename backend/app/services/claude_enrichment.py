@@ -8,6 +8,7 @@ from typing import Any
 import httpx
 
 from app.config import get_settings
+from app.services.vertex_client import generate_content
 
 logger = logging.getLogger(__name__)
 
@@ -128,11 +129,19 @@ _USD_TO_INR = 84.0  # approximate exchange rate
 # Estimated tokens per lead enrichment call
 _AVG_INPUT_TOKENS = 800
 _AVG_OUTPUT_TOKENS = 600
-
-
-def estimate_enrichment_cost(lead_count: int) -> dict[str, Any]:
-    """Return approximate cost for enriching *lead_count* leads."""
-    total_input = _AVG_INPUT_TOKENS * lead_count
+# Batched prompts: shared instructions once per request, plus each lead's data
+_BATCH_PREAMBLE_TOKENS = 700
+_BATCH_LEAD_TOKENS = 100
+
+
+def estimate_enrichment_cost(lead_count: int, batch_size: int | None = None) -> dict[str, Any]:
+    """Return approximate cost for enriching *lead_count* leads, *batch_size* per request."""
+    batch_size = max(1, batch_size or settings.enrichment_batch_size)
+    if batch_size == 1:
+        total_input = _AVG_INPUT_TOKENS * lead_count
+    else:
+        requests = -(-lead_count // batch_size)
+        total_input = _BATCH_PREAMBLE_TOKENS * requests + _BATCH_LEAD_TOKENS * lead_count
     total_output = _AVG_OUTPUT_TOKENS * lead_count
     cost_usd = (
         (total_input / 1_000_000) * _GEMINI_INPUT_PRICE_PER_1M
@@ -141,6 +150,7 @@ def estimate_enrichment_cost(lead_count: int) -> dict[str, Any]:
     cost_inr = cost_usd * _USD_TO_INR
     return {
         "lead_count": lead_count,
+        "batch_size": batch_size,
         "estimated_input_tokens": total_input,
         "estimated_output_tokens": total_output,
         "estimated_cost_usd": round(cost_usd, 4),
@@ -150,55 +160,13 @@ def estimate_enrichment_cost(lead_count: int) -> dict[str, Any]:
     }
 
 
-# ---------------------------------------------------------------------------
-# Vertex AI authentication helper
-# ---------------------------------------------------------------------------
-
-async def _get_vertex_access_token() -> str:
-    """Return a fresh GCP access token using Application Default Credentials."""
-
-    def _refresh_sync() -> str:
-        import google.auth
-        import google.auth.transport.requests
-
-        credentials, _ = google.auth.default(
-            scopes=["https://www.googleapis.com/auth/cloud-platform"]
-        )
-        request = google.auth.transport.requests.Request()
-        credentials.refresh(request)
-        return credentials.token  # type: ignore[return-value]
-
-    return await asyncio.to_thread(_refresh_sync)
-
-
 # ---------------------------------------------------------------------------
 # Core enrichment service
 # ---------------------------------------------------------------------------
 
-def _build_enrichment_prompt(lead: dict[str, Any], industry_hint: str | None) -> str:
-    sector_context = ""
-    if industry_hint and industry_hint.lower() in INDIA_INDUSTRY_CONTEXT:
-        ctx = INDIA_INDUSTRY_CONTEXT[industry_hint.lower()]
-        sector_context = (
-            f"\nIndustry context for {ctx['sector']}:\n"
-            f"- Common AI use cases: {', '.join(ctx['ai_use_cases'][:3])}\n"
-            f"- Typical decision-makers: {', '.join(ctx['typical_buyers'][:3])}\n"
-            f"- Typical budget range: {ctx['budget_range']}\n"
-        )
+_ANALYST_ROLE = "You are an expert B2B sales intelligence analyst specialising in the INDIAN enterprise market."
 
-    return f"""You are an expert B2B sales intelligence analyst specialising in the INDIAN enterprise market.
-Analyse the following business lead and return a JSON object with your findings.
-{sector_context}
-LEAD DATA:
-- Company: {lead.get('company_name') or lead.get('business_name', 'Unknown')}
-- Website: {lead.get('company_website') or lead.get('website', 'Not provided')}
-- City: {lead.get('city', 'Unknown')}, State: {lead.get('state', 'Unknown')}, Country: {lead.get('country', 'India')}
-- Phone: {lead.get('company_phone') or lead.get('phone', 'Not provided')}
-- Industry hint: {industry_hint or 'Not specified'}
-- Rating: {lead.get('rating', 'N/A')}, Reviews: {lead.get('review_count', 0)}
-
-Return ONLY a valid JSON object with these exact keys:
-{{
+_RESPONSE_SCHEMA = """{
   "company_summary": "2-3 sentence summary of the company and its likely AI needs",
   "estimated_size": "micro|small|medium|large|enterprise",
   "estimated_employee_count": "1-10|11-50|51-200|201-500|500+",
@@ -211,19 +179,78 @@ Return ONLY a valid JSON object with these exact keys:
   "urgency_score": 7,
   "talking_points": ["point1", "point2", "point3"],
   "competitive_landscape": "Brief note on competition and positioning"
-}}
+}"""
+
+_MARKET_FOCUS = """Focus on Indian market dynamics: price sensitivity, local language preference,
+regulatory environment (RBI, SEBI, DPDP Act), and digital-India alignment."""
+
+
+def _sector_context(industry_hint: str | None) -> str:
+    if not industry_hint or industry_hint.lower() not in INDIA_INDUSTRY_CONTEXT:
+        return ""
+    ctx = INDIA_INDUSTRY_CONTEXT[industry_hint.lower()]
+    return (
+        f"\nIndustry context for {ctx['sector']}:\n"
+        f"- Common AI use cases: {', '.join(ctx['ai_use_cases'][:3])}\n"
+        f"- Typical decision-makers: {', '.join(ctx['typical_buyers'][:3])}\n"
+        f"- Typical budget range: {ctx['budget_range']}\n"
+    )
+
+
+def _lead_data(lead: dict[str, Any], industry_hint: str | None) -> str:
+    return f"""- Company: {lead.get('company_name') or lead.get('business_name', 'Unknown')}
+- Website: {lead.get('company_website') or lead.get('website', 'Not provided')}
+- City: {lead.get('city', 'Unknown')}, State: {lead.get('state', 'Unknown')}, Country: {lead.get('country', 'India')}
+- Phone: {lead.get('company_phone') or lead.get('phone', 'Not provided')}
+- Industry hint: {industry_hint or 'Not specified'}
+- Rating: {lead.get('rating', 'N/A')}, Reviews: {lead.get('review_count', 0)}"""
+
+
+def _build_enrichment_prompt(lead: dict[str, Any], industry_hint: str | None) -> str:
+    return f"""{_ANALYST_ROLE}
+Analyse the following business lead and return a JSON object with your findings.
+{_sector_context(industry_hint)}
+LEAD DATA:
+{_lead_data(lead, industry_hint)}
+
+Return ONLY a valid JSON object with these exact keys:
+{_RESPONSE_SCHEMA}
 
-Focus on Indian market dynamics: price sensitivity, local language preference,
-regulatory environment (RBI, SEBI, DPDP Act), and digital-India alignment.
+{_MARKET_FOCUS}
 Return only the JSON object — no markdown fences, no extra text."""
 
 
+# An object in a batch answer missing any of these is treated as a failed lead.
+_BATCH_REQUIRED_KEYS = ("company_summary", "ai_adoption_readiness", "urgency_score")
+
+
+def _build_batch_prompt(leads: list[dict[str, Any]], industry_hint: str | None) -> str:
+    """One prompt for several leads: the instructions once, then each lead numbered from 1."""
+    lead_blocks = "\n\n".join(
+        f"LEAD {number}:\n{_lead_data(lead, industry_hint)}" for number, lead in enumerate(leads, 1)
+    )
+    return f"""{_ANALYST_ROLE}
+Analyse each of the {len(leads)} business leads below independently and return a JSON array with one object per lead.
+{_sector_context(industry_hint)}
+{lead_blocks}
+
+Return ONLY a valid JSON array. Each element is a JSON object with "lead_id" (the lead's number above) and these exact keys:
+{_RESPONSE_SCHEMA}
+
+{_MARKET_FOCUS}
+Return only the JSON array — no markdown fences, no extra text."""
+
+
 async def enrich_lead(
     lead: dict[str, Any],
     industry_hint: str | None = None,
+    use_cache: bool = True,
 ) -> dict[str, Any]:
     """Enrich a single lead dict via Gemini on Vertex AI.
 
+    An identical prompt answered before is served from the Vertex response
+    cache unless *use_cache* is False.
+
     Returns the enrichment dict on success, or a minimal error dict on failure.
     """
     if not settings.vertex_project_id:
@@ -231,33 +258,15 @@ async def enrich_lead(
         return {"error": "Vertex AI not configured", "ai_adoption_readiness": "low", "urgency_score": 1}
 
     prompt = _build_enrichment_prompt(lead, industry_hint)
-    endpoint = (
-        f"https://{settings.vertex_location}-aiplatform.googleapis.com/v1"
-        f"/projects/{settings.vertex_project_id}"
-        f"/locations/{settings.vertex_location}"
-        f"/publishers/google/models/{settings.vertex_model}:generateContent"
-    )
 
     try:
-        token = await _get_vertex_access_token()
-        payload = {
-            "contents": [{"role": "user", "parts": [{"text": prompt}]}],
-            "generationConfig": {
-                "temperature": 0.3,
-                "maxOutputTokens": 1024,
-            },
-        }
-        async with httpx.AsyncClient(timeout=settings.enrichment_timeout) as client:
-            response = await client.post(
-                endpoint,
-                headers={"Authorization": f"Bearer {token}", "Content-Type": "application/json"},
-                json=payload,
-            )
-            response.raise_for_status()
-            data = response.json()
-
-        raw_text = data["candidates"][0]["content"]["parts"][0]["text"].strip()
-        return _parse_json_response(raw_text)
+        result = await generate_content(
+            prompt,
+            {"temperature": 0.3, "maxOutputTokens": 1024},
+            use_cache=use_cache,
+            validate=_is_json_object,
+        )
+        return _parse_json_response(result.text)
 
     except httpx.HTTPStatusError as exc:
         logger.error("Vertex AI HTTP error %s: %s", exc.response.status_code, exc.response.text[:300])
@@ -267,8 +276,8 @@ async def enrich_lead(
     return {"error": "enrichment_failed", "ai_adoption_readiness": "low", "urgency_score": 1}
 
 
-def _parse_json_response(text: str) -> dict[str, Any]:
-    """Extract a JSON object from the model's text output."""
+def _extract_json(text: str) -> Any | None:
+    """The JSON value in the model's text output, or None if there is none."""
     # Strip markdown code fences if present
     if "```" in text:
         text = text.split("```")[-2] if text.count("```") >= 2 else text.replace("```", "")
@@ -288,6 +297,19 @@ def _parse_json_response(text: str) -> dict[str, Any]:
             return json.loads(text[start:end])
         except json.JSONDecodeError:
             pass
+    return None
+
+
+def _is_json_object(text: str) -> bool:
+    """Whether a response is worth caching: it holds a parseable JSON object."""
+    return isinstance(_extract_json(text), dict)
+
+
+def _parse_json_response(text: str) -> dict[str, Any]:
+    """Extract a JSON object from the model's text output."""
+    parsed = _extract_json(text)
+    if parsed is not None:
+        return parsed
 
     logger.warning("Could not parse enrichment JSON; returning fallback")
     return {
@@ -301,19 +323,87 @@ def _parse_json_response(text: str) -> dict[str, Any]:
     }
 
 
+def _parse_batch_response(text: str, count: int) -> dict[int, dict[str, Any]]:
+    """Valid per-lead objects from a batch answer, by 0-based lead index.
+
+    Objects are read one at a time, so a truncated array still yields the
+    leads that were completed. Objects without a known lead_id or without
+    the core keys are dropped (and retried by the caller).
+    """
+    decoder = json.JSONDecoder()
+    results: dict[int, dict[str, Any]] = {}
+    pos = text.find("[") + 1
+    while True:
+        start = text.find("{", pos)
+        if start == -1:
+            break
+        try:
+            obj, pos = decoder.raw_decode(text, start)
+        except json.JSONDecodeError:
+            break
+        if not isinstance(obj, dict):
+            continue
+        try:
+            index = int(obj.pop("lead_id")) - 1
+        except (KeyError, TypeError, ValueError):
+            continue
+        if 0 <= index < count and index not in results and all(k in obj for k in _BATCH_REQUIRED_KEYS):
+            results[index] = obj
+    return results
+
+
 async def batch_enrich_leads(
     leads: list[dict[str, Any]],
     industry_hint: str | None = None,
-    concurrency: int = 3,
+    concurrency: int | None = None,
+    use_cache: bool = True,
+    batch_size: int | None = None,
 ) -> list[dict[str, Any]]:
     """Enrich multiple leads with bounded concurrency.
 
+    *concurrency* only caps the requests queued at once (default
+    ``vertex_max_concurrency``). The actual pace is set by the Vertex rate
+    controller, which adapts to the quota and to throttling.
+
+    Leads are sent *batch_size* per request (``enrichment_batch_size`` by
+    default; 1 sends one request per lead). Leads missing from a batch
+    answer, or in a failed batch, are retried one request each.
+
     Returns a list of enrichment dicts in the same order as *leads*.
     """
-    semaphore = asyncio.Semaphore(concurrency)
+    batch_size = max(1, batch_size or settings.enrichment_batch_size)
+    semaphore = asyncio.Semaphore(concurrency or settings.vertex_max_concurrency)
 
     async def _bounded(lead: dict[str, Any]) -> dict[str, Any]:
         async with semaphore:
-            return await enrich_lead(lead, industry_hint)
+            return await enrich_lead(lead, industry_hint, use_cache)
 
-    return await asyncio.gather(*[_bounded(lead) for lead in leads])
+    async def _batch(chunk: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        if len(chunk) == 1 or not settings.vertex_project_id:
+            return await asyncio.gather(*[_bounded(lead) for lead in chunk])
+        parsed: dict[int, dict[str, Any]] = {}
+        async with semaphore:
+            try:
+                result = await generate_content(
+                    _build_batch_prompt(chunk, industry_hint),
+                    {"temperature": 0.3, "maxOutputTokens": 1024 * len(chunk)},
+                    use_cache=use_cache,
+                    # A partial answer is used but not cached; its missing leads are retried below.
+                    validate=lambda text: len(_parse_batch_response(text, len(chunk))) == len(chunk),
+                    timeout=settings.enrichment_batch_timeout,
+                )
+                parsed = _parse_batch_response(result.text, len(chunk))
+            except httpx.HTTPStatusError as exc:
+                logger.error("Vertex AI batch HTTP error %s: %s", exc.response.status_code, exc.response.text[:300])
+            except Exception as exc:
+                logger.error("Vertex AI batch enrichment failed: %s", exc)
+        missing = [i for i in range(len(chunk)) if i not in parsed]
+        if missing:
+            logger.info("Retrying %d of %d leads from a batch one by one", len(missing), len(chunk))
+            for i, enrichment in zip(missing, await asyncio.gather(*[_bounded(chunk[i]) for i in missing])):
+                parsed[i] = enrichment
+        return [parsed[i] for i in range(len(chunk))]
+
+    chunks = [leads[i : i + batch_size] for i in range(0, len(leads), batch_size)]
+    results = await asyncio.gather(*[_batch(chunk) for chunk in chunks])
+    return [enrichment for chunk in results for enrichment in chunk]
@@ -0,0 +1,204 @@
+"""Canonical company resolution: link leads to one shared ``Company`` row.
+
+Companies are keyed by Google place_id and by website domain. Enrichment
+stored on a company (AI profile, Clearbit, technologies, contacts) is reused by
+every lead and job that resolves to it until it is older than
+``company_enrichment_ttl_days``.
+"""
+
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.intelligence.entity_resolver import business_domain
+from app.models import Company, Lead
+
+logger = logging.getLogger(__name__)
+
+PLACE_SOURCES = ("google_maps", "google_places")
+
+
+def company_keys(record: dict[str, Any]) -> tuple[str | None, str | None]:
+    """Return (place_id, domain) identifying the record's company."""
+    place_id = record.get("external_id") if record.get("source") in PLACE_SOURCES else None
+    return place_id or None, business_domain(record)
+
+
+def is_fresh(timestamp: datetime | None) -> bool:
+    if timestamp is None:
+        return False
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    ttl = timedelta(days=get_settings().company_enrichment_ttl_days)
+    return datetime.now(timezone.utc) - timestamp < ttl
+
+
+async def _load(session: AsyncSession, place_ids: set[str], domains: set[str]) -> list[Company]:
+    clauses = []
+    if place_ids:
+        clauses.append(Company.place_id.in_(place_ids))
+    if domains:
+        clauses.append(Company.domain.in_(domains))
+    if not clauses:
+        return []
+    result = await session.execute(select(Company).where(or_(*clauses)))
+    return list(result.scalars().all())
+
+
+async def resolve_companies(session: AsyncSession, records: list[dict[str, Any]]) -> list[Company | None]:
+    """Find or create the company for each record (aligned with ``records``).
+
+    Records with neither a place_id nor a usable domain resolve to None. One
+    SELECT finds existing companies, missing ones are inserted in a single
+    statement, and keys a company learns (e.g. a domain for a place-only
+    company) are backfilled. The caller commits.
+    """
+    keys = [company_keys(r) for r in records]
+    place_ids = {p for p, _ in keys if p}
+    domains = {d for _, d in keys if d}
+    if not place_ids and not domains:
+        return [None] * len(records)
+
+    by_place: dict[str, Company] = {}
+    by_domain: dict[str, Company] = {}
+
+    def attach() -> list[Company | None]:
+        """Match records to known companies, backfilling keys a company didn't have yet."""
+        matched: list[Company | None] = []
+        for place_id, domain in keys:
+            company = (place_id and by_place.get(place_id)) or (domain and by_domain.get(domain)) or None
+            if company is not None:
+                if place_id and not company.place_id and place_id not in by_place:
+                    company.place_id = place_id
+                    by_place[place_id] = company
+                if domain and not company.domain and domain not in by_domain:
+                    company.domain = domain
+                    by_domain[domain] = company
+            matched.append(company)
+        return matched
+
+    for company in await _load(session, place_ids, domains):
+        if company.place_id:
+            by_place[company.place_id] = company
+        if company.domain:
+            by_domain[company.domain] = company
+    matched = attach()
+
+    # Group unmatched records so records sharing either key create one row.
+    pending: dict[str, dict[str, Any]] = {}
+    for record, (place_id, domain), company in zip(records, keys, matched):
+        if company is not None:
+            continue
+        row = (place_id and pending.get(f"p:{place_id}")) or (domain and pending.get(f"d:{domain}"))
+        if not row:
+            row = {
+                "name": record.get("company_name") or record.get("name") or "Unknown",
+                "place_id": None,
+                "domain": None,
+                "website": record.get("company_website") or record.get("website"),
+                "phone": record.get("company_phone") or record.get("phone"),
+                "industry": record.get("industry"),
+            }
+        if place_id and not row["place_id"]:
+            row["place_id"] = place_id
+            pending[f"p:{place_id}"] = row
+        if domain and not row["domain"]:
+            row["domain"] = domain
+            pending[f"d:{domain}"] = row
+
+    new_rows = list({id(r): r for r in pending.values()}.values())
+    if not new_rows:
+        return matched
+
+    now = datetime.utcnow()
+    for row in new_rows:
+        row.update(technologies=[], enrichment={}, contacts=[], created_at=now, updated_at=now)
+    # Backfilled keys must be flushed first so the insert sees them as taken.
+    await session.flush()
+    # executemany form: SQLAlchemy pages the VALUES list under the bind-parameter limit.
+    await session.execute(pg_insert(Company.__table__).on_conflict_do_nothing(), new_rows)
+    for company in await _load(session, place_ids, domains):
+        if company.place_id:
+            by_place.setdefault(company.place_id, company)
+        if company.domain:
+            by_domain.setdefault(company.domain, company)
+    return attach()
+
+
+def _lead_record(lead: Lead) -> dict[str, Any]:
+    return {
+        "source": lead.source,
+        "external_id": lead.external_id,
+        "company_name": lead.company_name,
+        "company_domain": lead.company_domain,
+        "company_website": lead.company_website,
+        "company_phone": lead.company_phone,
+    }
+
+
+async def get_lead_companies(session: AsyncSession, leads: list[Lead]) -> list[Company | None]:
+    """Companies for the given leads, resolving and linking older unlinked leads in bulk."""
+    linked_ids = {lead.company_id for lead in leads if lead.company_id}
+    linked: dict[UUID, Company] = {}
+    if linked_ids:
+        result = await session.execute(select(Company).where(Company.id.in_(linked_ids)))
+        linked = {c.id: c for c in result.scalars().all()}
+
+    unlinked = [lead for lead in leads if not lead.company_id]
+    resolved = await resolve_companies(session, [_lead_record(lead) for lead in unlinked]) if unlinked else []
+    for lead, company in zip(unlinked, resolved):
+        if company is not None:
+            lead.company_id = company.id
+            linked[company.id] = company
+    return [linked.get(lead.company_id) if lead.company_id else None for lead in leads]
+
+
+async def get_lead_company(session: AsyncSession, lead: Lead) -> Company | None:
+    """Company linked to a lead, resolving and linking it first for older leads."""
+    return (await get_lead_companies(session, [lead]))[0]
+
+
+def merge_contacts(existing: list[dict], found: list[dict]) -> list[dict]:
+    """Merge contact dicts by email; verified results and known names win."""
+    by_email: dict[str, dict] = {c["email"]: dict(c) for c in existing if c.get("email")}
+    for contact in found:
+        email = contact.get("email")
+        if not email:
+            continue
+        current = by_email.setdefault(email, {})
+        for key, value in contact.items():
+            if key == "verified":
+                current[key] = bool(current.get(key) or value)
+            elif value not in (None, "") and not current.get(key):
+                current[key] = value
+    return sorted(by_email.values(), key=lambda c: (not c.get("verified"), -(c.get("confidence") or 0)))
+
+
+async def store_ai_profiles(session: AsyncSession, profiles: dict[UUID, dict]) -> None:
+    """Save pipeline AI profiles on their companies (caller commits)."""
+    result = await session.execute(select(Company).where(Company.id.in_(profiles)))
+    now = datetime.utcnow()
+    for company in result.scalars().all():
+        company.enrichment = {**(company.enrichment or {}), "ai_profile": profiles[company.id]}
+        company.enriched_at = now
+
+
+def cached_company_analysis(company: Company | None, industry_hint: str | None) -> dict | None:
+    """Fresh Gemini analysis stored on the company for this industry hint, if any."""
+    if company is None or not is_fresh(company.ai_enriched_at):
+        return None
+    return (company.ai_enrichment or {}).get(industry_hint or "")
+
+
+def store_company_analysis(company: Company | None, industry_hint: str | None, analysis: dict) -> None:
+    """Keep a successful Gemini analysis on the company, keyed by industry hint."""
+    if company is None or not analysis or "error" in analysis:
+        return
+    company.ai_enrichment = {**(company.ai_enrichment or {}), industry_hint or "": analysis}
+    company.ai_enriched_at = datetime.utcnow()
@@ -0,0 +1,279 @@
+"""Email finding and verification for a single lead's domain or for a whole job.
+
+``run_email_enrichment_job`` groups a generation job's leads by registrable
+domain. Leads on hosts shared by many businesses (social and directory
+sites) are skipped. For each domain it runs the finder and verifier once for the
+company's general contacts, plus once per distinct named contact. A
+company whose contacts are still fresh is answered without any finder
+call. Up to ``email_enrichment_concurrency`` domains are processed at a
+time, and provider calls are paced by the per-provider RPM budgets.
+Results are written back to leads and companies in batched updates, and
+the run's progress is updated with each batch.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import bindparam, select, update
+
+from app.config import get_settings
+from app.database import AsyncSessionFactory
+from app.email_finder.finder_engine import EmailFinderEngine
+from app.email_finder.verifier import EmailVerifier
+from app.intelligence.entity_resolver import business_domain
+from app.models import Company, EmailEnrichmentJob, GenerationJob, JobStatus, Lead
+from app.services.company_registry import get_lead_companies, is_fresh, merge_contacts
+
+logger = logging.getLogger(__name__)
+
+_FLUSH_DOMAINS = 25
+
+
+async def find_contacts(
+    engine: EmailFinderEngine,
+    verifier: EmailVerifier,
+    domain: str,
+    first_name: str | None,
+    last_name: str | None,
+    industry: str | None = None,
+) -> list[dict]:
+    """Run the email finder and verify its candidates; the first valid one is marked verified and sorted first.
+
+    Candidates the finder already verified keep its verdict instead of being checked again.
+    Checked contacts carry the verifier's reason under ``verification``. Pattern guesses
+    carry the name they were built from; the two together decide whether they are
+    evidence for the pattern store.
+    """
+    candidates = await engine.find_emails(
+        domain=domain,
+        first_name=first_name,
+        last_name=last_name,
+        limit=3,
+        industry=industry,
+    )
+    guessed = (first_name, last_name) if first_name and last_name else (None, None)
+    contacts = [
+        {
+            "email": c.email,
+            "first_name": c.first_name or (guessed[0] if c.source == "pattern" else None),
+            "last_name": c.last_name or (guessed[1] if c.source == "pattern" else None),
+            "position": c.position,
+            "source": c.source,
+            "confidence": c.confidence,
+            "verified": False,
+        }
+        for c in candidates
+    ]
+    unchecked = [i for i, c in enumerate(candidates) if c.verified is None]
+    verdicts = await verifier.verify_many([contacts[i]["email"] for i in unchecked])
+    for i, verdict in zip(unchecked, verdicts):
+        contacts[i]["verification"] = verdict.reason
+    valid = {i for i, c in enumerate(candidates) if c.verified}
+    valid.update(i for i, verdict in zip(unchecked, verdicts) if verdict.status == "valid")
+    if valid:
+        contacts[min(valid)]["verified"] = True
+    return sorted(contacts, key=lambda c: not c["verified"])
+
+
+def apply_best_contact(lead: dict[str, Any], contacts: list[dict]) -> bool:
+    """Copy the best contact onto a lead's column values; False when there is none."""
+    if not contacts:
+        return False
+    best = contacts[0]
+    lead["contact_email"] = best["email"]
+    lead["email_found"] = True
+    lead["email_verified"] = bool(best.get("verified"))
+    if best.get("verified"):
+        lead["contact_first_name"] = best.get("first_name") or lead["contact_first_name"]
+        lead["contact_last_name"] = best.get("last_name") or lead["contact_last_name"]
+        lead["contact_title"] = best.get("position") or lead["contact_title"]
+    return True
+
+
+@dataclass
+class _Domain:
+    domain: str
+    company: Company | None
+    leads: list[dict[str, Any]] = field(default_factory=list)
+    # Filled in by _enrich_domain
+    company_contacts: list[dict] | None = None
+    reused: bool = False
+
+
+async def _enrich_domain(
+    item: _Domain, engine: EmailFinderEngine, verifier: EmailVerifier, industry: str | None
+) -> None:
+    company = item.company
+    industry = (company.industry if company is not None else None) or industry
+    unnamed = [lead for lead in item.leads if not (lead["contact_first_name"] or lead["contact_last_name"])]
+    named: dict[tuple[str, str], list[dict]] = {}
+    for lead in item.leads:
+        if lead["contact_first_name"] or lead["contact_last_name"]:
+            key = (lead["contact_first_name"] or "", lead["contact_last_name"] or "")
+            named.setdefault(key, []).append(lead)
+
+    if unnamed:
+        if company is not None and is_fresh(company.contacts_found_at) and company.contacts:
+            contacts = company.contacts
+            item.reused = True
+        else:
+            found = await find_contacts(engine, verifier, item.domain, None, None, industry)
+            if company is not None:
+                item.company_contacts = merge_contacts(company.contacts or [], found)
+                emails = {f["email"] for f in found}
+                contacts = [c for c in item.company_contacts if c["email"] in emails]
+            else:
+                contacts = found
+        for lead in unnamed:
+            apply_best_contact(lead, contacts)
+
+    for (first, last), leads in named.items():
+        found = await find_contacts(engine, verifier, item.domain, first or None, last or None, industry)
+        if company is not None and found:
+            item.company_contacts = merge_contacts(item.company_contacts or company.contacts or [], found)
+        for lead in leads:
+            apply_best_contact(lead, found)
+
+
+_LEAD_UPDATE = (
+    update(Lead.__table__)
+    .where(Lead.__table__.c.id == bindparam("lead_id"))
+    .values(
+        contact_email=bindparam("contact_email"),
+        contact_first_name=bindparam("contact_first_name"),
+        contact_last_name=bindparam("contact_last_name"),
+        contact_title=bindparam("contact_title"),
+        email_found=bindparam("email_found"),
+        email_verified=bindparam("email_verified"),
+    )
+)
+_COMPANY_UPDATE = (
+    update(Company.__table__)
+    .where(Company.__table__.c.id == bindparam("company_id"))
+    .values(contacts=bindparam("contacts"), contacts_found_at=bindparam("contacts_found_at"))
+)
+
+
+async def _flush(run_id: UUID, done: list[_Domain], stats: dict[str, int], total_domains: int) -> None:
+    lead_rows = [{**lead} for item in done for lead in item.leads if lead.get("contact_email")]
+    company_rows = [
+        {"company_id": item.company.id, "contacts": item.company_contacts, "contacts_found_at": datetime.utcnow()}
+        for item in done
+        if item.company is not None and item.company_contacts is not None
+    ]
+    async with AsyncSessionFactory() as session:
+        if lead_rows:
+            await session.execute(_LEAD_UPDATE, lead_rows)
+        if company_rows:
+            await session.execute(_COMPANY_UPDATE, company_rows)
+        run = await session.get(EmailEnrichmentJob, run_id)
+        if run:
+            run.processed_domains = stats["domains"]
+            run.emails_found = stats["found"]
+            run.emails_verified = stats["verified"]
+            run.domains_reused = stats["reused"]
+            run.progress_percent = min(99, stats["domains"] * 100 // max(total_domains, 1))
+        await session.commit()
+
+
+async def _update_run(run_id: UUID, **values: Any) -> None:
+    async with AsyncSessionFactory() as session:
+        run = await session.get(EmailEnrichmentJob, run_id)
+        if run:
+            for key, value in values.items():
+                setattr(run, key, value)
+            await session.commit()
+
+
+async def run_email_enrichment_job(run_id: UUID) -> None:
+    """Find and verify emails for every lead of the run's generation job."""
+    settings = get_settings()
+    try:
+        async with AsyncSessionFactory() as session:
+            run = await session.get(EmailEnrichmentJob, run_id)
+            if not run:
+                return
+            job = await session.get(GenerationJob, run.job_id)
+            industry = job.industry if job else None
+            run.status = JobStatus.running
+            run.started_at = datetime.utcnow()
+            run.status_message = "Grouping leads by domain"
+            await session.commit()
+
+            stmt = select(Lead).where(Lead.job_id == run.job_id)
+            if run.only_missing:
+                stmt = stmt.where(Lead.email_verified.is_(False))
+            leads = list((await session.scalars(stmt)).all())
+            companies = await get_lead_companies(session, leads)
+            await session.commit()
+
+            groups: dict[str, _Domain] = {}
+            for lead, company in zip(leads, companies):
+                # Directory and social hosts are shared by many businesses; their leads get no lookup.
+                domain = business_domain(
+                    {"company_domain": lead.company_domain, "company_website": lead.company_website}
+                )
+                if not domain:
+                    continue
+                item = groups.setdefault(domain, _Domain(domain, company))
+                item.company = item.company or company
+                item.leads.append(
+                    {
+                        "lead_id": lead.id,
+                        "contact_email": lead.contact_email,
+                        "contact_first_name": lead.contact_first_name,
+                        "contact_last_name": lead.contact_last_name,
+                        "contact_title": lead.contact_title,
+                        "email_found": lead.email_found,
+                        "email_verified": lead.email_verified,
+                    }
+                )
+            run.total_leads = sum(len(g.leads) for g in groups.values())
+            run.total_domains = len(groups)
+            run.status_message = f"Finding emails for {run.total_leads} leads across {len(groups)} domains"
+            await session.commit()
+
+        engine = EmailFinderEngine()
+        verifier = EmailVerifier()
+        limit = asyncio.Semaphore(max(1, settings.email_enrichment_concurrency))
+        stats = {"domains": 0, "found": 0, "verified": 0, "reused": 0}
+        done: list[_Domain] = []
+        flush_lock = asyncio.Lock()
+
+        async def process(item: _Domain) -> None:
+            async with limit:
+                try:
+                    await _enrich_domain(item, engine, verifier, industry)
+                except Exception as exc:
+                    logger.warning("Email enrichment for %s failed: %s", item.domain, exc)
+            async with flush_lock:
+                stats["domains"] += 1
+                stats["reused"] += int(item.reused)
+                for lead in item.leads:
+                    stats["found"] += int(bool(lead["email_found"] and lead["contact_email"]))
+                    stats["verified"] += int(bool(lead["email_verified"]))
+                done.append(item)
+                if len(done) >= _FLUSH_DOMAINS:
+                    batch = done[:]
+                    done.clear()
+                    await _flush(run_id, batch, stats, len(groups))
+
+        await asyncio.gather(*(process(item) for item in groups.values()))
+        await _flush(run_id, done, stats, len(groups))
+        await _update_run(
+            run_id,
+            status=JobStatus.completed,
+            progress_percent=100,
+            completed_at=datetime.utcnow(),
+            status_message=(
+                f"{stats['found']} of {sum(len(g.leads) for g in groups.values())} leads have an email, "
+                f"{stats['verified']} verified; {stats['reused']} domains reused stored contacts"
+            ),
+        )
+    except Exception as exc:
+        logger.exception("Email enrichment run %s failed", run_id)
+        await _update_run(run_id, status=JobStatus.failed, error_message=str(exc), completed_at=datetime.utcnow())
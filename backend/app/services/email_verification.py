@@ -0,0 +1,206 @@
+"""Bulk email verification jobs (pre-campaign list cleaning).
+
+Addresses come from an uploaded list (CSV with an ``email`` column, or one
+address per line) or from stored leads' contact emails. They are deduped
+and grouped by domain, then verified in batches of whole domains. Each
+distinct domain is resolved once, and the domains in a batch are resolved
+concurrently through the shared MX resolver. Every batch is appended to a
+downloadable CSV and written back to ``Lead.email_verified`` before the
+next batch starts, so progress and partial results are visible while the
+job runs. Only definite verdicts are written back: unknown, risky and
+catch-all results (including DNS failures) leave a lead's flag as it was.
+"""
+
+import asyncio
+import codecs
+import csv
+import io
+import logging
+import os
+from datetime import datetime
+from typing import Any, Iterator
+from uuid import UUID
+
+import aiofiles
+from sqlalchemy import String, any_, bindparam, func, select, update
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.database import AsyncSessionFactory
+from app.email_finder.verifier import EmailVerifier
+from app.models import EmailVerificationJob, JobStatus, Lead
+
+logger = logging.getLogger(__name__)
+
+RESULT_COLUMNS = ("email", "status", "reason", "confidence", "mx_valid", "is_disposable", "is_free_provider")
+_EMAIL_HEADERS = {"email", "email_address", "e_mail", "contact_email", "mail"}
+# Reasons for an "invalid" verdict that a later check would not overturn.
+_DEFINITE_INVALID = {"malformed", "disposable", "no_mx_records", "smtp_rejected"}
+
+
+def _domain(email: str) -> str:
+    return email.rsplit("@", 1)[-1]
+
+
+def _lines(path: str) -> Iterator[str]:
+    decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+    with open(path, "rb") as f:
+        for line in f:
+            yield decoder.decode(line)
+
+
+def read_addresses(path: str) -> dict[str, list[str]]:
+    """Distinct lowercased addresses in an uploaded list, grouped by domain."""
+    by_domain: dict[str, list[str]] = {}
+    seen: set[str] = set()
+    column: int | None = None
+    for i, row in enumerate(csv.reader(_lines(path))):
+        if i == 0:
+            names = [c.strip().lower().replace(" ", "_").replace("-", "_") for c in row]
+            column = next((n for n, name in enumerate(names) if name in _EMAIL_HEADERS), None)
+            if column is not None:
+                continue
+        if column is not None:
+            cells = row[column : column + 1]
+        else:
+            cells = [c for c in row if "@" in c][:1]
+        for cell in cells:
+            email = cell.strip().strip("<>").lower()
+            if "@" not in email or email in seen:
+                continue
+            seen.add(email)
+            by_domain.setdefault(_domain(email), []).append(email)
+    return by_domain
+
+
+async def lead_addresses(session: AsyncSession, criteria: dict[str, Any]) -> dict[str, list[str]]:
+    """Distinct lowercased contact emails of the leads selected by ``criteria``, grouped by domain."""
+    email = func.lower(Lead.contact_email)
+    stmt = select(email).where(Lead.contact_email.is_not(None)).distinct()
+    if criteria.get("job_id"):
+        stmt = stmt.where(Lead.job_id == UUID(str(criteria["job_id"])))
+    if criteria.get("lead_ids"):
+        stmt = stmt.where(Lead.id.in_([UUID(str(i)) for i in criteria["lead_ids"]]))
+    if criteria.get("only_unverified", True):
+        stmt = stmt.where(Lead.email_verified.is_(False))
+    by_domain: dict[str, list[str]] = {}
+    for address in (await session.scalars(stmt)).all():
+        if "@" in address:
+            by_domain.setdefault(_domain(address), []).append(address)
+    return by_domain
+
+
+def batches(by_domain: dict[str, list[str]], size: int) -> Iterator[list[str]]:
+    """Addresses in batches of about ``size`` that never split a domain across batches."""
+    batch: list[str] = []
+    for emails in by_domain.values():
+        batch.extend(emails)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+async def _write_back(session: AsyncSession, emails: list[str], verified: bool) -> int:
+    if not emails:
+        return 0
+    result = await session.execute(
+        update(Lead)
+        .where(func.lower(Lead.contact_email) == any_(bindparam("emails", emails, type_=ARRAY(String))))
+        .values(email_verified=verified)
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount or 0
+
+
+async def _update_job(job_id: UUID, **values: Any) -> None:
+    async with AsyncSessionFactory() as session:
+        job = await session.get(EmailVerificationJob, job_id)
+        if job:
+            for key, value in values.items():
+                setattr(job, key, value)
+            await session.commit()
+
+
+async def run_verification_job(job_id: UUID, upload_path: str | None = None) -> None:
+    """Verify the job's addresses; ``upload_path`` (source="upload") is deleted afterwards."""
+    settings = get_settings()
+    result_path = os.path.join(settings.upload_dir, f"{job_id}-verified.csv")
+    try:
+        async with AsyncSessionFactory() as session:
+            job = await session.get(EmailVerificationJob, job_id)
+            if not job:
+                return
+            job.status = JobStatus.running
+            job.started_at = datetime.utcnow()
+            job.status_message = "Collecting addresses"
+            await session.commit()
+            if upload_path:
+                by_domain = await asyncio.to_thread(read_addresses, upload_path)
+            else:
+                by_domain = await lead_addresses(session, job.criteria or {})
+            total = sum(len(v) for v in by_domain.values())
+            job.total_emails = total
+            job.total_domains = len(by_domain)
+            job.status_message = f"Verifying {total} addresses across {len(by_domain)} domains"
+            await session.commit()
+
+        verifier = EmailVerifier()
+        counts: dict[str, int] = {}
+        processed = leads_updated = 0
+        os.makedirs(settings.upload_dir, exist_ok=True)
+        async with aiofiles.open(result_path, "w", newline="") as out:
+            await out.write(",".join(RESULT_COLUMNS) + "\r\n")
+            for batch in batches(by_domain, settings.email_verify_batch_size):
+                verdicts = await verifier.verify_many(batch)
+
+                buffer = io.StringIO()
+                writer = csv.writer(buffer)
+                valid: list[str] = []
+                invalid: list[str] = []
+                for email, v in zip(batch, verdicts):
+                    writer.writerow(
+                        (email, v.status, v.reason or "", v.confidence, v.mx_valid, v.is_disposable, v.is_free_provider)
+                    )
+                    counts[v.status] = counts.get(v.status, 0) + 1
+                    if v.status == "valid":
+                        valid.append(email)
+                    elif v.status == "invalid" and v.reason in _DEFINITE_INVALID:
+                        invalid.append(email)
+                await out.write(buffer.getvalue())
+                await out.flush()
+
+                processed += len(batch)
+                async with AsyncSessionFactory() as session:
+                    leads_updated += await _write_back(session, valid, True)
+                    leads_updated += await _write_back(session, invalid, False)
+                    job = await session.get(EmailVerificationJob, job_id)
+                    if job:
+                        job.processed_emails = processed
+                        job.status_counts = dict(counts)
+                        job.leads_updated = leads_updated
+                        job.progress_percent = min(99, processed * 100 // max(total, 1))
+                    await session.commit()
+
+        await _update_job(
+            job_id,
+            status=JobStatus.completed,
+            progress_percent=100,
+            result_path=result_path,
+            completed_at=datetime.utcnow(),
+            status_message=(
+                f"{processed} addresses verified: {counts.get('valid', 0)} valid, "
+                f"{counts.get('invalid', 0)} invalid; {leads_updated} leads updated"
+            ),
+        )
+    except Exception as exc:
+        logger.exception("Email verification job %s failed", job_id)
+        await _update_job(job_id, status=JobStatus.failed, error_message=str(exc), completed_at=datetime.utcnow())
+    finally:
+        if upload_path:
+            try:
+                os.remove(upload_path)
+            except OSError:
+                pass
@@ -0,0 +1,328 @@
+"""Bulk import of existing lead lists (CSV or NDJSON) as a generation job.
+
+The uploaded file is streamed to ``upload_dir`` and read back in batches of
+``import_batch_size`` rows, so memory stays bounded by one batch. Parsing,
+standardization and scoring run in a worker thread. Each batch is checked
+against the leads already stored, by business domain and by phone number,
+then linked to companies and written with ``upsert_leads``. Batches above the
+COPY threshold go through the COPY staging path. Progress is reported on the
+job as the share of the file's bytes consumed.
+"""
+
+import asyncio
+import codecs
+import csv
+import hashlib
+import json
+import logging
+import os
+from datetime import datetime
+from typing import Any, Iterator
+from uuid import UUID
+
+from sqlalchemy import String, Text, any_, bindparam, func, literal_column, or_, select
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.database import AsyncSessionFactory
+from app.intelligence.deduplicator import build_dedupe_key
+from app.intelligence.entity_resolver import business_domain, normalize_phone
+from app.intelligence.intent_detector import IntentDetector
+from app.models import GenerationJob, JobStatus, Lead
+from app.normalizer.normalized_lead import NormalizedLead, lead_rows
+from app.normalizer.standardizer import LeadStandardizer
+from app.scoring import score_lead
+from app.services.company_registry import is_fresh, resolve_companies
+from app.services.lead_store import upsert_leads
+
+logger = logging.getLogger(__name__)
+
+IMPORT_SOURCE = "import"
+FORMATS = ("csv", "ndjson")
+
+# Common spreadsheet headers mapped to the keys LeadStandardizer understands.
+HEADER_ALIASES = {
+    "company": "company_name",
+    "business": "company_name",
+    "organization": "company_name",
+    "organisation": "company_name",
+    "business_name": "company_name",
+    "url": "website",
+    "website_url": "website",
+    "domain": "company_domain",
+    "phone_number": "phone",
+    "telephone": "phone",
+    "mobile": "phone",
+    "email_address": "email",
+    "address_line_1": "street",
+    "address1": "street",
+    "zip": "zip_code",
+    "zipcode": "zip_code",
+    "pincode": "zip_code",
+    "pin_code": "zip_code",
+    "postcode": "zip_code",
+    "lat": "latitude",
+    "lng": "longitude",
+    "lon": "longitude",
+    "reviews": "review_count",
+    "id": "external_id",
+}
+_FLOAT_FIELDS = ("latitude", "longitude", "rating")
+_INT_FIELDS = ("review_count",)
+_MAX_EXTERNAL_ID = 128
+
+# Written out literally so it matches the ix_leads_phone_key expression index.
+_PHONE_KEY = literal_column(r"right(regexp_replace(leads.company_phone, '\D', '', 'g'), 10)")
+
+
+def detect_format(filename: str | None, content_type: str | None) -> str | None:
+    """``csv`` or ``ndjson`` from the file extension or content type."""
+    name = (filename or "").lower()
+    ctype = (content_type or "").lower()
+    if name.endswith((".ndjson", ".jsonl")) or "ndjson" in ctype or "jsonl" in ctype:
+        return "ndjson"
+    if name.endswith(".csv") or "csv" in ctype:
+        return "csv"
+    return None
+
+
+def _header(key: str) -> str:
+    key = key.strip().lower().replace(" ", "_").replace("-", "_")
+    return HEADER_ALIASES.get(key, key)
+
+
+def _number(value: Any, kind: type) -> Any:
+    if value is None or isinstance(value, (int, float)):
+        return value
+    text = str(value).strip().replace(",", "")
+    if not text:
+        return None
+    try:
+        return kind(float(text)) if kind is int else kind(text)
+    except ValueError:
+        return None
+
+
+def _clean(row: dict[str, Any]) -> dict[str, Any]:
+    out: dict[str, Any] = {}
+    for key, value in row.items():
+        if key is None:
+            continue
+        if isinstance(value, str):
+            value = value.strip() or None
+        out[_header(key)] = value
+    for name in _FLOAT_FIELDS:
+        if name in out:
+            out[name] = _number(out[name], float)
+    for name in _INT_FIELDS:
+        if name in out:
+            out[name] = _number(out[name], int)
+    return out
+
+
+class ImportReader:
+    """Incremental row reader over an uploaded file that tracks the bytes consumed."""
+
+    def __init__(self, path: str, fmt: str):
+        self.path = path
+        self.format = fmt
+        self.size = os.path.getsize(path) or 1
+        self.bytes_read = 0
+        self.rows_read = 0
+        self.invalid_rows = 0
+        self._file = open(path, "rb")
+        self._rows = self._iter_rows()
+
+    def _lines(self) -> Iterator[str]:
+        decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+        for line in self._file:
+            self.bytes_read += len(line)
+            yield decoder.decode(line)
+
+    def _iter_rows(self) -> Iterator[dict[str, Any]]:
+        if self.format == "csv":
+            yield from csv.DictReader(self._lines())
+            return
+        for line in self._lines():
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError:
+                self.invalid_rows += 1
+                continue
+            if isinstance(row, dict):
+                yield row
+            else:
+                self.invalid_rows += 1
+
+    def read_batch(self, size: int) -> list[dict[str, Any]]:
+        batch: list[dict[str, Any]] = []
+        for row in self._rows:
+            batch.append(row)
+            if len(batch) >= size:
+                break
+        self.rows_read += len(batch)
+        return batch
+
+    @property
+    def progress(self) -> int:
+        return min(99, int(self.bytes_read * 100 / self.size))
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def prepare_batch(rows: list[dict[str, Any]], industry: str | None = None) -> list[NormalizedLead]:
+    """Standardize and score raw rows, dropping rows without a name and in-batch duplicates."""
+    standardizer = LeadStandardizer()
+    intent_detector = IntentDetector()
+    records: list[NormalizedLead] = []
+    seen: set[str] = set()
+    for raw in rows:
+        row = _clean(raw)
+        record = standardizer.standardize({**row, "raw_data": raw})
+        if record.company_name == "Unknown":
+            continue
+        record.source = IMPORT_SOURCE
+        record.data_sources = [IMPORT_SOURCE]
+        record.industry = record.industry or industry
+        key = build_dedupe_key(record, IMPORT_SOURCE)
+        if key in seen:
+            continue
+        seen.add(key)
+        external_id = str(record.external_id) if record.external_id else None
+        if not external_id or len(external_id) > _MAX_EXTERNAL_ID:
+            # Upserts key on external_id; derive a stable one from the dedupe key.
+            external_id = hashlib.sha1((external_id or key).encode("utf-8")).hexdigest()
+        record.external_id = external_id
+        record.lead_score = score_lead(
+            rating=record.rating,
+            review_count=record.review_count,
+            website=record.company_website,
+            phone=record.company_phone,
+            address=record.street,
+        )
+        record.intent_score = intent_detector.detect(record)
+        records.append(record)
+    return records
+
+
+async def _drop_existing(session: AsyncSession, records: list[NormalizedLead]) -> list[NormalizedLead]:
+    """Remove records whose business domain or phone already belongs to a stored lead (or to an earlier record)."""
+    keys = [(business_domain(r), normalize_phone(r.company_phone)) for r in records]
+    domains = {d for d, _ in keys if d}
+    phones = {p for _, p in keys if p}
+    known_domains: set[str] = set()
+    known_phones: set[str] = set()
+    if domains or phones:
+        clauses = []
+        if domains:
+            clauses.append(Lead.company_domain == any_(bindparam("domains", list(domains), type_=ARRAY(String))))
+        if phones:
+            clauses.append(_PHONE_KEY == any_(bindparam("phones", list(phones), type_=ARRAY(Text))))
+        result = await session.execute(select(Lead.company_domain, _PHONE_KEY).where(or_(*clauses)))
+        for domain, phone in result.all():
+            if domain:
+                known_domains.add(domain)
+            if phone:
+                known_phones.add(phone)
+
+    kept: list[NormalizedLead] = []
+    for record, (domain, phone) in zip(records, keys):
+        if (domain and domain in known_domains) or (phone and phone in known_phones):
+            continue
+        if domain:
+            known_domains.add(domain)
+        if phone:
+            known_phones.add(phone)
+        kept.append(record)
+    return kept
+
+
+async def _update_job(job_id: UUID, **values: Any) -> None:
+    async with AsyncSessionFactory() as session:
+        job = await session.get(GenerationJob, job_id)
+        if job:
+            for key, value in values.items():
+                setattr(job, key, value)
+            await session.commit()
+
+
+async def run_import_job(job_id: UUID, path: str, fmt: str) -> None:
+    """Import an uploaded lead file into ``job_id``; the file is deleted afterwards."""
+    settings = get_settings()
+    async with AsyncSessionFactory() as session:
+        job = await session.get(GenerationJob, job_id)
+        if not job:
+            return
+        industry = job.industry
+        job.status = JobStatus.running
+        job.started_at = datetime.utcnow()
+        job.status_message = "Importing"
+        await session.commit()
+
+    reader = None
+    kept_total = inserted = skipped = 0
+    try:
+        reader = await asyncio.to_thread(ImportReader, path, fmt)
+        while True:
+            rows = await asyncio.to_thread(reader.read_batch, settings.import_batch_size)
+            if not rows:
+                break
+            records = await asyncio.to_thread(prepare_batch, rows, industry)
+            async with AsyncSessionFactory() as session:
+                kept = await _drop_existing(session, records)
+                skipped += len(rows) - len(kept)
+                companies = await resolve_companies(session, kept)
+                for record, company in zip(kept, companies):
+                    if company is None:
+                        continue
+                    record.company_id = company.id
+                    profile = (company.enrichment or {}).get("ai_profile")
+                    if profile and is_fresh(company.enriched_at):
+                        record.ai_enrichment = profile
+                upserted = await upsert_leads(session, lead_rows(kept, job_id))
+                inserted += upserted.inserted
+                kept_total += len(kept)
+
+                job = await session.get(GenerationJob, job_id)
+                if job:
+                    job.progress_percent = reader.progress
+                    job.total_raw_leads = reader.rows_read
+                    job.total_after_dedup = kept_total
+                    job.status_message = f"Imported {reader.rows_read} rows ({skipped} duplicate or unnamed rows skipped)"
+                await session.commit()
+
+        async with AsyncSessionFactory() as session:
+            total = await session.scalar(select(func.count()).select_from(Lead).where(Lead.job_id == job_id)) or 0
+        message = f"{inserted} leads imported from {reader.rows_read} rows, {skipped} duplicate or unnamed rows skipped"
+        if reader.invalid_rows:
+            message += f", {reader.invalid_rows} unreadable lines"
+        await _update_job(
+            job_id,
+            status=JobStatus.completed,
+            progress_percent=100,
+            total_raw_leads=reader.rows_read,
+            total_after_dedup=kept_total,
+            total_results=total,
+            total_final_leads=total,
+            completed_at=datetime.utcnow(),
+            status_message=message,
+        )
+    except Exception as exc:
+        logger.exception("Lead import %s failed", job_id)
+        await _update_job(
+            job_id,
+            status=JobStatus.failed,
+            error_message=str(exc),
+            completed_at=datetime.utcnow(),
+        )
+    finally:
+        if reader is not None:
+            reader.close()
+        try:
+            os.remove(path)
+        except OSError:
+            pass
@@ -0,0 +1,192 @@
+"""Set-based lead persistence: bulk upsert on ``uq_source_external_per_job``.
+
+Small batches go through a multi-row ``INSERT ... ON CONFLICT DO UPDATE``;
+large batches are COPY'd into a temporary staging table first and upserted
+with a single ``INSERT ... SELECT``. Re-scraped fields are overwritten, while
+enrichment already stored on a lead (contacts, AI enrichment, outreach,
+extra ``raw_data`` keys) is kept.
+"""
+
+import json
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import JSON, Table, cast, column, func, literal_column, select, table, text
+from sqlalchemy.dialects.postgresql import JSONB, insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.models import Lead
+
+UNIQUE_CONSTRAINT = "uq_source_external_per_job"
+STAGE_TABLE = "lead_upsert_stage"
+
+# Columns a new scrape is authoritative for.
+OVERWRITE_COLUMNS = (
+    "company_name",
+    "company_domain",
+    "company_website",
+    "company_phone",
+    "street",
+    "city",
+    "state",
+    "country",
+    "zip_code",
+    "latitude",
+    "longitude",
+    "rating",
+    "review_count",
+    "lead_score",
+    "intent_score",
+    "fingerprint",
+    "data_sources",
+    "source_urls",
+    "updated_at",
+)
+# Columns where an existing value wins over the scraped one.
+KEEP_EXISTING_COLUMNS = ("company_email", "contact_email")
+# Columns where a new non-null value wins but null never clears the existing one.
+PREFER_NEW_COLUMNS = ("company_id",)
+# Boolean flags that stay true once set.
+STICKY_FLAGS = ("email_found", "is_enriched")
+
+_FILL_DEFAULTS: dict[str, Any] = {
+    "data_sources": [],
+    "source_urls": [],
+    "raw_data": {},
+    "email_found": False,
+    "email_verified": False,
+    "is_enriched": False,
+    "lead_score": 0,
+    "intent_score": 0,
+}
+
+
+@dataclass
+class UpsertResult:
+    inserted: int = 0
+    updated: int = 0
+
+    @property
+    def total(self) -> int:
+        return self.inserted + self.updated
+
+
+def _prepare_rows(rows: list[dict[str, Any]]) -> tuple[list[str], list[dict[str, Any]]]:
+    """Give every row the same column set and drop duplicate conflict keys (last row wins)."""
+    table_columns = set(Lead.__table__.columns.keys())
+    columns = ["id", "created_at", "updated_at", *_FILL_DEFAULTS]
+    extra = set().union(*(row.keys() for row in rows)) & table_columns
+    columns.extend(sorted(extra - set(columns)))
+
+    now = datetime.utcnow()
+    defaults = [(c, _FILL_DEFAULTS.get(c)) for c in columns[3:]]
+    by_key: dict[tuple, dict[str, Any]] = {}
+    for row in rows:
+        full = {c: row.get(c, default) for c, default in defaults}
+        full["id"] = row.get("id") or uuid.uuid4()
+        full["created_at"] = row.get("created_at") or now
+        full["updated_at"] = now
+        external_id = full.get("external_id")
+        if external_id is None:
+            by_key[("", full["id"])] = full
+        else:
+            by_key[(full.get("source"), external_id, full.get("job_id"))] = full
+    return columns, list(by_key.values())
+
+
+def _conflict_set(excluded: Any, columns: list[str]) -> dict[str, Any]:
+    leads = Lead.__table__.c
+    set_: dict[str, Any] = {}
+    for name in OVERWRITE_COLUMNS:
+        if name in columns:
+            set_[name] = excluded[name]
+    for name in KEEP_EXISTING_COLUMNS:
+        if name in columns:
+            set_[name] = func.coalesce(leads[name], excluded[name])
+    for name in PREFER_NEW_COLUMNS:
+        if name in columns:
+            set_[name] = func.coalesce(excluded[name], leads[name])
+    for name in STICKY_FLAGS:
+        if name in columns:
+            set_[name] = leads[name] | excluded[name]
+    if "raw_data" in columns:
+        set_["raw_data"] = cast(
+            func.coalesce(cast(leads.raw_data, JSONB), text("'{}'::jsonb")).op("||")(cast(excluded.raw_data, JSONB)),
+            JSON,
+        )
+    return set_
+
+
+async def _upsert_values(session: AsyncSession, columns: list[str], rows: list[dict[str, Any]]) -> UpsertResult:
+    stmt = pg_insert(Lead.__table__)
+    stmt = stmt.on_conflict_do_update(
+        constraint=UNIQUE_CONSTRAINT,
+        set_=_conflict_set(stmt.excluded, columns),
+    ).returning(literal_column("(xmax = 0)").label("inserted"))
+
+    result = await session.execute(stmt, rows)
+    flags = result.scalars().all()
+    inserted = sum(1 for f in flags if f)
+    return UpsertResult(inserted=inserted, updated=len(flags) - inserted)
+
+
+async def _upsert_copy(session: AsyncSession, columns: list[str], rows: list[dict[str, Any]]) -> UpsertResult:
+    lead_table: Table = Lead.__table__
+    json_columns = [c for c in columns if isinstance(lead_table.c[c].type, JSON)]
+    plain_columns = [c for c in columns if c not in json_columns]
+    dumps = json.dumps
+    records = [
+        (
+            *[row[c] for c in plain_columns],
+            *[None if row[c] is None else dumps(row[c]) for c in json_columns],
+        )
+        for row in rows
+    ]
+    columns = plain_columns + json_columns
+
+    await session.execute(
+        text(f"CREATE TEMP TABLE {STAGE_TABLE} (LIKE {lead_table.name} INCLUDING DEFAULTS) ON COMMIT DROP")
+    )
+    conn = await session.connection()
+    raw = await conn.get_raw_connection()
+    await raw.driver_connection.copy_records_to_table(STAGE_TABLE, records=records, columns=columns)
+
+    stage = table(STAGE_TABLE, *[column(c) for c in columns])
+    stmt = pg_insert(lead_table).from_select(columns, select(*[stage.c[c] for c in columns]))
+    upserted = (
+        stmt.on_conflict_do_update(constraint=UNIQUE_CONSTRAINT, set_=_conflict_set(stmt.excluded, columns))
+        .returning(literal_column("(xmax = 0)").label("inserted"))
+        .cte("upserted")
+    )
+    inserted, total = (
+        await session.execute(
+            select(
+                func.count().filter(upserted.c.inserted),
+                func.count(),
+            ).select_from(upserted)
+        )
+    ).one()
+    await session.execute(text(f"DROP TABLE {STAGE_TABLE}"))
+    return UpsertResult(inserted=inserted or 0, updated=(total or 0) - (inserted or 0))
+
+
+async def upsert_leads(
+    session: AsyncSession,
+    rows: list[dict[str, Any]],
+    copy_threshold: int | None = None,
+) -> UpsertResult:
+    """Insert or update lead rows keyed on (source, external_id, job_id).
+
+    Rows are ``Lead`` column dicts (see ``NormalizedLead.to_row``). The
+    caller owns the transaction; nothing is committed here.
+    """
+    if not rows:
+        return UpsertResult()
+    threshold = copy_threshold if copy_threshold is not None else get_settings().lead_copy_threshold
+    columns, prepared = _prepare_rows(rows)
+    if len(prepared) >= threshold:
+        return await _upsert_copy(session, columns, prepared)
+    return await _upsert_values(session, columns, prepared)
@@ -8,7 +8,8 @@ from typing import Any
 import httpx
 
 from app.config import get_settings
-from app.services.claude_enrichment import _get_vertex_access_token, _parse_json_response
+from app.services.claude_enrichment import _is_json_object, _parse_json_response
+from app.services.vertex_client import generate_content
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -82,37 +83,26 @@ async def generate_outreach(
     sender_title: str = "Business Development Manager",
     tone: str = "consultative",
     language: str = "english",
+    use_cache: bool = True,
 ) -> dict[str, Any]:
-    """Generate personalised outreach copy for a single enriched lead."""
+    """Generate personalised outreach copy for a single enriched lead.
+
+    Identical parameters reuse the cached response unless *use_cache* is False.
+    """
     if not settings.vertex_project_id:
         logger.warning("VERTEX_PROJECT_ID not configured; returning placeholder outreach")
         return _placeholder_outreach(lead)
 
     prompt = _build_outreach_prompt(lead, sender_name, sender_title, tone, language)
-    endpoint = (
-        f"https://{settings.vertex_location}-aiplatform.googleapis.com/v1"
-        f"/projects/{settings.vertex_project_id}"
-        f"/locations/{settings.vertex_location}"
-        f"/publishers/google/models/{settings.vertex_model}:generateContent"
-    )
 
     try:
-        token = await _get_vertex_access_token()
-        payload = {
-            "contents": [{"role": "user", "parts": [{"text": prompt}]}],
-            "generationConfig": {"temperature": 0.5, "maxOutputTokens": 1024},
-        }
-        async with httpx.AsyncClient(timeout=settings.enrichment_timeout) as client:
-            response = await client.post(
-                endpoint,
-                headers={"Authorization": f"Bearer {token}", "Content-Type": "application/json"},
-                json=payload,
-            )
-            response.raise_for_status()
-            data = response.json()
-
-        raw_text = data["candidates"][0]["content"]["parts"][0]["text"].strip()
-        return _parse_json_response(raw_text)
+        result = await generate_content(
+            prompt,
+            {"temperature": 0.5, "maxOutputTokens": 1024},
+            use_cache=use_cache,
+            validate=_is_json_object,
+        )
+        return _parse_json_response(result.text)
 
     except httpx.HTTPStatusError as exc:
         logger.error("Vertex AI outreach HTTP error %s: %s", exc.response.status_code, exc.response.text[:300])
@@ -151,13 +141,18 @@ async def bulk_generate_outreach(
     sender_title: str = "Business Development Manager",
     tone: str = "consultative",
     language: str = "english",
-    concurrency: int = 3,
+    concurrency: int | None = None,
+    use_cache: bool = True,
 ) -> list[dict[str, Any]]:
-    """Generate outreach copy for multiple leads with bounded concurrency."""
-    semaphore = asyncio.Semaphore(concurrency)
+    """Generate outreach copy for multiple leads with bounded concurrency.
+
+    The Vertex rate controller paces the requests; *concurrency* (default
+    ``vertex_max_concurrency``) only caps how many are queued at once.
+    """
+    semaphore = asyncio.Semaphore(concurrency or settings.vertex_max_concurrency)
 
     async def _bounded(lead: dict[str, Any]) -> dict[str, Any]:
         async with semaphore:
-            return await generate_outreach(lead, sender_name, sender_title, tone, language)
+            return await generate_outreach(lead, sender_name, sender_title, tone, language, use_cache)
 
     return await asyncio.gather(*[_bounded(lead) for lead in leads])
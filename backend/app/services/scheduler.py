@@ -0,0 +1,219 @@
+"""Recurring job schedules, staggered so provider load stays flat.
+
+Each schedule's provider usage is estimated from its job parameters. Schedules
+are then placed, heaviest first, at the offset inside their start window that
+keeps the peak per-slot utilisation of every provider lowest, given the load of
+the schedules already placed. Schedules with shorter intervals are repeated
+across the longest interval so a daily job is weighed against a weekly one.
+"""
+
+import logging
+import math
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.database import AsyncSessionFactory
+from app.models import GenerationJob, JobSchedule, JobStatus
+
+logger = logging.getLogger(__name__)
+
+GOOGLE_PLACES = "google_places"
+VERTEX = "vertex"
+
+# Google Places text search returns 20 results per page.
+_PLACES_PAGE_SIZE = 20
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _utc(value: datetime) -> datetime:
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def provider_capacity() -> dict[str, int]:
+    """Requests per minute each provider is allowed to take from scheduled jobs."""
+    settings = get_settings()
+    return {
+        GOOGLE_PLACES: max(1, settings.google_places_rpm),
+        VERTEX: max(1, settings.vertex_rpm),
+    }
+
+
+def estimate_requests(schedule: JobSchedule) -> dict[str, int]:
+    """Approximate provider requests one run of the schedule makes."""
+    max_results = schedule.max_results or 40
+    sources = schedule.sources_enabled or ["google_maps"]
+    usage: dict[str, int] = {}
+    if "google_maps" in sources or "google_places" in sources:
+        # Text-search pages plus one details call per place.
+        usage[GOOGLE_PLACES] = math.ceil(max_results / _PLACES_PAGE_SIZE) + max_results
+    # AI enrichment makes one Gemini call per lead.
+    usage[VERTEX] = max_results
+    return usage
+
+
+@dataclass
+class _Demand:
+    schedule: JobSchedule
+    phase_slot: int
+    window_slots: int
+    interval_slots: int
+    duration_slots: int
+    per_slot: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def weight(self) -> float:
+        return sum(rate * self.duration_slots for rate in self.per_slot.values())
+
+
+class LoadTimeline:
+    """Per-provider utilisation over one horizon, in fixed-size slots."""
+
+    def __init__(self, horizon_slots: int, capacity: dict[str, float]):
+        self.horizon = horizon_slots
+        self.capacity = capacity
+        self.load = {provider: [0.0] * horizon_slots for provider in capacity}
+
+    def _slots(self, demand: _Demand, offset: int):
+        repeats = max(1, self.horizon // demand.interval_slots)
+        for k in range(repeats):
+            start = demand.phase_slot + offset + k * demand.interval_slots
+            for i in range(demand.duration_slots):
+                yield (start + i) % self.horizon
+
+    def peak_with(self, demand: _Demand, offset: int) -> float:
+        peak = 0.0
+        for provider, rate in demand.per_slot.items():
+            load, cap = self.load[provider], self.capacity[provider]
+            for slot in self._slots(demand, offset):
+                peak = max(peak, (load[slot] + rate) / cap)
+        return peak
+
+    def add(self, demand: _Demand, offset: int) -> None:
+        for provider, rate in demand.per_slot.items():
+            load = self.load[provider]
+            for slot in self._slots(demand, offset):
+                load[slot] += rate
+
+    def peaks(self) -> dict[str, float]:
+        return {p: round(max(load, default=0.0) / self.capacity[p], 3) for p, load in self.load.items()}
+
+
+def plan_offsets(
+    schedules: list[JobSchedule],
+    capacity: dict[str, int] | None = None,
+    slot_minutes: int | None = None,
+) -> tuple[dict[uuid.UUID, int], dict[str, float]]:
+    """Pick a start offset (minutes) for every schedule.
+
+    Returns ``({schedule_id: offset_minutes}, {provider: peak_utilisation})``;
+    a peak above 1.0 means the window is too narrow for the provider's capacity.
+    """
+    if not schedules:
+        return {}, {}
+    capacity = capacity or provider_capacity()
+    slot = max(1, slot_minutes or get_settings().schedule_slot_minutes)
+    per_slot_capacity = {p: float(c * slot) for p, c in capacity.items()}
+
+    demands: list[_Demand] = []
+    for schedule in schedules:
+        interval_slots = max(1, math.ceil(schedule.interval_minutes / slot))
+        requests = {p: n for p, n in estimate_requests(schedule).items() if p in capacity and n > 0}
+        # A run lasts as long as its most constrained provider needs at full capacity.
+        duration = max(
+            [1] + [math.ceil(n / per_slot_capacity[p]) for p, n in requests.items()]
+        )
+        anchor_minutes = int((_utc(schedule.anchor_at) - _EPOCH).total_seconds() // 60)
+        demands.append(
+            _Demand(
+                schedule=schedule,
+                phase_slot=(anchor_minutes % schedule.interval_minutes) // slot,
+                window_slots=max(0, (schedule.window_minutes or 0) // slot),
+                interval_slots=interval_slots,
+                duration_slots=min(duration, interval_slots),
+                per_slot={p: n / duration for p, n in requests.items()},
+            )
+        )
+
+    timeline = LoadTimeline(max(d.interval_slots for d in demands), per_slot_capacity)
+    offsets: dict[uuid.UUID, int] = {}
+    for demand in sorted(demands, key=lambda d: (-d.weight, str(d.schedule.id))):
+        best = min(
+            range(demand.window_slots + 1),
+            key=lambda offset: (round(timeline.peak_with(demand, offset), 6), offset),
+        )
+        timeline.add(demand, best)
+        offsets[demand.schedule.id] = best * slot
+    return offsets, timeline.peaks()
+
+
+def next_run_after(schedule: JobSchedule, after: datetime) -> datetime:
+    """First ``anchor + k * interval + offset`` strictly after ``after``."""
+    interval = timedelta(minutes=max(1, schedule.interval_minutes))
+    first = _utc(schedule.anchor_at) + timedelta(minutes=schedule.offset_minutes or 0)
+    after = _utc(after)
+    if first > after:
+        return first
+    periods = (after - first) // interval + 1
+    return first + periods * interval
+
+
+async def rebalance_schedules(session: AsyncSession) -> dict[str, float]:
+    """Re-plan offsets and next run times for all active schedules (caller commits)."""
+    result = await session.execute(select(JobSchedule).where(JobSchedule.is_active.is_(True)))
+    schedules = list(result.scalars().all())
+    offsets, peaks = plan_offsets(schedules)
+    now = datetime.now(timezone.utc)
+    for schedule in schedules:
+        schedule.offset_minutes = offsets.get(schedule.id, 0)
+        schedule.next_run_at = next_run_after(schedule, schedule.last_run_at or now)
+        if schedule.next_run_at <= now:
+            schedule.next_run_at = next_run_after(schedule, now)
+    logger.info("Rebalanced %d schedules, peak utilisation %s", len(schedules), peaks)
+    return peaks
+
+
+async def dispatch_due_schedules(now: datetime | None = None) -> list[tuple[uuid.UUID, bool]]:
+    """Create (or re-queue) jobs for schedules whose run time has come.
+
+    Returns ``[(job_id, refresh)]`` for the caller to enqueue. A schedule with
+    ``refresh_existing`` re-runs its previous job as an incremental refresh
+    when that job has finished; otherwise a new job is created.
+    """
+    now = _utc(now or datetime.now(timezone.utc))
+    queued: list[tuple[uuid.UUID, bool]] = []
+    async with AsyncSessionFactory() as session:
+        result = await session.execute(
+            select(JobSchedule)
+            .where(JobSchedule.is_active.is_(True), JobSchedule.next_run_at <= now)
+            .with_for_update(skip_locked=True)
+        )
+        for schedule in result.scalars().all():
+            previous = await session.get(GenerationJob, schedule.last_job_id) if schedule.last_job_id else None
+            if previous is not None and previous.status not in (JobStatus.completed, JobStatus.failed):
+                logger.warning("Schedule %s skipped: job %s still running", schedule.id, previous.id)
+            elif schedule.refresh_existing and previous is not None:
+                previous.status = JobStatus.pending
+                previous.status_message = "Scheduled refresh queued"
+                queued.append((previous.id, True))
+            else:
+                job = GenerationJob(
+                    query=schedule.query,
+                    location=schedule.location,
+                    industry=schedule.industry,
+                    max_results=schedule.max_results,
+                    sources_enabled=schedule.sources_enabled or ["google_maps"],
+                    user_id=schedule.user_id,
+                )
+                session.add(job)
+                await session.flush()
+                schedule.last_job_id = job.id
+                queued.append((job.id, False))
+            schedule.last_run_at = now
+            schedule.next_run_at = next_run_after(schedule, now)
+        await session.commit()
+    return queued
@@ -0,0 +1,100 @@
+"""Process-wide Vertex AI access tokens.
+
+Application Default Credentials are loaded once and their access token is
+reused until shortly before it expires. Within
+``vertex_token_refresh_margin_seconds`` of expiry callers still get the
+current token while one background refresh runs. Only a missing or
+expired token makes callers wait, and concurrent waiters share a single
+refresh. google-auth is synchronous, so refreshes run in a worker thread.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+import weakref
+from datetime import timezone
+from functools import lru_cache
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+_SCOPES = ["https://www.googleapis.com/auth/cloud-platform"]
+# Assumed lifetime of a token whose credentials report no expiry.
+_DEFAULT_LIFETIME_SECONDS = 3000.0
+
+
+class VertexTokenProvider:
+    def __init__(self, refresh_margin: float) -> None:
+        self.refresh_margin = refresh_margin
+        self._credentials = None
+        self._token: str | None = None
+        self._expires_at = 0.0
+        # Serialises google-auth calls from worker threads of different event loops.
+        self._lock = threading.Lock()
+        self._refreshes: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Task]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self.stats = {"cached": 0, "background_refreshes": 0, "blocking_refreshes": 0}
+
+    async def token(self) -> str:
+        remaining = self._expires_at - time.time() if self._token else 0.0
+        if remaining > self.refresh_margin:
+            self.stats["cached"] += 1
+            return self._token  # type: ignore[return-value]
+        if remaining > 0:
+            self.stats["cached"] += 1
+            self._refresh_task(background=True)
+            return self._token  # type: ignore[return-value]
+        # One caller being cancelled must not cancel the refresh the others wait on.
+        return await asyncio.shield(self._refresh_task(background=False))
+
+    def invalidate(self) -> None:
+        """Force a refresh on the next call, e.g. after the API rejected the token."""
+        self._expires_at = 0.0
+
+    def _refresh_task(self, background: bool) -> asyncio.Task:
+        loop = asyncio.get_running_loop()
+        task = self._refreshes.get(loop)
+        if task is None or task.done():
+            self.stats["background_refreshes" if background else "blocking_refreshes"] += 1
+            task = self._refreshes[loop] = loop.create_task(self._refresh())
+            task.add_done_callback(self._log_failure)
+        return task
+
+    @staticmethod
+    def _log_failure(task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning("Vertex access token refresh failed: %s", task.exception())
+
+    async def _refresh(self) -> str:
+        token, expires_at = await asyncio.to_thread(self._refresh_sync)
+        self._token, self._expires_at = token, expires_at
+        return token
+
+    def _refresh_sync(self) -> tuple[str, float]:
+        import google.auth
+        import google.auth.transport.requests
+
+        with self._lock:
+            if self._credentials is None:
+                self._credentials, _ = google.auth.default(scopes=_SCOPES)
+            self._credentials.refresh(google.auth.transport.requests.Request())
+            expiry = self._credentials.expiry  # naive UTC
+            expires_at = (
+                expiry.replace(tzinfo=timezone.utc).timestamp()
+                if expiry
+                else time.time() + _DEFAULT_LIFETIME_SECONDS
+            )
+            return self._credentials.token, expires_at
+
+
+@lru_cache(maxsize=1)
+def get_token_provider() -> VertexTokenProvider:
+    return VertexTokenProvider(get_settings().vertex_token_refresh_margin_seconds)
+
+
+async def get_access_token() -> str:
+    """A valid GCP access token for Vertex AI."""
+    return await get_token_provider().token()
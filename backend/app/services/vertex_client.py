@@ -0,0 +1,240 @@
+"""Gemini ``generateContent`` calls on Vertex AI with a persistent response cache.
+
+Responses are stored in ``vertex_responses`` under a hash of the model,
+the generation config and the prompt. A byte-identical request (the same
+lead re-enriched, outreach regenerated with the same parameters) is
+answered from the database without spending tokens. Identical requests
+already in flight share one call. Every ``_EVICT_EVERY`` stores the
+table is trimmed to ``vertex_cache_max_entries`` rows, least recently
+used first. ``use_cache=False`` skips the lookup and replaces the stored
+response. Only complete responses that pass the caller's ``validate``
+check (e.g. that they parse) are stored.
+"""
+
+import hashlib
+import json
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Callable
+
+import httpx
+from sqlalchemy import delete, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.config import get_settings
+from app.database import AsyncSessionFactory
+from app.models import VertexResponse
+from app.services.vertex_auth import get_access_token, get_token_provider
+from app.services.vertex_rate import get_rate_controller
+from app.utils.singleflight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+# Evict once per this many stored responses (per process), not on every write.
+_EVICT_EVERY = 100
+# Quota and overload responses; retried after the rate controller's backoff.
+_THROTTLED = (429, 503)
+
+
+@dataclass(slots=True)
+class GenerateResult:
+    text: str
+    # usageMetadata: promptTokenCount, candidatesTokenCount, totalTokenCount
+    usage: dict[str, Any] = field(default_factory=dict)
+    cached: bool = False
+    # False when generation stopped early (e.g. MAX_TOKENS); such text is not cached
+    complete: bool = True
+
+
+def model_endpoint(model: str | None = None) -> str:
+    settings = get_settings()
+    return (
+        f"https://{settings.vertex_location}-aiplatform.googleapis.com/v1"
+        f"/projects/{settings.vertex_project_id}"
+        f"/locations/{settings.vertex_location}"
+        f"/publishers/google/models/{model or settings.vertex_model}:generateContent"
+    )
+
+
+def cache_key(model: str, generation_config: dict[str, Any], prompt: str) -> str:
+    payload = json.dumps([model, generation_config, prompt], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class ResponseCache:
+    def __init__(self) -> None:
+        self.max_entries = get_settings().vertex_cache_max_entries
+        self.stats = {"hits": 0, "misses": 0, "coalesced": 0, "stored": 0, "evicted": 0}
+        self._writes = 0
+
+    async def get(self, key: str) -> GenerateResult | None:
+        async with AsyncSessionFactory() as session:
+            row = (
+                await session.execute(
+                    update(VertexResponse)
+                    .where(VertexResponse.key == key)
+                    .values(hits=VertexResponse.hits + 1, last_used_at=datetime.utcnow())
+                    .returning(VertexResponse.text, VertexResponse.usage)
+                )
+            ).first()
+            await session.commit()
+        if row is None:
+            return None
+        return GenerateResult(text=row.text, usage=row.usage or {}, cached=True)
+
+    async def put(self, key: str, model: str, result: GenerateResult) -> None:
+        now = datetime.utcnow()
+        stmt = pg_insert(VertexResponse.__table__).values(
+            key=key, model=model, text=result.text, usage=result.usage, hits=0, created_at=now, last_used_at=now
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["key"],
+            set_={"text": stmt.excluded.text, "usage": stmt.excluded.usage, "last_used_at": now},
+        )
+        async with AsyncSessionFactory() as session:
+            await session.execute(stmt)
+            self._writes += 1
+            if self._writes % _EVICT_EVERY == 0:
+                await self._evict(session)
+            await session.commit()
+        self.stats["stored"] += 1
+
+    async def _evict(self, session) -> None:
+        stale = (
+            select(VertexResponse.key)
+            .order_by(VertexResponse.last_used_at.desc())
+            .offset(self.max_entries)
+            .scalar_subquery()
+        )
+        result = await session.execute(delete(VertexResponse).where(VertexResponse.key.in_(stale)))
+        if result.rowcount:
+            self.stats["evicted"] += result.rowcount
+            logger.info("Evicted %d cached Vertex responses", result.rowcount)
+
+
+_flight = SingleFlight()
+
+
+@lru_cache(maxsize=1)
+def get_response_cache() -> ResponseCache:
+    return ResponseCache()
+
+
+def _retry_after(response: httpx.Response) -> float | None:
+    try:
+        return max(0.0, float(response.headers["Retry-After"]))
+    except (KeyError, ValueError):
+        return None
+
+
+async def _call(
+    prompt: str,
+    generation_config: dict[str, Any],
+    model: str,
+    client: httpx.AsyncClient | None,
+    timeout: float | None = None,
+) -> GenerateResult:
+    payload = {
+        "contents": [{"role": "user", "parts": [{"text": prompt}]}],
+        "generationConfig": generation_config,
+    }
+
+    request_timeout = timeout if timeout is not None else httpx.USE_CLIENT_DEFAULT
+
+    async def post(http: httpx.AsyncClient) -> httpx.Response:
+        headers = {"Authorization": f"Bearer {await get_access_token()}", "Content-Type": "application/json"}
+        response = await http.post(model_endpoint(model), headers=headers, json=payload, timeout=request_timeout)
+        if response.status_code == 401:
+            # Revoked or rotated credentials: refresh once and retry.
+            get_token_provider().invalidate()
+            headers["Authorization"] = f"Bearer {await get_access_token()}"
+            response = await http.post(model_endpoint(model), headers=headers, json=payload, timeout=request_timeout)
+        return response
+
+    async def paced(http: httpx.AsyncClient) -> httpx.Response:
+        controller = get_rate_controller()
+        retries = max(0, get_settings().vertex_max_retries)
+        attempt = 0
+        while True:
+            slot = await controller.acquire(controller.estimate_tokens(prompt))
+            try:
+                response = await post(http)
+            except BaseException:
+                await controller.release(slot)
+                raise
+            if response.status_code in _THROTTLED and attempt < retries:
+                await controller.release(slot, throttled=True, retry_after=_retry_after(response), attempt=attempt)
+                attempt += 1
+                continue
+            if response.is_success:
+                await controller.release(slot, usage=response.json().get("usageMetadata"), succeeded=True)
+            else:
+                await controller.release(slot)
+            return response
+
+    if client is None:
+        async with httpx.AsyncClient(timeout=get_settings().enrichment_timeout) as own:
+            response = await paced(own)
+    else:
+        response = await paced(client)
+    response.raise_for_status()
+    data = response.json()
+    candidate = data["candidates"][0]
+    return GenerateResult(
+        text=candidate["content"]["parts"][0]["text"].strip(),
+        usage=data.get("usageMetadata") or {},
+        complete=candidate.get("finishReason", "STOP") == "STOP",
+    )
+
+
+async def generate_content(
+    prompt: str,
+    generation_config: dict[str, Any],
+    *,
+    use_cache: bool = True,
+    model: str | None = None,
+    client: httpx.AsyncClient | None = None,
+    validate: Callable[[str], bool] | None = None,
+    timeout: float | None = None,
+) -> GenerateResult:
+    """Gemini's text for ``prompt``, from the cache when an identical request was answered before.
+
+    HTTP errors propagate (and are not cached). When ``validate`` is given,
+    only text it accepts is stored or served from the cache. ``timeout``
+    overrides ``enrichment_timeout`` for this request.
+    """
+    settings = get_settings()
+    model = model or settings.vertex_model
+    cache = get_response_cache()
+    if not settings.vertex_cache_enabled:
+        return await _call(prompt, generation_config, model, client, timeout)
+
+    key = cache_key(model, generation_config, prompt)
+    if use_cache:
+        try:
+            cached = await cache.get(key)
+        except Exception as exc:
+            logger.warning("Vertex response cache lookup failed: %s", exc)
+            cached = None
+        if cached is not None and (validate is None or validate(cached.text)):
+            cache.stats["hits"] += 1
+            return cached
+
+    async def load() -> GenerateResult:
+        result = await _call(prompt, generation_config, model, client, timeout)
+        if result.complete and (validate is None or validate(result.text)):
+            try:
+                await cache.put(key, model, result)
+            except Exception as exc:
+                logger.warning("Storing Vertex response failed: %s", exc)
+        return result
+
+    if not use_cache:
+        return await load()
+    if _flight.in_flight(key):
+        cache.stats["coalesced"] += 1
+    else:
+        cache.stats["misses"] += 1
+    return await _flight.do(key, load)
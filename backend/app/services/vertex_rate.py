@@ -0,0 +1,153 @@
+"""Adaptive pacing of Gemini requests against the Vertex AI quota.
+
+Every request takes a slot from the event loop's ``VertexRateController``.
+A slot is granted when all of these hold:
+
+- fewer than ``limit`` requests are in flight;
+- the last 60 seconds hold fewer than ``vertex_rpm`` requests;
+- the window's tokens plus this request's estimate fit ``vertex_quota_tpm``.
+
+A request's estimate is replaced by the token count from its response's
+usageMetadata. The concurrency limit follows AIMD. It grows by one for
+every ``limit`` successful requests, up to ``vertex_max_concurrency``. On
+a 429 or 503 it halves. Requests started before the last cut do not cut
+it again. Every request then pauses for the response's Retry-After, or an
+exponential backoff when there is none.
+"""
+
+import asyncio
+import logging
+import random
+import time
+import weakref
+from collections import deque
+from dataclasses import dataclass
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+_WINDOW_SECONDS = 60.0
+_MAX_BACKOFF_SECONDS = 60.0
+# Starting guess for output tokens per request, refined from responses.
+_INITIAL_OUTPUT_TOKENS = 600.0
+
+
+@dataclass(slots=True)
+class Slot:
+    started: float
+    tokens: float
+
+
+class VertexRateController:
+    def __init__(self) -> None:
+        settings = get_settings()
+        self.rpm = max(1, settings.vertex_rpm)
+        self.tpm = max(1, settings.vertex_quota_tpm)
+        self.max_concurrency = max(1, settings.vertex_max_concurrency)
+        self.limit = float(min(self.max_concurrency, max(1, settings.vertex_initial_concurrency)))
+        self.in_flight = 0
+        self._window: deque[Slot] = deque()
+        self._paused_until = 0.0
+        self._last_decrease = 0.0
+        self._output_tokens = _INITIAL_OUTPUT_TOKENS
+        self._changed = asyncio.Condition()
+        self.stats = {"requests": 0, "throttled": 0, "tokens": 0, "waited_seconds": 0.0}
+
+    def estimate_tokens(self, prompt: str) -> float:
+        # About four characters per token, plus the typical answer length seen so far.
+        return len(prompt) / 4 + self._output_tokens
+
+    def _trim(self, now: float) -> None:
+        while self._window and self._window[0].started <= now - _WINDOW_SECONDS:
+            self._window.popleft()
+
+    def _wait_time(self, now: float, tokens: float) -> float | None:
+        """Seconds until a slot could open; 0 when one is free now, None when a request must finish first."""
+        if self._paused_until > now:
+            return self._paused_until - now
+        if self.in_flight >= int(self.limit):
+            return None
+        if len(self._window) >= self.rpm:
+            return self._window[0].started + _WINDOW_SECONDS - now
+        used = sum(s.tokens for s in self._window)
+        if self._window and used + tokens > self.tpm:
+            # Wait until enough of the window expires (a request larger than the quota waits for an empty window).
+            for slot in self._window:
+                used -= slot.tokens
+                if used + tokens <= self.tpm:
+                    return slot.started + _WINDOW_SECONDS - now
+            return self._window[-1].started + _WINDOW_SECONDS - now
+        return 0.0
+
+    async def acquire(self, tokens: float) -> Slot:
+        start = time.monotonic()
+        async with self._changed:
+            while True:
+                now = time.monotonic()
+                self._trim(now)
+                wait = self._wait_time(now, tokens)
+                if wait == 0:
+                    break
+                try:
+                    await asyncio.wait_for(self._changed.wait(), timeout=wait)
+                except TimeoutError:
+                    pass
+            self.in_flight += 1
+            slot = Slot(now, tokens)
+            self._window.append(slot)
+        self.stats["requests"] += 1
+        self.stats["waited_seconds"] += time.monotonic() - start
+        return slot
+
+    async def release(
+        self,
+        slot: Slot,
+        usage: dict | None = None,
+        succeeded: bool = False,
+        throttled: bool = False,
+        retry_after: float | None = None,
+        attempt: int = 0,
+    ) -> None:
+        """Return a slot; ``usage`` is the response's usageMetadata, ``throttled`` marks a 429/503.
+
+        Only ``succeeded`` requests raise the concurrency limit; other failures leave it as is.
+        """
+        async with self._changed:
+            self.in_flight -= 1
+            if usage and usage.get("totalTokenCount"):
+                slot.tokens = float(usage["totalTokenCount"])
+                self.stats["tokens"] += int(slot.tokens)
+                output = usage.get("candidatesTokenCount")
+                if output:
+                    self._output_tokens = 0.9 * self._output_tokens + 0.1 * float(output)
+            now = time.monotonic()
+            if throttled:
+                # A rejected request spent no tokens.
+                slot.tokens = 0.0
+                self.stats["throttled"] += 1
+                delay = retry_after if retry_after is not None else min(_MAX_BACKOFF_SECONDS, 2.0**attempt)
+                delay += random.uniform(0, delay / 4)
+                # Requests already in flight when the limit was cut do not cut it again.
+                if slot.started >= self._last_decrease:
+                    self.limit = max(1.0, self.limit / 2)
+                    self._last_decrease = now
+                    logger.info("Vertex AI throttled; concurrency %d, pausing %.1fs", int(self.limit), delay)
+                self._paused_until = max(self._paused_until, now + delay)
+            elif succeeded:
+                self.limit = min(float(self.max_concurrency), self.limit + 1 / self.limit)
+            self._changed.notify_all()
+
+
+_controllers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, VertexRateController]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_rate_controller() -> VertexRateController:
+    """Controller for the running event loop (its condition variable is loop-bound)."""
+    loop = asyncio.get_running_loop()
+    controller = _controllers.get(loop)
+    if controller is None:
+        controller = _controllers[loop] = VertexRateController()
+    return controller
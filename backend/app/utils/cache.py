@@ -0,0 +1,82 @@
+"""JSON value cache in Redis with an in-process fallback.
+
+Values are shared across API and worker processes through Redis. When Redis
+is unreachable the cache keeps working per process, from a bounded
+in-memory table, and Redis is retried after ``_RETRY_SECONDS``.
+"""
+
+import json
+import logging
+import time
+from typing import Any
+
+from app.utils.redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+_RETRY_SECONDS = 30.0
+
+
+class JsonCache:
+    def __init__(self, namespace: str, max_local_entries: int = 10000) -> None:
+        self.namespace = namespace
+        self.max_local_entries = max_local_entries
+        self._local: dict[str, tuple[float, str]] = {}
+        self._redis_down_until = 0.0
+
+    def _key(self, key: str) -> str:
+        return f"leadgen:{self.namespace}:{key}"
+
+    def _redis_ok(self) -> bool:
+        return time.monotonic() >= self._redis_down_until
+
+    def _redis_failed(self, exc: Exception) -> None:
+        if self._redis_ok():
+            logger.warning("Redis unavailable for %s cache, using process memory: %s", self.namespace, exc)
+        self._redis_down_until = time.monotonic() + _RETRY_SECONDS
+
+    async def get(self, key: str, default: Any = None) -> Any:
+        raw = None
+        if self._redis_ok():
+            try:
+                raw = await get_redis().get(self._key(key))
+            except Exception as exc:
+                self._redis_failed(exc)
+        if raw is None:
+            entry = self._local.get(key)
+            if entry is None:
+                return default
+            expires, raw = entry
+            if expires <= time.monotonic():
+                self._local.pop(key, None)
+                return default
+        return json.loads(raw)
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        raw = json.dumps(value, default=str)
+        if self._redis_ok():
+            try:
+                await get_redis().set(self._key(key), raw, ex=max(1, int(ttl)))
+                return
+            except Exception as exc:
+                self._redis_failed(exc)
+        if len(self._local) >= self.max_local_entries:
+            self._evict()
+        self._local[key] = (time.monotonic() + ttl, raw)
+
+    async def delete(self, key: str) -> None:
+        self._local.pop(key, None)
+        if self._redis_ok():
+            try:
+                await get_redis().delete(self._key(key))
+            except Exception as exc:
+                self._redis_failed(exc)
+
+    def _evict(self) -> None:
+        now = time.monotonic()
+        for key in [k for k, (expires, _) in self._local.items() if expires <= now]:
+            del self._local[key]
+        # Still full: drop the oldest tenth (dicts keep insertion order).
+        if len(self._local) >= self.max_local_entries:
+            for key in list(self._local)[: max(1, self.max_local_entries // 10)]:
+                del self._local[key]
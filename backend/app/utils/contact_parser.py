@@ -1,6 +1,24 @@
-"""Extract contact info (email, phone) from text snippets."""
+"""Extract contact info (email, phone) from text snippets and HTML.
 
+All patterns are compiled once at import and each document is scanned in a
+single pass by one combined regex that recognises:
+
+- plain emails and obfuscated ones ("info [at] acme [dot] co [dot] in",
+  "sales(at)acme.com", "hr at acme dot com"), plus HTML-entity encoded
+  ``@``/``.`` (``&#64;``)
+- phone numbers in international (+44 20 7946 0958), North American
+  ((415) 555-2671) and Indian formats (+91 98xxx xxxxx, 098xxxxxxxx,
+  080-2345 6789, 1800-123-4567)
+
+``extract_contacts_many`` runs the extractor over large corpora, optionally
+in a process pool.
+"""
+
+import html
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable
 
 # Common false-positive domains to exclude
 SKIP_EMAIL_DOMAINS = {
@@ -8,49 +26,139 @@ SKIP_EMAIL_DOMAINS = {
     "sentry.io", "wixpress.com", "google.com", "facebook.com",
     "twitter.com", "linkedin.com", "youtube.com", "instagram.com",
 }
+_SKIP_EMAIL_MARKERS = ("@example", "noreply", "no-reply", "email@")
+# "logo@2x.png" and friends are asset names, not addresses.
+_ASSET_TLDS = {"png", "jpg", "jpeg", "gif", "svg", "webp", "ico", "css", "js", "map", "bmp", "tif", "tiff"}
 
+_OPEN = r"[\[\(\{<]"
+_CLOSE = r"[\]\)\}>]"
+_AT = rf"(?:@|\s*{_OPEN}\s*(?:at|@)\s*{_CLOSE}\s*|\s+at\s+)"
+_DOT = rf"(?:\.|\s*{_OPEN}\s*(?:dot|\.)\s*{_CLOSE}\s*|\s+dot\s+)"
+_LABEL = r"[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?"
+# The local part only starts at a token boundary and is matched possessively, so a
+# failed match costs one attempt per word instead of one per character.
+_EMAIL = (
+    rf"(?i:(?<![a-z0-9._%+-])(?P<local>[a-z0-9][a-z0-9._%+-]{{0,63}}+)(?P<at>{_AT})"
+    rf"(?P<domain>{_LABEL}(?:{_DOT}{_LABEL})*{_DOT}[a-z]{{2,24}})\b)"
+)
+# Optional +country code and (area) code, then digit groups split by single separators.
+# The pattern opens with a plain character class (the preceding-character check is a
+# lookbehind placed after it) so the regex engine can skip ahead to candidate characters.
+_PHONE = (
+    r"(?P<phone>[+(\d](?<![\w+/=.-].)"
+    r"(?:(?<=\+)\d{1,3}[\s.-]?(?:\(\d{1,5}\)[\s.-]?)?\d|(?<=\()\d{1,5}\)[\s.-]?\d|(?<=\d))"
+    r"(?:[\s.-]?\d){6,14})(?![\w.-]?\d)"
+)
 
-def extract_emails(text: str) -> list[str]:
-    """Extract valid-looking business emails from text. Skips generic/example domains."""
+CONTACT_RE = re.compile(rf"{_EMAIL}|{_PHONE}")
+PHONE_RE = re.compile(_PHONE)
+_DOT_RE = re.compile(_DOT, re.IGNORECASE)
+_OBFUSCATED_DOT_RE = re.compile(rf"{_OPEN}\s*(?:dot|\.)\s*{_CLOSE}|\s+dot\s+", re.IGNORECASE)
+_NON_DIGIT = re.compile(r"\D")
+_ENTITY_RE = re.compile(r"&(?:#\d+|#x[0-9a-f]+|[a-z]+);", re.IGNORECASE)
+# Substrings at least one of which every (obfuscated) email contains.
+_EMAIL_HINTS = ("at)", "at]", "at}", "at>", "at )", "at ]", "at }", "at >", " dot ")
+
+
+def _may_contain_email(text: str) -> bool:
+    if "@" in text:
+        return True
+    lowered = text.lower()
+    return any(hint in lowered for hint in _EMAIL_HINTS)
+
+
+def _email(match: re.Match) -> str | None:
+    at = match.group("at")
+    domain = match.group("domain")
+    # "we are at acme.com" is prose: a spelled-out "at" needs an obfuscated dot too.
+    if at.strip().lower() == "at" and not _OBFUSCATED_DOT_RE.search(domain):
+        return None
+    domain = _DOT_RE.sub(".", domain).lower()
+    email = f"{match.group('local')}@{domain}"
+    lowered = email.lower()
+    if domain in SKIP_EMAIL_DOMAINS or domain.rsplit(".", 1)[-1] in _ASSET_TLDS:
+        return None
+    if any(marker in lowered for marker in _SKIP_EMAIL_MARKERS):
+        return None
+    return email
+
+
+def _phone_key(raw: str) -> str | None:
+    """Dedupe key (national significant digits) for a plausible phone number, else None."""
+    digits = _NON_DIGIT.sub("", raw)
+    n = len(digits)
+    if raw.lstrip().startswith("+"):
+        return digits[-10:] if 8 <= n <= 15 else None
+    if n == 10:
+        # Bare ten digits: Indian mobile/landline without trunk 0 or a North American number.
+        return digits if digits[0] not in "01" else None
+    if n == 11 and digits[0] in "01":
+        # 0-prefixed Indian number, 1-prefixed NANP number, or 1800/1860 toll-free.
+        return digits[1:] if not digits.startswith(("1800", "1860")) else digits
+    if n == 12 and digits.startswith("91"):
+        return digits[2:]
+    if n == 13 and digits.startswith("091"):
+        return digits[3:]
+    return None
+
+
+def extract_contacts(text: str) -> dict[str, list[str]]:
+    """Emails and phones in ``text`` (single pass, order preserved, deduped)."""
     if not text or not isinstance(text, str):
-        return []
-    pattern = r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}"
-    found = re.findall(pattern, text)
-    out = []
-    for e in found:
-        domain = e.split("@")[-1].lower()
-        if domain in SKIP_EMAIL_DOMAINS:
-            continue
-        # Skip obvious placeholders
-        if any(x in e.lower() for x in ["@example", "noreply", "no-reply", "email@"]):
+        return {"emails": [], "phones": []}
+    if "&" in text and _ENTITY_RE.search(text):
+        text = html.unescape(text)
+
+    emails: dict[str, str] = {}
+    phones: dict[str, str] = {}
+    # Documents with no trace of an email are scanned by the phone pattern alone.
+    pattern = CONTACT_RE if _may_contain_email(text) else PHONE_RE
+    for match in pattern.finditer(text):
+        raw_phone = match["phone"]
+        if raw_phone is not None:
+            key = _phone_key(raw_phone)
+            if key and key not in phones:
+                phones[key] = raw_phone.strip()
             continue
-        out.append(e)
-    return list(dict.fromkeys(out))  # preserve order, dedupe
+        email = _email(match)
+        if email:
+            emails.setdefault(email.lower(), email)
+    return {"emails": list(emails.values()), "phones": list(phones.values())}
+
+
+def extract_emails(text: str) -> list[str]:
+    """Extract valid-looking business emails from text. Skips generic/example domains."""
+    return extract_contacts(text)["emails"]
 
 
 def extract_phones(text: str) -> list[str]:
-    """Extract phone numbers from text (US-style and international)."""
-    if not text or not isinstance(text, str):
-        return []
-    # US: (xxx) xxx-xxxx, xxx-xxx-xxxx, xxx.xxx.xxxx, 10+ digits
-    us_pattern = r"(?:\+1[-.\s]?)?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}"
-    # International: +country code...
-    intl_pattern = r"\+\d{1,3}[-.\s]?\d{1,4}[-.\s]?\d{1,4}[-.\s]?\d{1,9}"
-    matches = re.findall(us_pattern, text) + re.findall(intl_pattern, text)
-    # Clean and dedupe
-    cleaned = []
-    for m in matches:
-        digits = re.sub(r"\D", "", m)
-        if len(digits) >= 10 and digits not in [re.sub(r"\D", "", x) for x in cleaned]:
-            cleaned.append(m)
-    return cleaned
+    """Extract phone numbers from text (international, North American and Indian formats)."""
+    return extract_contacts(text)["phones"]
 
 
 def extract_contact_info(text: str) -> dict:
     """Extract email and phone from text. Returns first of each if multiple."""
-    emails = extract_emails(text or "")
-    phones = extract_phones(text or "")
+    found = extract_contacts(text or "")
     return {
-        "email": emails[0] if emails else None,
-        "phone": phones[0] if phones else None,
+        "email": found["emails"][0] if found["emails"] else None,
+        "phone": found["phones"][0] if found["phones"] else None,
     }
+
+
+def extract_contacts_many(
+    texts: Iterable[str],
+    processes: int | None = None,
+    chunksize: int = 64,
+) -> list[dict[str, list[str]]]:
+    """``extract_contacts`` over a corpus, aligned with ``texts``.
+
+    ``processes`` > 1 fans the work out to a process pool (``None`` uses one
+    process per CPU); ``processes=1`` runs inline, which is faster for small
+    batches.
+    """
+    texts = list(texts)
+    workers = processes or os.cpu_count() or 1
+    if workers <= 1 or len(texts) < chunksize * 2:
+        return [extract_contacts(t) for t in texts]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(extract_contacts, texts, chunksize=chunksize))
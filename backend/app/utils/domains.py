@@ -0,0 +1,109 @@
+"""Domain canonicalization shared by dedupe, company resolution and the email finder.
+
+``registrable_domain`` reduces a URL, host or email address to the domain a
+business actually registered (``https://blog.acme.co.in/x`` -> ``acme.co.in``),
+so subdomains and ``www.`` variants share dedupe keys, company rows and
+provider cache entries. Hosted-site platforms from the list's private section
+count as suffixes, so ``acme.business.site`` and ``shop.myshopify.com`` stay
+separate businesses instead of collapsing into the platform's domain.
+
+The public suffix list comes from ``tldextract``'s bundled snapshot when the
+package is installed (never fetched at runtime); otherwise a built-in table of
+common multi-label suffixes is used.
+"""
+
+import ipaddress
+import re
+from functools import lru_cache
+
+try:
+    import tldextract
+except ImportError:  # pragma: no cover - optional dependency
+    tldextract = None
+
+_SCHEME = re.compile(r"^[a-z][a-z0-9+.-]*://")
+
+# Suffixes with more than one label, used without tldextract.
+_MULTI_LABEL_SUFFIXES = frozenset(
+    {
+        # India
+        "co.in", "net.in", "org.in", "firm.in", "gen.in", "ind.in", "ac.in", "edu.in", "gov.in", "res.in",
+        "nic.in", "mil.in",
+        # UK / Ireland
+        "co.uk", "org.uk", "me.uk", "ltd.uk", "plc.uk", "net.uk", "ac.uk", "gov.uk", "nhs.uk",
+        # Oceania
+        "com.au", "net.au", "org.au", "edu.au", "gov.au", "asn.au", "id.au",
+        "co.nz", "org.nz", "net.nz", "ac.nz", "govt.nz",
+        # Asia
+        "com.sg", "edu.sg", "gov.sg", "org.sg", "net.sg",
+        "com.my", "net.my", "org.my", "edu.my", "gov.my",
+        "co.jp", "ne.jp", "or.jp", "ac.jp", "go.jp",
+        "co.kr", "or.kr", "ac.kr", "go.kr",
+        "com.cn", "net.cn", "org.cn", "gov.cn", "edu.cn",
+        "com.hk", "org.hk", "edu.hk", "gov.hk",
+        "com.tw", "org.tw", "edu.tw",
+        "co.id", "or.id", "ac.id", "go.id", "web.id",
+        "co.th", "in.th", "ac.th", "go.th",
+        "com.ph", "com.vn", "com.pk", "com.bd", "com.np", "com.lk", "edu.lk",
+        # Middle East / Africa
+        "co.ae", "com.sa", "com.qa", "com.kw", "com.om", "com.bh", "co.il", "org.il", "com.tr",
+        "co.za", "org.za", "com.ng", "co.ke", "or.ke", "com.eg", "co.tz", "co.ug",
+        # Americas
+        "com.br", "net.br", "org.br", "com.mx", "org.mx", "com.ar", "com.co", "com.pe", "com.ve", "com.ec",
+        "co.cr", "com.uy",
+        # Europe
+        "co.at", "or.at", "com.pl", "com.gr", "com.cy", "com.ua", "co.hu",
+        # Hosted-site platforms (private section): every subdomain is a different site
+        "business.site", "wixsite.com", "blogspot.com", "weebly.com", "webflow.io", "myshopify.com",
+        "github.io", "gitlab.io", "netlify.app", "vercel.app", "pages.dev", "web.app", "firebaseapp.com",
+        "herokuapp.com", "appspot.com", "azurewebsites.net",
+    }
+)
+
+
+@lru_cache(maxsize=1)
+def _extractor():
+    # Empty suffix_list_urls keeps tldextract on its bundled list: no network, no disk cache.
+    return tldextract.TLDExtract(suffix_list_urls=(), cache_dir=None, include_psl_private_domains=True)
+
+
+def hostname(value: str | None) -> str | None:
+    """Lowercase host of a URL, bare host or email address (no port, userinfo or trailing dot)."""
+    text = (value or "").strip().lower()
+    if not text:
+        return None
+    if "@" in text and "/" not in text:
+        text = text.rsplit("@", 1)[1]
+    text = _SCHEME.sub("", text)
+    text = re.split(r"[/?#]", text, maxsplit=1)[0]
+    text = text.rsplit("@", 1)[-1]
+    if text.startswith("["):
+        return None
+    text = text.split(":", 1)[0].strip(".")
+    return text or None
+
+
+@lru_cache(maxsize=65536)
+def registrable_domain(value: str | None) -> str | None:
+    """Registrable domain (public suffix + one label) of a URL, host or email; None if there is none."""
+    host = hostname(value)
+    if not host or "." not in host:
+        return None
+    try:
+        ipaddress.ip_address(host)
+        return None
+    except ValueError:
+        pass
+
+    if tldextract is not None:
+        parts = _extractor()(host)
+        if parts.domain and parts.suffix:
+            return f"{parts.domain}.{parts.suffix}"
+        return None
+
+    labels = host.split(".")
+    if len(labels) >= 3 and ".".join(labels[-2:]) in _MULTI_LABEL_SUFFIXES:
+        return ".".join(labels[-3:])
+    if ".".join(labels[-2:]) in _MULTI_LABEL_SUFFIXES:
+        return None
+    return ".".join(labels[-2:])
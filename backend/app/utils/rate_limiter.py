@@ -8,8 +8,9 @@ class RateLimiter:
         self._last = 0.0
 
     async def wait(self) -> None:
+        # Reserve the next slot before sleeping so concurrent callers queue up instead of bursting.
         now = time.time()
-        elapsed = now - self._last
-        if elapsed < self.interval:
-            await asyncio.sleep(self.interval - elapsed)
-        self._last = time.time()
+        slot = max(now, self._last + self.interval)
+        self._last = slot
+        if slot > now:
+            await asyncio.sleep(slot - now)
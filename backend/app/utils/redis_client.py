@@ -0,0 +1,27 @@
+"""Shared asyncio Redis client (``settings.redis_url``)."""
+
+import asyncio
+import weakref
+
+from redis.asyncio import Redis
+
+from app.config import get_settings
+
+# Connections are bound to the event loop that opened them, and Celery tasks run
+# each job in a fresh loop (asyncio.run), so there is one client per loop.
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Redis]" = weakref.WeakKeyDictionary()
+
+
+def get_redis() -> Redis:
+    """Redis client for the running event loop (string responses)."""
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None:
+        client = Redis.from_url(
+            get_settings().redis_url,
+            decode_responses=True,
+            socket_connect_timeout=1,
+            socket_timeout=2,
+        )
+        _clients[loop] = client
+    return client
@@ -0,0 +1,75 @@
+"""Throughput benchmark for app.utils.contact_parser.
+
+Builds a synthetic corpus of search snippets and HTML pages with emails
+(plain and obfuscated) and phone numbers in mixed formats, then times
+``extract_contacts`` inline and ``extract_contacts_many`` in a process pool.
+
+    cd backend && python -m scripts.bench_contact_parser --snippets 20000 --pages 300
+"""
+
+import argparse
+import os
+import random
+import time
+
+from app.utils.contact_parser import extract_contacts, extract_contacts_many
+
+_WORDS = (
+    "best dental clinic in town open monday to saturday call now for appointment "
+    "we offer cosmetic dentistry implants braces and root canal treatment trusted by families"
+).split()
+_PHONES = ("+91 98450 {:05d}", "080-2345 {:04d}", "(415) 555-{:04d}", "+44 20 7946 {:04d}", "098450{:05d}")
+_EMAILS = ("info@clinic{}.co.in", "sales [at] shop{} [dot] com", "hello(at)studio{}.in", "contact&#64;firm{}.com")
+
+
+def _snippet(rng: random.Random, i: int) -> str:
+    words = rng.choices(_WORDS, k=30)
+    if i % 2 == 0:
+        words.insert(rng.randrange(len(words)), rng.choice(_PHONES).format(i % 10000))
+    if i % 3 == 0:
+        words.insert(rng.randrange(len(words)), rng.choice(_EMAILS).format(i))
+    return " ".join(words)
+
+
+def _page(rng: random.Random, i: int) -> str:
+    blocks = []
+    for j in range(400):
+        blocks.append(f'<div class="row-{j}"><p>{_snippet(rng, i * 400 + j)}</p><a href="/p/{j}">more</a></div>')
+    return "<html><body>" + "\n".join(blocks) + "</body></html>"
+
+
+def _run(label: str, docs: list[str], processes: int) -> None:
+    size_mb = sum(len(d) for d in docs) / 1e6
+    start = time.perf_counter()
+    if processes == 1:
+        results = [extract_contacts(d) for d in docs]
+    else:
+        results = extract_contacts_many(docs, processes=processes)
+    elapsed = time.perf_counter() - start
+    found = sum(len(r["emails"]) + len(r["phones"]) for r in results)
+    print(
+        f"{label:<28} {len(docs):>7} docs {size_mb:8.1f} MB {elapsed:7.2f}s "
+        f"{len(docs) / elapsed:10.0f} docs/s {size_mb / elapsed:6.1f} MB/s  {found} contacts"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--snippets", type=int, default=20000)
+    parser.add_argument("--pages", type=int, default=300)
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    snippets = [_snippet(rng, i) for i in range(args.snippets)]
+    pages = [_page(rng, i) for i in range(args.pages)]
+
+    _run("snippets, inline", snippets, 1)
+    _run("html pages, inline", pages, 1)
+    if args.processes > 1:
+        _run(f"snippets, {args.processes} processes", snippets, args.processes)
+        _run(f"html pages, {args.processes} processes", pages, args.processes)
+
+
+if __name__ == "__main__":
+    main()
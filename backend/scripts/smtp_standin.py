@@ -0,0 +1,91 @@
+"""Local SMTP stand-in for exercising the RCPT prober without real mail servers.
+
+Accepts RCPT for the listed mailboxes and for any address at the listed
+catch-all domains, rejects everything else with 550, and never accepts
+DATA. Point the prober at it with
+
+    SMTP_PROBE_ENABLED=true SMTP_PROBE_HOST=127.0.0.1 SMTP_PROBE_PORT=2525
+
+    cd backend && python -m scripts.smtp_standin --port 2525 \\
+        --mailboxes jane.doe@acme.com,info@acme.com --catch-all shop.in
+"""
+
+import argparse
+import asyncio
+
+
+class StandIn:
+    def __init__(self, mailboxes: set[str], catch_all: set[str], greylist: set[str]) -> None:
+        self.mailboxes = mailboxes
+        self.catch_all = catch_all
+        self.greylist = greylist
+        self.sessions = 0
+        self.rcpt = 0
+
+    def rcpt_reply(self, address: str) -> bytes:
+        domain = address.rsplit("@", 1)[-1]
+        if domain in self.greylist:
+            return b"450 4.2.0 Greylisted, try again later\r\n"
+        if address in self.mailboxes or domain in self.catch_all:
+            return b"250 2.1.5 OK\r\n"
+        return b"550 5.1.1 No such user\r\n"
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.sessions += 1
+        writer.write(b"220 standin ESMTP\r\n")
+        in_mail = False
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            command = line.decode("utf-8", "replace").strip()
+            verb = command[:4].upper()
+            if verb == "EHLO":
+                writer.write(b"250-standin\r\n250-PIPELINING\r\n250 8BITMIME\r\n")
+            elif verb == "HELO":
+                writer.write(b"250 standin\r\n")
+            elif verb == "MAIL":
+                in_mail = True
+                writer.write(b"250 2.1.0 OK\r\n")
+            elif verb == "RCPT":
+                if not in_mail:
+                    writer.write(b"503 5.5.1 MAIL first\r\n")
+                else:
+                    self.rcpt += 1
+                    address = command.split(":", 1)[-1].strip().strip("<>").lower()
+                    writer.write(self.rcpt_reply(address))
+            elif verb == "RSET":
+                in_mail = False
+                writer.write(b"250 2.0.0 OK\r\n")
+            elif verb == "QUIT":
+                writer.write(b"221 2.0.0 Bye\r\n")
+                await writer.drain()
+                break
+            else:
+                writer.write(b"502 5.5.2 Not implemented\r\n")
+            await writer.drain()
+        writer.close()
+
+
+def _split(value: str) -> set[str]:
+    return {v.strip().lower() for v in value.split(",") if v.strip()}
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=2525)
+    parser.add_argument("--mailboxes", default="", help="comma-separated deliverable addresses")
+    parser.add_argument("--catch-all", default="", help="comma-separated catch-all domains")
+    parser.add_argument("--greylist", default="", help="comma-separated domains answered with 450")
+    args = parser.parse_args()
+
+    standin = StandIn(_split(args.mailboxes), _split(args.catch_all), _split(args.greylist))
+    server = await asyncio.start_server(standin.handle, args.host, args.port)
+    print(f"SMTP stand-in listening on {args.host}:{args.port}")
+    async with server:
+        await server.serve_forever()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
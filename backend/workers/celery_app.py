@@ -8,6 +8,7 @@ celery_app = Celery(
     "leadgen",
     broker=settings.celery_broker_url,
     backend=settings.celery_result_backend,
+    include=["workers.tasks"],
 )
 
 celery_app.conf.update(
@@ -16,4 +17,18 @@ celery_app.conf.update(
     accept_content=["json"],
     timezone="UTC",
     enable_utc=True,
+    beat_schedule={
+        "dispatch-job-schedules": {
+            "task": "leadgen.dispatch_schedules",
+            "schedule": 60.0,
+        },
+        "sweep-near-duplicates": {
+            "task": "leadgen.sweep_near_duplicates",
+            "schedule": 3600.0,
+        },
+        "learn-email-patterns": {
+            "task": "leadgen.learn_email_patterns",
+            "schedule": 86400.0,
+        },
+    },
 )
@@ -1,10 +1,53 @@
 import asyncio
+from collections.abc import Coroutine
+from typing import Any, TypeVar
 from uuid import UUID
 
 from workers.celery_app import celery_app
+from app.database import engine
+from app.email_finder.pattern_store import PatternStore
+from app.intelligence.near_duplicates import NearDuplicateDetector
 from app.services.generator import run_generation_job
+from app.services.scheduler import dispatch_due_schedules
+
+T = TypeVar("T")
+
+
+def _run(coro: Coroutine[Any, Any, T]) -> T:
+    """Run ``coro`` in a fresh event loop.
+
+    Pooled asyncpg connections belong to the loop that opened them, so the
+    pool is emptied before this task's loop closes.
+    """
+
+    async def main() -> T:
+        try:
+            return await coro
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(main())
 
 
 @celery_app.task(name="leadgen.run_generation_job")
-def run_generation_job_task(job_id: str) -> None:
-    asyncio.run(run_generation_job(UUID(job_id)))
+def run_generation_job_task(job_id: str, refresh: bool = False) -> None:
+    _run(run_generation_job(UUID(job_id), refresh=refresh))
+
+
+@celery_app.task(name="leadgen.dispatch_schedules")
+def dispatch_schedules_task() -> int:
+    queued = _run(dispatch_due_schedules())
+    for job_id, refresh in queued:
+        run_generation_job_task.delay(str(job_id), refresh=refresh)
+    return len(queued)
+
+
+@celery_app.task(name="leadgen.sweep_near_duplicates")
+def sweep_near_duplicates_task(full: bool = False) -> dict:
+    stats = _run(NearDuplicateDetector().sweep(full=full))
+    return vars(stats)
+
+
+@celery_app.task(name="leadgen.learn_email_patterns")
+def learn_email_patterns_task() -> int:
+    return _run(PatternStore().learn_from_contacts())